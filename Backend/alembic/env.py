@@ -4,12 +4,19 @@ from alembic import context
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from config.database import Base
+from config.database import Base, SQLALCHEMY_DATABASE_URL
 from models.employee_data import *
 from models.user import *
+from models.user_activity import *
+from models.chat_session import *
+from models.chat_message import *
+from models.email_outbox import *
+from models.data_version import *
 
 config = context.config
 fileConfig(config.config_file_name)
+# Use the same DATABASE_URL as the app instead of the one in alembic.ini
+config.set_main_option("sqlalchemy.url", SQLALCHEMY_DATABASE_URL)
 target_metadata = Base.metadata
 
 def run_migrations_offline():
@@ -0,0 +1,60 @@
+"""
+Add an FTS5 full-text index of chat messages
+
+Revision ID: 20261019_add_chat_messages_fts
+Revises: 20261019_add_chat_session_summary
+Create Date: 2026-10-19
+
+chat_messages_fts indexes chat_messages.message without storing the text a
+second time (external content table); triggers keep it in sync. Existing
+messages are indexed by the 'rebuild' command. SQLite only: other databases
+are left unchanged and /api/chat/search answers 501 there.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '20261019_add_chat_messages_fts'
+down_revision = '20261019_add_chat_session_summary'
+branch_labels = None
+depends_on = None
+
+TRIGGERS = ['chat_messages_fts_insert', 'chat_messages_fts_delete', 'chat_messages_fts_update']
+
+# Same statements as controllers/chat_search.py FTS_DDL
+FTS_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS chat_messages_fts USING fts5(
+        message, content='chat_messages', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS chat_messages_fts_insert AFTER INSERT ON chat_messages BEGIN
+        INSERT INTO chat_messages_fts(rowid, message) VALUES (new.id, new.message);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS chat_messages_fts_delete AFTER DELETE ON chat_messages BEGIN
+        INSERT INTO chat_messages_fts(chat_messages_fts, rowid, message) VALUES ('delete', old.id, old.message);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS chat_messages_fts_update AFTER UPDATE OF message ON chat_messages BEGIN
+        INSERT INTO chat_messages_fts(chat_messages_fts, rowid, message) VALUES ('delete', old.id, old.message);
+        INSERT INTO chat_messages_fts(rowid, message) VALUES (new.id, new.message);
+    END""",
+]
+
+def upgrade():
+    conn = op.get_bind()
+    if conn.dialect.name != 'sqlite':
+        return
+    tables = sa.inspect(conn).get_table_names()
+    # chat_messages is created by db_init.py, which also installs the index
+    if 'chat_messages' not in tables or 'chat_messages_fts' in tables:
+        return
+    for statement in FTS_DDL:
+        conn.execute(sa.text(statement))
+    conn.execute(sa.text("INSERT INTO chat_messages_fts(chat_messages_fts) VALUES ('rebuild')"))
+
+def downgrade():
+    conn = op.get_bind()
+    if conn.dialect.name != 'sqlite':
+        return
+    for trigger in TRIGGERS:
+        conn.execute(sa.text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    conn.execute(sa.text("DROP TABLE IF EXISTS chat_messages_fts"))
@@ -0,0 +1,50 @@
+"""
+Add last message summary columns to chat_sessions
+
+Revision ID: 20261019_add_chat_session_summary
+Revises: 20261019_add_data_versions
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '20261019_add_chat_session_summary'
+down_revision = '20261019_add_data_versions'
+branch_labels = None
+depends_on = None
+
+PREVIEW_LENGTH = 120  # models/chat_session.py
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    # chat_sessions is created by db_init.py and may not exist yet (create_all adds the columns)
+    if 'chat_sessions' not in inspector.get_table_names():
+        return
+    columns = {c['name'] for c in inspector.get_columns('chat_sessions')}
+    if 'message_count' in columns:
+        return
+    with op.batch_alter_table('chat_sessions') as batch_op:
+        batch_op.add_column(sa.Column('last_message_at', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('last_message_preview', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('message_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill from the messages, one statement using the (session_id, timestamp, id) index
+    conn.execute(sa.text(f"""
+        UPDATE chat_sessions SET
+            message_count = (SELECT count(*) FROM chat_messages m WHERE m.session_id = chat_sessions.id),
+            last_message_at = (SELECT max(m.timestamp) FROM chat_messages m WHERE m.session_id = chat_sessions.id),
+            last_message_preview = (
+                SELECT substr(m.message, 1, {PREVIEW_LENGTH}) FROM chat_messages m
+                WHERE m.session_id = chat_sessions.id
+                ORDER BY m.timestamp DESC, m.id DESC LIMIT 1
+            )
+        WHERE EXISTS (SELECT 1 FROM chat_messages m WHERE m.session_id = chat_sessions.id)
+    """))
+
+def downgrade():
+    with op.batch_alter_table('chat_sessions') as batch_op:
+        batch_op.drop_column('message_count')
+        batch_op.drop_column('last_message_preview')
+        batch_op.drop_column('last_message_at')
@@ -0,0 +1,29 @@
+"""
+Add data_versions table for dashboard ETags
+
+Revision ID: 20261019_add_data_versions
+Revises: 20261019_datetime_schedule_columns
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '20261019_add_data_versions'
+down_revision = '20261019_datetime_schedule_columns'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # db_init.py may already have created it with create_all
+    if 'data_versions' in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        'data_versions',
+        sa.Column('scope', sa.String(), primary_key=True),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+def downgrade():
+    op.drop_table('data_versions')
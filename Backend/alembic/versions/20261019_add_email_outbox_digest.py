@@ -0,0 +1,28 @@
+"""
+Add digest column to email_outbox
+
+Revision ID: 20261019_add_email_outbox_digest
+Revises: 20261019_add_email_outbox
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '20261019_add_email_outbox_digest'
+down_revision = '20261019_add_email_outbox'
+branch_labels = None
+depends_on = None
+
+def _columns():
+    return {c['name'] for c in sa.inspect(op.get_bind()).get_columns('email_outbox')}
+
+def upgrade():
+    # db_init.py may already have created the table with the column
+    if 'digest' not in _columns():
+        with op.batch_alter_table('email_outbox') as batch_op:
+            batch_op.add_column(sa.Column('digest', sa.String(), nullable=True))
+
+def downgrade():
+    with op.batch_alter_table('email_outbox') as batch_op:
+        batch_op.drop_column('digest')
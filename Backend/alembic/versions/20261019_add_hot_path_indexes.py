@@ -0,0 +1,54 @@
+"""
+Add composite indexes for the hot query patterns
+
+Revision ID: 20261019_add_hot_path_indexes
+Revises: 20250826_add_pending_approval_to_tasks
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '20261019_add_hot_path_indexes'
+down_revision = '20250826_add_pending_approval_to_tasks'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns) matched to the queries that use them
+INDEXES = [
+    # get_session_messages / conversation memory: WHERE session_id = ? ORDER BY timestamp, id
+    ('ix_chat_messages_session_id_timestamp', 'chat_messages', ['session_id', 'timestamp', 'id']),
+    # list_sessions: WHERE user_id = ? ORDER BY created_at DESC
+    ('ix_chat_sessions_user_id_created_at', 'chat_sessions', ['user_id', 'created_at']),
+    # my-activities / user-stats: WHERE user_id = ? ORDER BY timestamp DESC
+    ('ix_user_activities_user_id_timestamp', 'user_activities', ['user_id', 'timestamp']),
+    # user-activities feed: ORDER BY timestamp DESC LIMIT ?
+    ('ix_user_activities_timestamp', 'user_activities', ['timestamp']),
+    # get_tasks: WHERE user_id = ?
+    ('ix_tasks_user_id_completed', 'tasks', ['user_id', 'completed']),
+    # get_events / get_meetings: WHERE rsvped = 0
+    ('ix_events_rsvped_created_at', 'events', ['rsvped', 'created_at']),
+    ('ix_meetings_rsvped_created_at', 'meetings', ['rsvped', 'created_at']),
+]
+
+def _tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+def upgrade():
+    tables = _tables()
+    # Superseded by the composite index on (session_id, timestamp, id). The model
+    # briefly declared session_id with index=True, so databases created by
+    # db_init.py in that window have it
+    if 'chat_messages' in tables:
+        op.drop_index('ix_chat_messages_session_id', table_name='chat_messages', if_exists=True)
+    for name, table, columns in INDEXES:
+        # Chat and activity tables are created by db_init.py and may not exist yet;
+        # create_all builds them with these indexes
+        if table in tables:
+            op.create_index(name, table, columns, unique=False, if_not_exists=True)
+
+def downgrade():
+    tables = _tables()
+    for name, table, columns in reversed(INDEXES):
+        if table in tables:
+            op.drop_index(name, table_name=table, if_exists=True)
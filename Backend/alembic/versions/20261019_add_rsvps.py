@@ -0,0 +1,47 @@
+"""
+Replace the global rsvped flags of events and meetings with a per-user rsvps table
+
+Revision ID: 20261019_add_rsvps
+Revises: 20261019_add_email_outbox_digest
+Create Date: 2026-10-19
+
+The old flags do not say who answered, so they cannot be carried over: after
+the upgrade every employee sees every event and meeting until they RSVP.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '20261019_add_rsvps'
+down_revision = '20261019_add_email_outbox_digest'
+branch_labels = None
+depends_on = None
+
+ITEM_TABLES = ['events', 'meetings']
+
+def _columns(table):
+    return {c['name'] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+def upgrade():
+    # db_init.py may already have created it with create_all
+    if 'rsvps' not in sa.inspect(op.get_bind()).get_table_names():
+        op.create_table(
+            'rsvps',
+            sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+            sa.Column('item_type', sa.String(), nullable=False),
+            sa.Column('item_id', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('user_id', 'item_type', 'item_id'),
+        )
+    for table in ITEM_TABLES:
+        op.drop_index(f'ix_{table}_rsvped_created_at', table_name=table, if_exists=True)
+        if 'rsvped' in _columns(table):
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.drop_column('rsvped')
+
+def downgrade():
+    for table in ITEM_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(sa.Column('rsvped', sa.Integer(), nullable=True, server_default='0'))
+        op.create_index(f'ix_{table}_rsvped_created_at', table, ['rsvped', 'created_at'], unique=False)
+    op.drop_table('rsvps')
@@ -0,0 +1,33 @@
+"""
+Add user_activity_daily rollup table
+
+Revision ID: 20261019_add_user_activity_daily
+Revises: 20261019_add_hot_path_indexes
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '20261019_add_user_activity_daily'
+down_revision = '20261019_add_hot_path_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # db_init.py may already have created it with create_all
+    if 'user_activity_daily' in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        'user_activity_daily',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('action', sa.String(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id', 'action', 'day'),
+    )
+    op.create_index('ix_user_activity_daily_day', 'user_activity_daily', ['day'], unique=False)
+
+def downgrade():
+    op.drop_index('ix_user_activity_daily_day', table_name='user_activity_daily', if_exists=True)
+    op.drop_table('user_activity_daily')
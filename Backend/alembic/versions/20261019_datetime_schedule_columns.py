@@ -0,0 +1,176 @@
+"""
+Store task due dates, event dates and meeting times as DateTime
+
+Revision ID: 20261019_datetime_schedule_columns
+Revises: 20261019_add_rsvps
+Create Date: 2026-10-19
+
+Existing free-form strings are parsed into a new DateTime column that then
+replaces the old one (changing the type in place would CAST the text, which
+SQLite turns into a number). Times without a date (the admin form used to send
+meeting times as "09:33") are placed on the day the row was created. Values
+that still cannot be parsed become NULL and the original text is appended to
+the row's description, so nothing typed in by an admin is lost; downgrade()
+writes the values back as text and moves those lines back out of the
+description.
+"""
+
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '20261019_datetime_schedule_columns'
+down_revision = '20261019_add_rsvps'
+branch_labels = None
+depends_on = None
+
+# (table, column, label used in the description, index name, indexed columns)
+COLUMNS = [
+    ('tasks', 'due', 'Due', 'ix_tasks_user_id_due', ['user_id', 'due']),
+    ('events', 'date', 'Date', 'ix_events_date', ['date']),
+    ('meetings', 'time', 'Time', 'ix_meetings_time', ['time']),
+]
+
+# Tried in order after ISO 8601
+FORMATS = [
+    '%Y-%m-%d %H:%M', '%Y/%m/%d %H:%M', '%Y/%m/%d',
+    '%d/%m/%Y %H:%M', '%d/%m/%Y', '%d-%m-%Y %H:%M', '%d-%m-%Y',
+    '%d %B %Y %H:%M', '%d %B %Y', '%B %d, %Y %H:%M', '%B %d, %Y', '%d %b %Y', '%b %d, %Y',
+]
+# Time of day only, combined with the date the row was created
+TIME_FORMATS = ['%H:%M', '%H:%M:%S', '%I:%M %p', '%I:%M%p', '%I %p']
+
+def _strptime(text, formats):
+    for fmt in formats:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+def _to_datetime(value):
+    """Datetime of a stored DateTime value (SQLite returns it as text)"""
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+def parse(value, created_at=None):
+    """
+    Datetime (naive UTC) of a stored string, or None when it cannot be read.
+    A time of day alone is taken on the date of `created_at`.
+    """
+    text = value.strip()
+    if not text:
+        return None
+    try:
+        parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        parsed = _strptime(text, FORMATS)
+    if parsed is None:
+        time_of_day = _strptime(text.upper(), TIME_FORMATS)
+        day = _to_datetime(created_at)
+        if time_of_day is not None and day is not None:
+            parsed = datetime.combine(day.date(), time_of_day.time())
+    if parsed is not None and parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def format_value(column, value, created_at=None):
+    """Text written back by downgrade(), in the shape the old forms produced"""
+    value = _to_datetime(value)
+    if value is None:
+        return None
+    day = _to_datetime(created_at)
+    if column == 'time' and day is not None and value.date() == day.date():
+        return value.strftime('%H:%M')  # Meeting times were entered as a time of day
+    if value.time() == datetime.min.time():
+        return value.strftime('%Y-%m-%d')  # Due dates and event dates were entered as dates
+    return value.strftime('%Y-%m-%d %H:%M')
+
+def _unparsed_line(label, description):
+    """(original text, description without it) when upgrade() moved a value into the description"""
+    if not description:
+        return None, description
+    head, _, last = description.rpartition('\n')
+    prefix = f"{label}: "
+    if not last.startswith(prefix):
+        return None, description
+    return last[len(prefix):], (head or None)
+
+def _backfill(conn, table, column, label):
+    """Parse `column` into the `<column>_at` DateTime column"""
+    rows = conn.execute(sa.text(
+        f"SELECT id, {column}, description, created_at FROM {table} WHERE {column} IS NOT NULL"
+    )).all()
+    target = sa.table(
+        table, sa.column('id', sa.Integer), sa.column(f'{column}_at', sa.DateTime),
+        sa.column('description', sa.String),
+    )
+    values, unparsed = [], 0
+    for row_id, raw, description, created_at in rows:
+        parsed = parse(str(raw), created_at)
+        if parsed is None and str(raw).strip():
+            unparsed += 1
+            description = f"{description}\n{label}: {raw}" if description else f"{label}: {raw}"
+        values.append({'row_id': row_id, 'value': parsed, 'description': description})
+    if values:
+        conn.execute(
+            target.update().where(target.c.id == sa.bindparam('row_id'))
+            .values({f'{column}_at': sa.bindparam('value'), 'description': sa.bindparam('description')}),
+            values,
+        )
+    if unparsed:
+        print(f"[WARN] {unparsed} {table}.{column} values could not be parsed; kept in description")
+
+def _restore(conn, table, column, label):
+    """Write `column` back as text into `<column>_text`, restoring values kept in the description"""
+    rows = conn.execute(sa.text(f"SELECT id, {column}, description, created_at FROM {table}")).all()
+    target = sa.table(
+        table, sa.column('id', sa.Integer), sa.column(f'{column}_text', sa.String),
+        sa.column('description', sa.String),
+    )
+    values = []
+    for row_id, value, description, created_at in rows:
+        text = format_value(column, value, created_at)
+        if text is None:
+            text, description = _unparsed_line(label, description)
+        values.append({'row_id': row_id, 'value': text, 'description': description})
+    if values:
+        conn.execute(
+            target.update().where(target.c.id == sa.bindparam('row_id'))
+            .values({f'{column}_text': sa.bindparam('value'), 'description': sa.bindparam('description')}),
+            values,
+        )
+
+def upgrade():
+    conn = op.get_bind()
+    tables = set(sa.inspect(conn).get_table_names())
+    for table, column, label, index, columns in COLUMNS:
+        if table not in tables:
+            continue
+        types = {c['name']: c['type'] for c in sa.inspect(conn).get_columns(table)}
+        if isinstance(types[column], sa.DateTime):
+            continue  # Created by db_init.py with the new type
+        op.add_column(table, sa.Column(f'{column}_at', sa.DateTime(), nullable=True))
+        _backfill(conn, table, column, label)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column(column)
+            batch_op.alter_column(f'{column}_at', new_column_name=column, existing_type=sa.DateTime())
+        op.create_index(index, table, columns, unique=False, if_not_exists=True)
+
+def downgrade():
+    conn = op.get_bind()
+    tables = set(sa.inspect(conn).get_table_names())
+    for table, column, label, index, columns in reversed(COLUMNS):
+        if table not in tables:
+            continue
+        op.drop_index(index, table_name=table, if_exists=True)
+        op.add_column(table, sa.Column(f'{column}_text', sa.String(), nullable=True))
+        _restore(conn, table, column, label)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column(column)
+            batch_op.alter_column(f'{column}_text', new_column_name=column, existing_type=sa.String())
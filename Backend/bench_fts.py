@@ -0,0 +1,204 @@
+# Backend/bench_fts.py
+# Benchmark of chat history search: LIKE '%word%' scans against the FTS5 index
+# installed by controllers/chat_search.py.
+#
+#   python bench_fts.py --messages 1000000
+#
+# Seeds a throwaway SQLite database with guest-style messages (words drawn
+# from a Zipf distribution, so some are common and most are rare), measures
+# the cost of building the index and of writing through its triggers, then
+# prints the median latency of each search done both ways.
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BACKEND_DIR)
+
+VOCABULARY = (
+    "room pool breakfast towel checkout checkin spa dinner lunch parking wifi password shuttle airport "
+    "gym sauna massage reservation booking suite view balcony minibar laundry iron pillow blanket key card "
+    "lobby elevator concierge restaurant bar menu vegan gluten allergy wine cocktail coffee tea kettle "
+    "heating cooling noise quiet late early upgrade invoice receipt deposit refund cancel change extend "
+    "tennis golf beach umbrella kids club babysitter crib pet dog garden terrace rooftop sunset tour taxi "
+    "train museum theatre shopping pharmacy doctor umbrella luggage storage safe shower bathtub slippers"
+).split()
+FILLER = "the a is what when where how can i my please do you have there for at to on in and or".split()
+
+# name -> (LIKE query, FTS5 query text passed through controllers.chat_search.match_query)
+SEARCHES = {
+    "common word": ("room", "room"),
+    "rare word": ("slippers", "slippers"),
+    "two words": ("pool towel", "pool towel"),
+    "prefix (search as you type)": ("break", "break"),
+    "word in no message": ("helicopter", "helicopter"),
+}
+
+
+def create_schema(path):
+    from sqlalchemy import create_engine
+    import db_init  # noqa: F401  (registers every model)
+    from config.database import Base
+
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+
+def seed(conn, users, sessions, messages):
+    rng = random.Random(42)
+    start = datetime(2025, 1, 1)
+    weights = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+    chunk = 50000
+
+    def message(i):
+        words = rng.choices(VOCABULARY, weights=weights, k=rng.randint(2, 6)) + rng.choices(FILLER, k=rng.randint(3, 12))
+        rng.shuffle(words)
+        return " ".join(words).capitalize() + "?"
+
+    print(f"Seeding {users} users, {sessions} sessions, {messages} messages...")
+    seeded = time.time()
+    conn.executemany(
+        "INSERT INTO users (id, full_name, email, hashed_password, created_at, is_active, is_admin) "
+        "VALUES (?, ?, ?, 'x', ?, 1, 0)",
+        [(i + 1, f"User {i}", f"user{i}@example.com", start) for i in range(users)],
+    )
+    owners = [rng.randint(1, users) for _ in range(sessions)]
+    conn.executemany(
+        "INSERT INTO chat_sessions (id, user_id, title, created_at) VALUES (?, ?, ?, ?)",
+        [(i + 1, owners[i], f"Session {i}", start + timedelta(minutes=i)) for i in range(sessions)],
+    )
+    for offset in range(0, messages, chunk):
+        rows = []
+        for i in range(offset, min(offset + chunk, messages)):
+            session_id = rng.randint(1, sessions)
+            rows.append((i + 1, owners[session_id - 1], session_id, "user" if i % 2 else "bot",
+                         message(i), start + timedelta(seconds=i * 7)))
+        conn.executemany(
+            "INSERT INTO chat_messages (id, user_id, session_id, sender, message, timestamp) "
+            "VALUES (?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    print(f"Seeded in {time.time() - seeded:.1f}s")
+
+
+def index_pages(conn):
+    """Pages used by the FTS5 shadow tables"""
+    try:
+        return conn.execute("SELECT count(*) FROM dbstat WHERE name LIKE 'chat_messages_fts%'").fetchone()[0]
+    except sqlite3.OperationalError:
+        return None  # SQLite built without the dbstat table
+
+
+def like_query(words, user_id):
+    sql = ("SELECT m.id, m.session_id, m.message FROM chat_messages m "
+           "WHERE " + " AND ".join("m.message LIKE ?" for _ in words))
+    params = [f"%{word}%" for word in words]
+    if user_id is not None:
+        sql += " AND m.user_id = ?"
+        params.append(user_id)
+    return sql + " ORDER BY m.id DESC LIMIT 20", params
+
+
+def fts_query(text, user_id):
+    from controllers.chat_search import FTS_TABLE, SNIPPET_OPEN, SNIPPET_CLOSE, SNIPPET_TOKENS, match_query
+
+    sql = (f"SELECT m.id, m.session_id, snippet({FTS_TABLE}, 0, ?, ?, '…', ?) FROM {FTS_TABLE} "
+           f"JOIN chat_messages m ON m.id = {FTS_TABLE}.rowid WHERE {FTS_TABLE} MATCH ?")
+    params = [SNIPPET_OPEN, SNIPPET_CLOSE, SNIPPET_TOKENS, match_query(text)]
+    if user_id is not None:
+        sql += " AND m.user_id = ?"
+        params.append(user_id)
+    return sql + f" ORDER BY bm25({FTS_TABLE}), m.id DESC LIMIT 20", params
+
+
+def timed(conn, sql, params, repeat):
+    timings, rows = [], 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = len(conn.execute(sql, params).fetchall())
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2], rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chat search with LIKE against the FTS5 index")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--sessions", type=int, default=200000)
+    parser.add_argument("--messages", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per query (median is reported)")
+    args = parser.parse_args()
+
+    from sqlalchemy import create_engine
+    from controllers.chat_search import FTS_TABLE, install_fts
+
+    path = os.path.join(tempfile.mkdtemp(prefix="fairmont-bench-"), "bench.db")
+    create_schema(path)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    seed(conn, args.users, args.sessions, args.messages)
+    table_pages = conn.execute("PRAGMA page_count").fetchone()[0]
+
+    # Index the existing messages (what `alembic upgrade head` does on a live database)
+    started = time.time()
+    engine = create_engine(f"sqlite:///{path}")
+    install_fts(engine)
+    engine.dispose()
+    build = time.time() - started
+    conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+    conn.commit()
+    pages = index_pages(conn)
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    size = f", {pages * page_size / 2**20:.1f} MiB" if pages is not None else ""
+    print(f"Indexed {args.messages} messages in {build:.1f}s{size} "
+          f"(database before indexing: {table_pages * page_size / 2**20:.1f} MiB)")
+
+    # Write path: the triggers add one index update per inserted message
+    rows = [(args.users // 2, args.sessions // 2, "user", "Is the rooftop bar open late tonight?", datetime(2026, 1, 1))
+            for _ in range(10000)]
+    insert = "INSERT INTO chat_messages (user_id, session_id, sender, message, timestamp) VALUES (?, ?, ?, ?, ?)"
+    started = time.perf_counter()
+    conn.executemany(insert, rows)
+    conn.commit()
+    with_index = time.perf_counter() - started
+    conn.execute("DROP TRIGGER chat_messages_fts_insert")
+    started = time.perf_counter()
+    conn.executemany(insert, rows)
+    conn.commit()
+    without_index = time.perf_counter() - started
+    conn.execute("DELETE FROM chat_messages WHERE id > ?", (args.messages,))
+    conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    conn.commit()
+    print(f"Inserting {len(rows)} messages: {with_index * 1000:.0f} ms with the index, "
+          f"{without_index * 1000:.0f} ms without")
+
+    # Searches of everyone's history (admin) and of one user's history (/api/chat/search)
+    user_id = conn.execute(
+        "SELECT user_id FROM chat_messages GROUP BY user_id ORDER BY count(*) DESC LIMIT 1").fetchone()[0]
+    print(f"\n{'search':38} {'scope':6} {'LIKE ms':>10} {'FTS5 ms':>10} {'speedup':>9} {'matches':>8}")
+    for name, (like_text, fts_text) in SEARCHES.items():
+        for scope, scope_user in (("all", None), ("user", user_id)):
+            like_ms, _ = timed(conn, *like_query(like_text.split(), scope_user), args.repeat)
+            fts_ms, _ = timed(conn, *fts_query(fts_text, scope_user), args.repeat)
+            sql, params = fts_query(fts_text, scope_user)
+            matches = conn.execute(f"SELECT count(*) FROM ({sql.rsplit(' LIMIT', 1)[0]})", params).fetchone()[0]
+            print(f"{name:38} {scope:6} {like_ms:10.2f} {fts_ms:10.2f} "
+                  f"{like_ms / fts_ms if fts_ms else float('inf'):8.1f}x {matches:8}")
+    print("\nLIKE returns the newest 20 matches and can stop early when a word is common; it reads every "
+          "message when\nmatches are rare or missing. FTS5 reads only the matching entries but scores all of "
+          "them with bm25 to\nreturn the best 20, so its cost grows with the number of matches. LIKE also "
+          "matches substrings ('room'\nfinds 'bathroom'), FTS5 matches words and their stems ('towel' finds 'towels').")
+
+    conn.close()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# Backend/bench_indexes.py
+# Benchmark of the hot query patterns with and without the composite indexes
+# added by alembic/versions/20261019_add_hot_path_indexes.py.
+#
+#   python bench_indexes.py --messages 2000000 --activities 2000000
+#
+# Seeds a throwaway SQLite database, drops the composite indexes, then prints
+# the query plan and latency of each query before and after creating them.
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BACKEND_DIR)
+
+# Hot queries, as issued by the routes (parameters filled per run)
+QUERIES = {
+    "session messages (get_session_messages)":
+        "SELECT id, sender, message, timestamp FROM chat_messages "
+        "WHERE session_id = :session_id ORDER BY timestamp, id",
+    "recent turns (conversation memory)":
+        "SELECT id, sender, message FROM chat_messages "
+        "WHERE session_id = :session_id ORDER BY timestamp DESC, id DESC LIMIT 26",
+    "sessions of a user (list_sessions)":
+        "SELECT id, title, created_at FROM chat_sessions "
+        "WHERE user_id = :user_id ORDER BY created_at DESC",
+    "activities of a user (my-activities)":
+        "SELECT id, action, timestamp FROM user_activities "
+        "WHERE user_id = :user_id ORDER BY timestamp DESC LIMIT 20",
+    "activity feed (user-activities)":
+        "SELECT id, user_id, action, timestamp FROM user_activities "
+        "ORDER BY timestamp DESC LIMIT 50",
+    "stats page of 100 users (user-stats)":
+        "SELECT user_id, action, total FROM ("
+        " SELECT user_id, action,"
+        " row_number() OVER (PARTITION BY user_id ORDER BY timestamp DESC, id DESC) AS rank,"
+        " count(*) OVER (PARTITION BY user_id) AS total"
+        " FROM user_activities WHERE user_id IN (SELECT id FROM users ORDER BY id LIMIT 100)"
+        ") WHERE rank <= 5 ORDER BY user_id, rank DESC",
+    "tasks of a user (get_tasks)":
+        "SELECT id, title, completed FROM tasks WHERE user_id = :user_id",
+    "overdue tasks of a user (get_tasks?status=overdue)":
+        "SELECT id, title, due FROM tasks WHERE user_id = :user_id AND completed = 0 AND due < :now "
+        "ORDER BY due IS NULL, due, id LIMIT 500",
+    "open events (get_events)":
+        "SELECT id, title FROM events WHERE NOT EXISTS (SELECT 1 FROM rsvps "
+        "WHERE rsvps.user_id = :user_id AND rsvps.item_type = 'event' AND rsvps.item_id = events.id)",
+    "open meetings (get_meetings)":
+        "SELECT id, title FROM meetings WHERE NOT EXISTS (SELECT 1 FROM rsvps "
+        "WHERE rsvps.user_id = :user_id AND rsvps.item_type = 'meeting' AND rsvps.item_id = meetings.id)",
+}
+
+
+def composite_indexes():
+    """CREATE INDEX statements of the composite indexes declared on the models"""
+    from sqlalchemy.schema import CreateIndex
+    from sqlalchemy.dialects import sqlite
+    import db_init  # noqa: F401  (registers every model)
+    from config.database import Base
+
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if len(index.columns) > 1 or index.name == "ix_user_activities_timestamp":
+                statements.append((index.name, str(CreateIndex(index).compile(dialect=sqlite.dialect()))))
+    return statements
+
+
+def create_schema(conn):
+    from sqlalchemy import create_engine
+    import db_init  # noqa: F401
+    from config.database import Base
+
+    path = conn.execute("PRAGMA database_list").fetchone()[2]
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+
+def seed(conn, users, sessions, messages, activities, tasks, events):
+    rng = random.Random(42)
+    start = datetime(2025, 1, 1)
+    chunk = 50000
+
+    def batches(total, make_row):
+        for offset in range(0, total, chunk):
+            yield [make_row(i) for i in range(offset, min(offset + chunk, total))]
+
+    print(f"Seeding {users} users, {sessions} sessions, {messages} messages, "
+          f"{activities} activities, {tasks} tasks, {events} events/meetings...")
+    seeded = time.time()
+    conn.executemany(
+        "INSERT INTO users (id, full_name, email, hashed_password, created_at, is_active, is_admin) "
+        "VALUES (?, ?, ?, 'x', ?, 1, 0)",
+        [(i + 1, f"User {i}", f"user{i}@example.com", start) for i in range(users)],
+    )
+    for rows in batches(sessions, lambda i: (i + 1, rng.randint(1, users), f"Session {i}",
+                                             start + timedelta(minutes=i))):
+        conn.executemany("INSERT INTO chat_sessions (id, user_id, title, created_at) VALUES (?, ?, ?, ?)", rows)
+    for rows in batches(messages, lambda i: (i + 1, 1, rng.randint(1, sessions), "user" if i % 2 else "bot",
+                                             "How late is the pool open tonight?",
+                                             start + timedelta(seconds=i * 7))):
+        conn.executemany(
+            "INSERT INTO chat_messages (id, user_id, session_id, sender, message, timestamp) "
+            "VALUES (?, ?, ?, ?, ?, ?)", rows)
+    actions = ["signin", "chat", "signup", "password_reset"]
+    for rows in batches(activities, lambda i: (i + 1, rng.randint(1, users), rng.choice(actions),
+                                               "/api/chat/message", start + timedelta(seconds=i * 5))):
+        conn.executemany(
+            "INSERT INTO user_activities (id, user_id, action, endpoint, timestamp) VALUES (?, ?, ?, ?, ?)", rows)
+    for rows in batches(tasks, lambda i: (i + 1, rng.randint(1, users), f"Task {i}", rng.randint(0, 1), 0,
+                                          start + timedelta(minutes=i), start + timedelta(days=rng.randint(0, 365)))):
+        conn.executemany(
+            "INSERT INTO tasks (id, user_id, title, completed, pending_approval, created_at, due) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    for table in ("events", "meetings"):
+        for rows in batches(events, lambda i: (i + 1, f"Item {i}", start + timedelta(hours=i))):
+            conn.executemany(f"INSERT INTO {table} (id, title, created_at) VALUES (?, ?, ?)", rows)
+        # Every user has answered 20 of the items
+        item_type = table[:-1]
+        answers = sorted({(rng.randint(1, users), rng.randint(1, events)) for _ in range(users * 20)})
+        for offset in range(0, len(answers), chunk):
+            conn.executemany(
+                "INSERT INTO rsvps (user_id, item_type, item_id, created_at) VALUES (?, ?, ?, ?)",
+                [(user_id, item_type, item_id, start) for user_id, item_id in answers[offset:offset + chunk]])
+    conn.commit()
+    conn.execute("ANALYZE")
+    print(f"Seeded in {time.time() - seeded:.1f}s")
+
+
+def run_queries(conn, params, repeat):
+    results = {}
+    for name, sql in QUERIES.items():
+        plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)]
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            conn.execute(sql, params).fetchall()
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        results[name] = (plan, timings[len(timings) // 2])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hot queries before/after composite indexes")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--sessions", type=int, default=200000)
+    parser.add_argument("--messages", type=int, default=1000000)
+    parser.add_argument("--activities", type=int, default=1000000)
+    parser.add_argument("--tasks", type=int, default=200000)
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query (median is reported)")
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="fairmont-bench-"), "bench.db")
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    create_schema(conn)
+
+    indexes = composite_indexes()
+    for name, _ in indexes:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    seed(conn, args.users, args.sessions, args.messages, args.activities, args.tasks, args.events)
+
+    params = {"session_id": args.sessions // 2, "user_id": args.users // 2, "now": datetime(2025, 7, 1)}
+    before = run_queries(conn, params, args.repeat)
+
+    started = time.time()
+    for _, statement in indexes:
+        conn.execute(statement)
+    conn.execute("ANALYZE")
+    print(f"Created {len(indexes)} indexes in {time.time() - started:.1f}s")
+    after = run_queries(conn, params, args.repeat)
+
+    print(f"\n{'query':45} {'before ms':>10} {'after ms':>10} {'speedup':>9}")
+    for name in QUERIES:
+        b, a = before[name][1], after[name][1]
+        print(f"{name:45} {b:10.3f} {a:10.3f} {b / a if a else float('inf'):8.1f}x")
+    print("\nQuery plans:")
+    for name in QUERIES:
+        print(f"- {name}")
+        print(f"    before: {' | '.join(before[name][0])}")
+        print(f"    after:  {' | '.join(after[name][0])}")
+
+    conn.close()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+# Backend/config/auth_config.py
+
+import os
+
+# bcrypt runs in a dedicated process pool so login storms do not starve the API threads
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Hash jobs allowed to wait for a worker; beyond this requests get a 503 right away
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
+# Attempt throttling, checked before any hashing: at most N failed attempts per
+# window for one client IP (signin, signup, password reset) and for one account
+# (signin only). Successful attempts are not counted
+AUTH_ACCOUNT_MAX_ATTEMPTS = int(os.getenv("AUTH_ACCOUNT_MAX_ATTEMPTS", "5"))
+AUTH_ACCOUNT_WINDOW = float(os.getenv("AUTH_ACCOUNT_WINDOW", "300"))  # Seconds
+AUTH_IP_MAX_ATTEMPTS = int(os.getenv("AUTH_IP_MAX_ATTEMPTS", "30"))
+AUTH_IP_WINDOW = float(os.getenv("AUTH_IP_WINDOW", "60"))  # Seconds
@@ -1,25 +1,99 @@
 # Backend/config/database.py
 
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-# Ensure the instance folder exists
-os.makedirs('instance', exist_ok=True)
+# Database URL, e.g. DATABASE_URL=sqlite:////var/lib/fairmont/fairmont.db
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./instance/fairmont.db")
 
-# SQLite database URL
-SQLALCHEMY_DATABASE_URL = "sqlite:///./instance/fairmont.db"
+# Performance profile: "production" (WAL and tuned pragmas) or "development"
+# (SQLite defaults, handy with SQL_ECHO=1 when debugging queries)
+DB_PROFILE = os.getenv("DB_PROFILE", "production").lower()
+SQL_ECHO = os.getenv("SQL_ECHO", "0").lower() in ("1", "true", "yes")
 
-# Create engine with SQLite specific parameters
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, 
-    connect_args={"check_same_thread": False},
-    echo=True  # Enable SQL query logging
+# Pragmas applied to every new SQLite connection, per profile
+_SQLITE_PROFILES = {
+    "production": {
+        "journal_mode": "WAL",  # Readers no longer wait for writers
+        "synchronous": "NORMAL",  # fsync on checkpoint instead of every commit (safe with WAL)
+        "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+        "cache_size": -int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536")),  # Negative = KiB
+        "temp_store": "MEMORY",
+    },
+    "development": {
+        "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    },
+}
+
+# Connection pool settings
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+
+_url = make_url(SQLALCHEMY_DATABASE_URL)
+IS_SQLITE = _url.get_backend_name() == "sqlite"
+# In-memory SQLite (sqlite://, :memory:, mode=memory) gets SingletonThreadPool/StaticPool,
+# which take none of the pool size settings
+IS_SQLITE_MEMORY = IS_SQLITE and (
+    _url.database in (None, "", ":memory:") or _url.query.get("mode") == "memory"
+)
+
+# Async driver URL used by the FastAPI routes (sqlite -> sqlite+aiosqlite by default)
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    _url.set(drivername=_ASYNC_DRIVERS.get(_url.get_backend_name(), _url.drivername)).render_as_string(hide_password=False),
 )
 
-# Session factory
+# Ensure the folder of a SQLite database file exists (the instance folder by default)
+if IS_SQLITE and not IS_SQLITE_MEMORY:
+    os.makedirs(os.path.dirname(_url.database) or ".", exist_ok=True)
+
+
+def _engine_options(asynchronous: bool = False):
+    options = {"echo": SQL_ECHO}  # Set SQL_ECHO=1 to log every statement
+    if not IS_SQLITE_MEMORY:
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+        )
+    if IS_SQLITE and not asynchronous:
+        options["connect_args"] = {"check_same_thread": False}
+    return options
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the profile's pragmas when the pool opens a new connection"""
+    pragmas = _SQLITE_PROFILES.get(DB_PROFILE, _SQLITE_PROFILES["production"])
+    cursor = dbapi_connection.cursor()
+    for name, value in pragmas.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+# Create engine
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **_engine_options())
+if IS_SQLITE:
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+
+# Async engine for the API routes: awaiting the database frees the event loop
+# instead of holding a threadpool thread for the whole request
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_engine_options(asynchronous=True))
+if IS_SQLITE:
+    event.listen(async_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+
+# Session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects stay usable after commit, so routes can return them without a refresh
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 # Base model class
 Base = declarative_base()
@@ -31,3 +105,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    """Dependency for getting an async DB session"""
+    async with AsyncSessionLocal() as db:
+        yield db
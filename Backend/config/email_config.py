@@ -0,0 +1,34 @@
+# Backend/config/email_config.py
+
+import os
+
+# SMTP server and account used for notifications
+SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "465"))
+# "ssl" (implicit TLS, port 465), "starttls" (port 587) or "none" (local stand-in, see fake_smtp.py)
+SMTP_SECURITY = os.getenv("SMTP_SECURITY", "ssl").lower()
+SMTP_USER = os.getenv("SMTP_USER", "ismail.bakraoui0@gmail.com")  # Use your Gmail
+SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")  # Gmail App Password; set it in the environment only
+SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", "10"))
+# Without credentials nothing is sent (unless the server needs none): messages
+# wait in the outbox and go out once SMTP_PASSWORD is set
+EMAIL_ENABLED = SMTP_SECURITY == "none" or bool(SMTP_USER and SMTP_PASSWORD)
+
+EMAIL_SENDER = os.getenv("EMAIL_SENDER", SMTP_USER)
+# Who gets task approval and RSVP notifications
+EMAIL_ADMIN_RECIPIENT = os.getenv("EMAIL_ADMIN_RECIPIENT", "ismail.bakraoui@emsi-edu.ma")
+# Base URL of the API used in approve/decline links
+APP_BASE_URL = os.getenv("APP_BASE_URL", "http://localhost:8080").rstrip("/")
+
+# Digest mode: task approval and RSVP notifications to the same recipient are
+# collected for this many seconds after the first one and sent as one email
+# with per-item links. 0 sends every notification on its own.
+EMAIL_DIGEST_WINDOW = float(os.getenv("EMAIL_DIGEST_WINDOW", "0"))
+
+# Outbox delivery
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", "20"))  # Messages claimed per round
+EMAIL_POLL_INTERVAL = float(os.getenv("EMAIL_POLL_INTERVAL", "5"))  # Seconds between outbox scans when idle
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "8"))  # Then the message is marked failed
+EMAIL_RETRY_BASE = float(os.getenv("EMAIL_RETRY_BASE", "30"))  # Seconds; doubled after every failure
+EMAIL_RETRY_MAX = float(os.getenv("EMAIL_RETRY_MAX", "3600"))
+EMAIL_CONNECTION_IDLE = float(os.getenv("EMAIL_CONNECTION_IDLE", "60"))  # Close the SMTP connection after
@@ -0,0 +1,23 @@
+# Backend/config/ollama_config.py
+
+import os
+
+# Comma-separated list of Ollama instances, e.g.
+# OLLAMA_HOSTS="http://localhost:11434,http://gpu-2:11434"
+# An optional weight can be given per host: "http://gpu-2:11434|2"
+OLLAMA_HOSTS = [
+    host.strip() for host in os.getenv("OLLAMA_HOSTS", "http://localhost:11434").split(",") if host.strip()
+]
+
+OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "mistral")
+
+# Timeouts in seconds (connect, read) for generation requests
+OLLAMA_CONNECT_TIMEOUT = float(os.getenv("OLLAMA_CONNECT_TIMEOUT", "3"))
+OLLAMA_READ_TIMEOUT = float(os.getenv("OLLAMA_READ_TIMEOUT", "120"))
+
+# Health checks against /api/tags
+OLLAMA_HEALTH_INTERVAL = float(os.getenv("OLLAMA_HEALTH_INTERVAL", "10"))
+OLLAMA_HEALTH_TIMEOUT = float(os.getenv("OLLAMA_HEALTH_TIMEOUT", "2"))
+
+# Consecutive failures before an instance is drained from rotation
+OLLAMA_MAX_FAILURES = int(os.getenv("OLLAMA_MAX_FAILURES", "2"))
@@ -0,0 +1,145 @@
+# Backend/controllers/activity_log.py
+
+import os
+import queue
+import threading
+import time
+
+from sqlalchemy import insert
+
+from config.database import engine
+from models.user_activity import UserActivity
+
+# Activity log settings
+ACTIVITY_QUEUE_SIZE = int(os.getenv("ACTIVITY_QUEUE_SIZE", "10000"))  # Events buffered before dropping
+ACTIVITY_BATCH_SIZE = int(os.getenv("ACTIVITY_BATCH_SIZE", "200"))  # Max rows per INSERT
+ACTIVITY_FLUSH_MS = int(os.getenv("ACTIVITY_FLUSH_MS", "500"))  # Max time an event waits for its batch
+
+
+class ActivityWriter:
+    """Write user activity rows in batches from a background thread.
+
+    Requests only enqueue; the writer inserts up to ACTIVITY_BATCH_SIZE rows in
+    one transaction as soon as a batch is full or its oldest event has waited
+    ACTIVITY_FLUSH_MS. When the queue is full new events are dropped and counted
+    rather than slowing requests down.
+    """
+
+    def __init__(self, max_size=ACTIVITY_QUEUE_SIZE, batch_size=ACTIVITY_BATCH_SIZE, flush_ms=ACTIVITY_FLUSH_MS):
+        self.batch_size = batch_size
+        self.flush_interval = flush_ms / 1000
+        self._queue = queue.Queue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stopping = False
+        self.stats = {"enqueued": 0, "written": 0, "dropped": 0, "failed": 0, "batches": 0}
+
+    def enqueue(self, row: dict):
+        self.start()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            with self._lock:
+                self.stats["dropped"] += 1
+                dropped = self.stats["dropped"]
+            if dropped == 1 or dropped % 1000 == 0:
+                print(f"[WARN] Activity log queue full, {dropped} events dropped so far")
+            return
+        with self._lock:
+            self.stats["enqueued"] += 1
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="activity-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """Write everything still queued, then stop the writer"""
+        thread = self._thread
+        if not thread or not thread.is_alive():
+            self._write(self._drain())
+            return
+        self._stopping = True
+        self._queue.put(None)  # Wake the writer
+        thread.join(timeout)
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Block until the events queued so far are written"""
+        if not self._thread or not self._thread.is_alive():
+            self._write(self._drain())
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.stats, queued=self._queue.qsize(), batch_size=self.batch_size,
+                        flush_ms=int(self.flush_interval * 1000))
+
+    def _drain(self):
+        rows = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return rows
+            if isinstance(item, dict):
+                rows.append(item)
+            elif isinstance(item, threading.Event):
+                item.set()
+
+    def _run(self):
+        while True:
+            batch, waiters = [], []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if isinstance(item, dict):
+                    batch.append(item)
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break  # Flush requested: write what we have now
+                elif item is None and self._stopping:
+                    break
+                if len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            self._write(batch)
+            for waiter in waiters:
+                waiter.set()
+            if self._stopping:
+                self._write(self._drain())
+                return
+
+    def _write(self, rows):
+        if not rows:
+            return
+        try:
+            # One transaction and one executemany INSERT for the whole batch
+            with engine.begin() as conn:
+                conn.execute(insert(UserActivity), rows)
+        except Exception as e:
+            print(f"[ERROR] Failed to write {len(rows)} activity events: {e}")
+            with self._lock:
+                self.stats["failed"] += len(rows)
+            return
+        with self._lock:
+            self.stats["written"] += len(rows)
+            self.stats["batches"] += 1
+
+
+# Shared writer used by log_user_activity
+activity_writer = ActivityWriter()
@@ -0,0 +1,163 @@
+# Backend/controllers/activity_rollup.py
+
+import gzip
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import Date, cast, delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from config.database import engine, IS_SQLITE
+from models.user_activity import UserActivity, UserActivityDaily
+
+# Rollup and retention settings
+ACTIVITY_ROLLUP_INTERVAL = int(os.getenv("ACTIVITY_ROLLUP_INTERVAL", "300"))  # Seconds between runs
+ACTIVITY_RETENTION_DAYS = int(os.getenv("ACTIVITY_RETENTION_DAYS", "90"))  # Raw rows kept; 0 keeps everything
+ACTIVITY_ARCHIVE_DIR = os.getenv("ACTIVITY_ARCHIVE_DIR")  # When set, pruned rows are archived there first
+
+_MIN_RETENTION_DAYS = 2  # Raw rows of the days still being rolled up are never pruned
+_PRUNE_BATCH = 5000  # Rows deleted per transaction
+
+
+def _day(column):
+    """Calendar day of a DateTime column"""
+    return func.date(column, type_=Date) if IS_SQLITE else cast(column, Date)
+
+
+def _insert(table):
+    return sqlite.insert(table) if IS_SQLITE else postgresql.insert(table)
+
+
+def _start_of(day) -> datetime:
+    return datetime.combine(day, datetime.min.time())
+
+
+def last_rolled_day(conn):
+    """Newest day present in user_activity_daily (None before the first rollup)"""
+    return conn.execute(select(func.max(UserActivityDaily.day))).scalar()
+
+
+def rollup_activities(since=None) -> int:
+    """
+    Recompute the daily counts of every day from `since` on. By default that is
+    the day before the last rolled-up one, so late events of the previous day
+    and the running day are picked up; the upsert makes reruns idempotent.
+    Returns the number of (user, action, day) rows written.
+    """
+    with engine.begin() as conn:
+        if since is None:
+            last = last_rolled_day(conn)
+            since = last - timedelta(days=1) if last else None
+
+        day = _day(UserActivity.timestamp).label("day")
+        query = select(UserActivity.user_id, UserActivity.action, day, func.count().label("count"))
+        if since:
+            query = query.where(UserActivity.timestamp >= _start_of(since))
+        else:
+            query = query.where(UserActivity.timestamp.is_not(None))
+        query = query.group_by(UserActivity.user_id, UserActivity.action, day)
+
+        stmt = _insert(UserActivityDaily).from_select(["user_id", "action", "day", "count"], query)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "action", "day"],
+            set_={"count": stmt.excluded["count"]},
+        )
+        return conn.execute(stmt).rowcount
+
+
+def _archive(conn, ids):
+    """Append the rows about to be pruned to a gzipped JSON-lines file"""
+    os.makedirs(ACTIVITY_ARCHIVE_DIR, exist_ok=True)
+    path = os.path.join(ACTIVITY_ARCHIVE_DIR, f"user_activities-{datetime.utcnow():%Y%m%d}.jsonl.gz")
+    rows = conn.execute(select(UserActivity.__table__).where(UserActivity.id.in_(ids))).mappings().all()
+    with gzip.open(path, "at", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(dict(row), default=str) + "\n")
+
+
+def prune_activities(retention_days: int = ACTIVITY_RETENTION_DAYS) -> int:
+    """Delete (or archive, see ACTIVITY_ARCHIVE_DIR) raw rows older than the retention age"""
+    if retention_days <= 0:
+        return 0
+    with engine.connect() as conn:
+        last = last_rolled_day(conn)
+    if last is None:
+        return 0  # Nothing is rolled up yet, keep every raw row
+
+    # Only rows already counted in the rollup may go
+    cutoff = min(
+        datetime.utcnow() - timedelta(days=max(retention_days, _MIN_RETENTION_DAYS)),
+        _start_of(last - timedelta(days=1)),
+    )
+    pruned = 0
+    while True:
+        with engine.begin() as conn:
+            ids = conn.execute(
+                select(UserActivity.id).where(UserActivity.timestamp < cutoff)
+                .order_by(UserActivity.id).limit(_PRUNE_BATCH)
+            ).scalars().all()
+            if not ids:
+                return pruned
+            if ACTIVITY_ARCHIVE_DIR:
+                _archive(conn, ids)
+            conn.execute(delete(UserActivity).where(UserActivity.id.in_(ids)))
+        pruned += len(ids)
+
+
+class ActivityRollupJob:
+    """Run the rollup and the retention prune every ACTIVITY_ROLLUP_INTERVAL seconds"""
+
+    def __init__(self, interval: int = ACTIVITY_ROLLUP_INTERVAL):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.stats = {"runs": 0, "last_run": None, "last_duration_ms": None, "rows_rolled_up": 0,
+                      "rows_pruned": 0, "last_error": None}
+
+    def run_once(self):
+        started = time.time()
+        try:
+            rolled = rollup_activities()
+            pruned = prune_activities()
+        except Exception as e:
+            print(f"[ERROR] Activity rollup failed: {e}")
+            with self._lock:
+                self.stats["last_error"] = str(e)
+            raise
+        with self._lock:
+            self.stats["runs"] += 1
+            self.stats["last_run"] = started
+            self.stats["last_duration_ms"] = round((time.time() - started) * 1000, 1)
+            self.stats["rows_rolled_up"] += rolled
+            self.stats["rows_pruned"] += pruned
+            self.stats["last_error"] = None
+        return {"rolled_up": rolled, "pruned": pruned}
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception:
+                pass  # Logged in run_once; retried on the next tick
+
+    def start(self):
+        if self.interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="activity-rollup", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.stats, interval=self.interval, retention_days=ACTIVITY_RETENTION_DAYS)
+
+
+# Shared job started with the app
+activity_rollup = ActivityRollupJob()
@@ -1,51 +1,82 @@
 # Backend/controllers/auth.py
 
+import math
 from fastapi import HTTPException, Depends, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime
 from models.user import User
-from models.user_activity import UserActivity
-from config.database import get_db
+from controllers.activity_log import activity_writer
+from controllers.password_hasher import password_hasher
 from config.jwt_config import create_access_token, create_refresh_token
-from passlib.context import CryptContext
+from config.auth_config import (
+    AUTH_ACCOUNT_MAX_ATTEMPTS,
+    AUTH_ACCOUNT_WINDOW,
+    AUTH_IP_MAX_ATTEMPTS,
+    AUTH_IP_WINDOW,
+)
+from utils.rate_limit import AttemptLimiter
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Attempt throttling, checked before any password hashing
+account_limiter = AttemptLimiter(AUTH_ACCOUNT_MAX_ATTEMPTS, AUTH_ACCOUNT_WINDOW)
+ip_limiter = AttemptLimiter(AUTH_IP_MAX_ATTEMPTS, AUTH_IP_WINDOW)
 
-# Helper to hash password
-def hash_password(password: str):
-    return pwd_context.hash(password)
+# Only failed attempts count: a burst of successful sign-ins from one address
+# (staff behind the hotel NAT at shift change) is never throttled. Sign-in
+# failures count per IP and per account; sign-up and password reset failures
+# per IP only, so nobody can lock an account by naming its email.
+def _throttle_keys(request: Request = None, email: str = None):
+    keys = []
+    if request and request.client:
+        keys.append((ip_limiter, request.client.host))
+    if email is not None:
+        keys.append((account_limiter, email.lower()))
+    return keys
 
-# Helper to verify password
-def verify_password(plain_password: str, hashed_password: str):
-    return pwd_context.verify(plain_password, hashed_password)
+# Helper to reject clients over their failed attempt budget, before any password hashing
+def throttle_attempt(request: Request = None, email: str = None):
+    for limiter, key in _throttle_keys(request, email):
+        retry_after = limiter.check(key)
+        if retry_after:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many attempts, please try again later",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
 
-# Helper to log user activity
-def log_user_activity(user_id: int, action: str, db: Session, request: Request = None, details: str = None):
-    activity = UserActivity(
-        user_id=user_id,
-        action=action,
-        endpoint=request.url.path if request else None,
-        ip_address=request.client.host if request else None,
-        user_agent=request.headers.get("user-agent") if request else None,
-        details=details
-    )
-    db.add(activity)
-    db.commit()
+def record_failed_attempt(request: Request = None, email: str = None):
+    for limiter, key in _throttle_keys(request, email):
+        limiter.record(key)
+
+# Helper to log user activity (queued; written in batches by controllers/activity_log.py)
+def log_user_activity(user_id: int, action: str, db: Session = None, request: Request = None, details: str = None):
+    activity_writer.enqueue({
+        "user_id": user_id,
+        "action": action,
+        "endpoint": request.url.path if request else None,
+        "ip_address": request.client.host if request else None,
+        "user_agent": request.headers.get("user-agent") if request else None,
+        "timestamp": datetime.utcnow(),
+        "details": details,
+    })
 
 # Signup logic
-def signup_user(full_name: str, email: str, password: str, db: Session, request: Request = None):
-    existing_user = db.query(User).filter(User.email == email).first()
+async def signup_user(full_name: str, email: str, password: str, db: AsyncSession, request: Request = None):
+    throttle_attempt(request)
+    existing_user = (await db.execute(select(User.id).where(User.email == email))).first()
     if existing_user:
+        record_failed_attempt(request)
         raise HTTPException(status_code=400, detail="Email already registered")
+    await db.commit()  # End the read so no connection is held while bcrypt runs
 
     new_user = User(
         full_name=full_name,
         email=email,
-        hashed_password=hash_password(password)
+        hashed_password=await password_hasher.hash(password)
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
     
     # Log signup activity
     log_user_activity(new_user.id, "signup", db, request)
@@ -63,14 +94,18 @@ def signup_user(full_name: str, email: str, password: str, db: Session, request:
     }
 
 # Signin logic
-def signin_user(email: str, password: str, db: Session, request: Request = None):
-    user = db.query(User).filter(User.email == email).first()
-    if not user or not verify_password(password, user.hashed_password):
+async def signin_user(email: str, password: str, db: AsyncSession, request: Request = None):
+    throttle_attempt(request, email)
+    user = (await db.execute(select(User).where(User.email == email))).scalars().first()
+    await db.commit()  # End the read so no connection is held while bcrypt runs
+    if not user or not await password_hasher.verify(password, user.hashed_password):
+        record_failed_attempt(request, email)
         raise HTTPException(status_code=401, detail="Invalid email or password")
+    account_limiter.reset(email.lower())
     
     # Update last login
     user.last_login = datetime.utcnow()
-    db.commit()
+    await db.commit()
     
     # Log signin activity
     log_user_activity(user.id, "signin", db, request)
@@ -89,14 +124,17 @@ def signin_user(email: str, password: str, db: Session, request: Request = None)
     }
 
 # Reset password logic
-def reset_password(email: str, new_password: str, db: Session, request: Request = None):
-    user = db.query(User).filter(User.email == email).first()
+async def reset_password(email: str, new_password: str, db: AsyncSession, request: Request = None):
+    throttle_attempt(request)
+    user = (await db.execute(select(User).where(User.email == email))).scalars().first()
     if not user:
+        record_failed_attempt(request)
         raise HTTPException(status_code=404, detail="User not found")
+    await db.commit()  # End the read so no connection is held while bcrypt runs
     
     # Update password
-    user.hashed_password = hash_password(new_password)
-    db.commit()
+    user.hashed_password = await password_hasher.hash(new_password)
+    await db.commit()
     
     # Log password reset activity
     log_user_activity(user.id, "password_reset", db, request)
@@ -0,0 +1,175 @@
+# Backend/controllers/bulk_import.py
+
+import codecs
+import csv
+import json
+import os
+import time
+
+from fastapi import HTTPException, Request
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from utils.data_versions import bump_versions
+
+# Bulk import settings
+BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", "1000"))  # Rows inserted per transaction
+BULK_MAX_ERRORS = int(os.getenv("BULK_MAX_ERRORS", "1000"))  # Row errors returned in the report
+
+JSON_TYPES = ("application/json",)
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines")
+CSV_TYPES = ("text/csv", "application/csv")
+
+
+async def _lines(request: Request):
+    """Decoded lines of the request body as it arrives (newlines kept)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in request.stream():
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def _ndjson_rows(request: Request):
+    number = 0
+    async for line in _lines(request):
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            yield number, json.loads(line), None
+        except json.JSONDecodeError as e:
+            yield number, None, f"Invalid JSON: {e.msg}"
+
+
+async def _csv_rows(request: Request):
+    header, record, number = None, "", 0
+    async for line in _lines(request):
+        record += line
+        if record.count('"') % 2:
+            continue  # A quoted field spans lines: wait for the rest of the record
+        if not record.strip():
+            record = ""
+            continue
+        fields = next(csv.reader([record]))
+        record = ""
+        if header is None:
+            header = [name.strip() for name in fields]
+            continue
+        number += 1
+        if len(fields) > len(header):
+            yield number, None, f"Expected {len(header)} fields, got {len(fields)}"
+            continue
+        # Empty cells are missing values, so optional columns fall back to their defaults
+        yield number, {name: value for name, value in zip(header, fields) if value != ""}, None
+    if record.strip():
+        yield number + 1, None, "Unterminated quoted field"
+
+
+async def read_rows(request: Request):
+    """
+    Rows of a bulk upload as (row number, dict, error). JSON bodies must be an
+    array and are read whole; NDJSON and CSV (header row first) are parsed line
+    by line while the upload streams in.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_TYPES:
+        async for row in _ndjson_rows(request):
+            yield row
+    elif content_type in CSV_TYPES:
+        async for row in _csv_rows(request):
+            yield row
+    elif content_type in JSON_TYPES:
+        try:
+            items = json.loads(await request.body())
+        except json.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON: {e.msg}")
+        if not isinstance(items, list):
+            raise HTTPException(status_code=400, detail="Expected a JSON array of rows")
+        for number, item in enumerate(items, start=1):
+            yield number, item, None
+    else:
+        raise HTTPException(
+            status_code=415,
+            detail="Send application/json (array), application/x-ndjson or text/csv",
+        )
+
+
+def _validation_errors(e: ValidationError):
+    return "; ".join(f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}" for error in e.errors())
+
+
+async def bulk_insert(db, model, schema, rows, scopes, check=None, on_insert=None,
+                      chunk_size: int = BULK_CHUNK_SIZE) -> dict:
+    """
+    Validate `rows` (from read_rows) with the pydantic `schema` and insert the
+    valid ones into `model` with one executemany per chunk of `chunk_size`
+    rows, each chunk in its own transaction. `scopes(values)` names the
+    data_versions counters a chunk changes; `check(db, values)` can reject rows
+    of a chunk against the database and returns {index in chunk: error};
+    `on_insert(values)` runs after each chunk is committed.
+    Returns counts, per-row errors and the throughput.
+    """
+    started = time.perf_counter()
+    report = {"received": 0, "inserted": 0, "failed": 0, "errors": [], "errors_truncated": False}
+
+    def fail(number, error):
+        report["failed"] += 1
+        if len(report["errors"]) < BULK_MAX_ERRORS:
+            report["errors"].append({"row": number, "error": error})
+        else:
+            report["errors_truncated"] = True
+
+    async def flush(chunk):
+        numbers, values = [number for number, _ in chunk], [value for _, value in chunk]
+        if check:
+            rejected = await check(db, values)
+            for index, error in sorted(rejected.items()):
+                fail(numbers[index], error)
+            numbers = [n for i, n in enumerate(numbers) if i not in rejected]
+            values = [v for i, v in enumerate(values) if i not in rejected]
+        if not values:
+            return
+        try:
+            await db.execute(insert(model), values)
+            await bump_versions(db, *scopes(values))
+            await db.commit()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            error = str(getattr(e, "orig", None) or e)[:200]
+            for number in numbers:
+                fail(number, f"Insert failed: {error}")
+            return
+        report["inserted"] += len(values)
+        if on_insert:
+            on_insert(values)
+
+    chunk = []
+    async for number, data, error in rows:
+        report["received"] += 1
+        if error is None and not isinstance(data, dict):
+            error = "Expected an object"
+        if error is None:
+            try:
+                chunk.append((number, schema(**data).model_dump()))
+            except ValidationError as e:
+                error = _validation_errors(e)
+        if error is not None:
+            fail(number, error)
+        if len(chunk) >= chunk_size:
+            await flush(chunk)
+            chunk = []
+    if chunk:
+        await flush(chunk)
+
+    report["errors"].sort(key=lambda error: error["row"])
+    elapsed = time.perf_counter() - started
+    report["seconds"] = round(elapsed, 3)
+    report["rows_per_sec"] = round(report["inserted"] / elapsed, 1) if elapsed > 0 else None
+    return report
@@ -5,14 +5,16 @@ import os
 import time
 import threading
 import json
-import requests
 import traceback
 
 # Configure path for retriever
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
-from retriever import get_context
+from retriever import get_context, extract_answer
+from config.ollama_config import OLLAMA_MODEL
+from controllers.ollama_pool import ollama_pool
+from controllers.telemetry import generation_telemetry
 
 # Cache system for performance optimization
 _RESPONSE_CACHE = {}
@@ -22,31 +24,42 @@ _CACHE_MAX_SIZE = 1000  # Increased maximum cache size
 _CACHE_HITS = 0  # Track cache hit rate
 _CACHE_MISSES = 0  # Track cache miss rate
 
+# Extractive answers above this confidence are returned without calling the model
+_EXTRACTIVE_THRESHOLD = 0.7
+
 def check_ollama_status():
-    """Check if Ollama is available and return status"""
-    try:
-        # Test response with a simple request - no timeout
-        print("[DEBUG] Checking Ollama availability...")
-        response = requests.get("http://localhost:11434/api/tags")
-        status = response.status_code == 200
-        print(f"[DEBUG] Ollama available: {status}")
-        return status
-    except Exception as e:
-        print(f"[DEBUG] Ollama check error: {str(e)}")
-        return False
-
-def generate_ai_response(message: str):
-    """Generate a response using the AI model, enhanced with knowledge base context."""
+    """Check if at least one Ollama instance is available (from the pool's health checks)"""
+    status = ollama_pool.is_available()
+    print(f"[DEBUG] Ollama available: {status}")
+    return status
+
+def generate_ai_response(message: str, history: str = "", retrieval_query: str = None):
+    """Generate a response using the AI model, enhanced with knowledge base context.
+
+    `history` is the conversation so far (see controllers/memory.py) and
+    `retrieval_query` lets follow-up questions retrieve with the earlier turn.
+    """
     start_time = time.time()
 
     # Single retriever call: we'll always pass context to the model, but we won't
     # use the retriever as a replacement for the model's generation.
-    context = get_context(message)
-
+    retrieval_start = time.time()
+    context = get_context(retrieval_query or message)
+    retrieval_ms = (time.time() - retrieval_start) * 1000
 
     # Truncate context to keep prompt size reasonable for faster generation
     if context is None:
         context = ""
+
+    # Answer straight from the knowledge base when one sentence clearly covers the
+    # question (follow-ups expanded with earlier turns still go to the model)
+    if not retrieval_query or retrieval_query == message:
+        answer, confidence = extract_answer(message, context)
+        if answer and confidence >= _EXTRACTIVE_THRESHOLD:
+            print(f"[DEBUG] Extractive answer used (confidence: {confidence:.2f}) in {time.time() - start_time:.3f}s")
+            generation_telemetry.record_outcome("extractive", retrieval_ms, len(context))
+            return answer
+
     max_context_chars = 4000
     if len(context) > max_context_chars:
         context = context[:max_context_chars].rsplit('\n', 1)[0] + "..."
@@ -61,14 +74,16 @@ def generate_ai_response(message: str):
         "Keep replies under 80 words unless more detail is specifically requested. "
     )
 
+    conversation = f"CONVERSATION SO FAR:\n{history}\n\n" if history else ""
     prompt = (
         f"{system_prompt}\n"
         f"HOTEL KNOWLEDGE:\n{context}\n\n"
+        f"{conversation}"
         f"Guest: {message}\nAssistant:"
     )
 
     payload = {
-        "model": "mistral",
+        "model": OLLAMA_MODEL,
         "prompt": prompt,
         "stream": False,
         "options": {
@@ -81,13 +96,24 @@ def generate_ai_response(message: str):
     }
 
     try:
-        response = requests.post("http://localhost:11434/api/generate", json=payload)
+        generation_start = time.time()
+        response, backend_url = ollama_pool.generate(payload)
+        generation_ms = (time.time() - generation_start) * 1000
         if response.status_code != 200:
-            print(f"[ERROR] Model API returned {response.status_code}")
+            print(f"[ERROR] Model API at {backend_url} returned {response.status_code}")
+            generation_telemetry.record_outcome("error", retrieval_ms, len(context))
             return "I apologize, the assistant is temporarily unable to generate a response. Please try again shortly."
 
         data = response.json()
         ai_response = data.get("response", "").strip()
+        generation_telemetry.record_generation(
+            data,
+            generation_ms,
+            retrieval_ms=retrieval_ms,
+            context_chars=len(context),
+            backend=backend_url,
+            model=OLLAMA_MODEL,
+        )
 
         if not ai_response:
             return "I apologize, I'm unable to generate an answer right now. Please try again."
@@ -98,17 +124,20 @@ def generate_ai_response(message: str):
             ai_response = ai_response[len(message):].strip()
 
         # Cache the model response for faster repeat answers
-        cache_key = message.lower().strip()
-        with _CACHE_LOCK:
-            if len(_RESPONSE_CACHE) >= _CACHE_MAX_SIZE:
-                items_to_remove = max(1, int(_CACHE_MAX_SIZE * 0.1))
-                oldest_keys = sorted(_RESPONSE_CACHE.keys(), key=lambda k: _RESPONSE_CACHE[k]['timestamp'])[:items_to_remove]
-                for k in oldest_keys:
-                    del _RESPONSE_CACHE[k]
-            _RESPONSE_CACHE[cache_key] = {'response': ai_response, 'timestamp': time.time()}
+        # (answers that depend on earlier turns are not reusable)
+        if not history:
+            cache_key = message.lower().strip()
+            with _CACHE_LOCK:
+                if len(_RESPONSE_CACHE) >= _CACHE_MAX_SIZE:
+                    items_to_remove = max(1, int(_CACHE_MAX_SIZE * 0.1))
+                    oldest_keys = sorted(_RESPONSE_CACHE.keys(), key=lambda k: _RESPONSE_CACHE[k]['timestamp'])[:items_to_remove]
+                    for k in oldest_keys:
+                        del _RESPONSE_CACHE[k]
+                _RESPONSE_CACHE[cache_key] = {'response': ai_response, 'timestamp': time.time()}
 
         return ai_response
 
     except Exception:
         print(traceback.format_exc())
+        generation_telemetry.record_outcome("error", retrieval_ms, len(context))
         return "I apologize — the assistant is currently experiencing issues generating responses. Please try again in a moment."
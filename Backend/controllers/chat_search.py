@@ -0,0 +1,111 @@
+# Backend/controllers/chat_search.py
+# Full-text search over chat history with SQLite FTS5.
+#
+# chat_messages_fts is an external-content FTS5 index of chat_messages.message
+# (the text is not stored twice; rowid = chat_messages.id). Triggers keep it
+# in sync with every insert, update and delete, whatever the write path.
+# Matches are ranked with bm25 and returned with a highlighted snippet.
+
+import html
+import re
+
+from fastapi import HTTPException
+from sqlalchemy import DateTime, text
+
+from config.database import IS_SQLITE
+
+FTS_TABLE = "chat_messages_fts"
+# snippet() marks matched terms with these private-use characters, not with HTML:
+# the message text is escaped first and only then are they turned into <mark> tags
+SNIPPET_OPEN, SNIPPET_CLOSE = "\ue000", "\ue001"
+HIGHLIGHT_OPEN, HIGHLIGHT_CLOSE = "<mark>", "</mark>"
+SNIPPET_TOKENS = 16  # Words per snippet
+MAX_SEARCH_RESULTS = 100  # Page size limit
+
+# Statements creating the index; kept in step with
+# alembic/versions/20261019_add_chat_messages_fts.py
+FTS_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        message, content='chat_messages', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS chat_messages_fts_insert AFTER INSERT ON chat_messages BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, message) VALUES (new.id, new.message);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS chat_messages_fts_delete AFTER DELETE ON chat_messages BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, message) VALUES ('delete', old.id, old.message);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS chat_messages_fts_update AFTER UPDATE OF message ON chat_messages BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, message) VALUES ('delete', old.id, old.message);
+        INSERT INTO {FTS_TABLE}(rowid, message) VALUES (new.id, new.message);
+    END""",
+]
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def install_fts(engine):
+    """Create the index and its triggers if missing, indexing existing messages (SQLite only)"""
+    if not IS_SQLITE:
+        return
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": FTS_TABLE}
+        ).first()
+        for statement in FTS_DDL:
+            conn.execute(text(statement))
+        if not exists:
+            conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+
+def highlight(snippet: str) -> str:
+    """HTML of a snippet: the message text escaped, matched terms in <mark></mark>"""
+    return html.escape(snippet).replace(SNIPPET_OPEN, HIGHLIGHT_OPEN).replace(SNIPPET_CLOSE, HIGHLIGHT_CLOSE)
+
+
+def match_query(q: str) -> str:
+    """
+    FTS5 query for free text typed by a user: every word must appear (the last
+    one as a prefix, for search-as-you-type). Words are quoted, so FTS5
+    operators and punctuation in the input cannot cause syntax errors.
+    """
+    terms = _TERM.findall(q)
+    if not terms:
+        raise HTTPException(status_code=400, detail="Search query must contain at least one word")
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+async def search_messages(db, q: str, user_id: int = None, session_id: int = None,
+                          limit: int = 20, offset: int = 0):
+    """
+    Best matches first (bm25), `limit` results from `offset`, optionally within
+    one user's or one session's messages. Returns (results, has_more).
+    """
+    if not IS_SQLITE:
+        raise HTTPException(status_code=501, detail="Chat search requires the SQLite FTS5 index")
+    limit = max(1, min(limit, MAX_SEARCH_RESULTS))
+    filters, params = [], {
+        "query": match_query(q), "limit": limit + 1, "offset": max(0, offset),
+        "open": SNIPPET_OPEN, "close": SNIPPET_CLOSE, "tokens": SNIPPET_TOKENS,
+    }
+    if user_id is not None:
+        filters.append("AND m.user_id = :user_id")
+        params["user_id"] = user_id
+    if session_id is not None:
+        filters.append("AND m.session_id = :session_id")
+        params["session_id"] = session_id
+    rows = (await db.execute(text(f"""
+        SELECT m.id, m.session_id, s.title AS session_title, m.user_id, m.sender, m.timestamp,
+               snippet({FTS_TABLE}, 0, :open, :close, '…', :tokens) AS snippet,
+               bm25({FTS_TABLE}) AS score
+        FROM {FTS_TABLE}
+        JOIN chat_messages m ON m.id = {FTS_TABLE}.rowid
+        JOIN chat_sessions s ON s.id = m.session_id
+        WHERE {FTS_TABLE} MATCH :query {' '.join(filters)}
+        ORDER BY score, m.id DESC
+        LIMIT :limit OFFSET :offset
+    """).columns(timestamp=DateTime), params)).mappings().all()
+    results = [dict(row, snippet=highlight(row["snippet"])) for row in rows[:limit]]
+    return results, len(rows) > limit
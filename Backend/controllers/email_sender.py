@@ -0,0 +1,253 @@
+# Backend/controllers/email_sender.py
+
+import random
+import smtplib
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, tuple_, update
+
+from config.database import engine
+from config.email_config import (
+    EMAIL_SENDER,
+    EMAIL_BATCH_SIZE,
+    EMAIL_POLL_INTERVAL,
+    EMAIL_MAX_ATTEMPTS,
+    EMAIL_RETRY_BASE,
+    EMAIL_RETRY_MAX,
+    EMAIL_CONNECTION_IDLE,
+    EMAIL_DIGEST_WINDOW,
+    EMAIL_ENABLED,
+)
+from controllers.telemetry import Histogram
+from models.email_outbox import EmailOutbox
+from utils.email_utils import open_smtp_connection, build_message, build_digest
+
+_CLAIM_LEASE = 300  # Seconds before a message claimed by a crashed sender is picked up again
+# Errors meaning the server cannot be used right now (SMTPException itself subclasses OSError,
+# so a refused recipient must not be caught by a bare OSError)
+_DROPPED_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError)
+_CONNECTION_ERRORS = _DROPPED_ERRORS + (
+    smtplib.SMTPConnectError, smtplib.SMTPAuthenticationError, TimeoutError, socket.gaierror,
+)
+_SEND_MS_BOUNDS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+_DELAY_S_BOUNDS = [1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600, 4 * 3600, 24 * 3600]
+_RETURNING = (EmailOutbox.id, EmailOutbox.recipient, EmailOutbox.subject, EmailOutbox.body,
+              EmailOutbox.digest, EmailOutbox.attempts, EmailOutbox.created_at)
+
+
+class EmailSender:
+    """Deliver the email outbox from a background thread.
+
+    Due messages are claimed in batches (status 'sending' with a lease, so
+    several workers never send the same row) and sent over one SMTP connection
+    that is kept open between batches and closed after EMAIL_CONNECTION_IDLE
+    seconds. Failures are retried with exponential backoff until
+    EMAIL_MAX_ATTEMPTS, then the message is marked failed. Delivery is
+    at-least-once: a crash between sending and recording resends the message.
+
+    Digest items (see utils/email_utils.py) are sent together: when one of them
+    is due, every pending item of the same kind for that recipient is claimed
+    with it and the group goes out as a single message.
+    """
+
+    def __init__(self, batch_size: int = EMAIL_BATCH_SIZE, poll_interval: float = EMAIL_POLL_INTERVAL):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._server = None
+        self._last_used = 0.0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.stats = {"sent": 0, "messages": 0, "digests": 0, "digest_items": 0, "retried": 0, "failed": 0,
+                      "batches": 0, "connections": 0, "last_error": None}
+        self.histograms = {
+            "send_ms": Histogram(_SEND_MS_BOUNDS),  # SMTP time per message
+            "delivery_delay_s": Histogram(_DELAY_S_BOUNDS),  # Queued to sent, per outbox row
+        }
+
+    # --- Outbox ---
+
+    def _claim(self):
+        now = datetime.utcnow()
+        due = (
+            select(EmailOutbox.id)
+            .where(EmailOutbox.status.in_(("pending", "sending")), EmailOutbox.next_attempt_at <= now)
+            .order_by(EmailOutbox.id)
+            .limit(self.batch_size)
+        )
+        lease = now + timedelta(seconds=_CLAIM_LEASE)
+        with engine.begin() as conn:
+            rows = conn.execute(
+                update(EmailOutbox)
+                .where(EmailOutbox.id.in_(due), EmailOutbox.status.in_(("pending", "sending")))
+                .values(status="sending", next_attempt_at=lease)
+                .returning(*_RETURNING)
+            ).all()
+            groups = {(row.recipient, row.digest) for row in rows if row.digest}
+            if groups:
+                # Items still inside their window join the digest that is going out now
+                rows += conn.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.status == "pending",
+                           tuple_(EmailOutbox.recipient, EmailOutbox.digest).in_(groups))
+                    .values(status="sending", next_attempt_at=lease)
+                    .returning(*_RETURNING)
+                ).all()
+        return sorted(rows, key=lambda row: row.id)
+
+    def _record(self, sent, failures):
+        now = datetime.utcnow()
+        with engine.begin() as conn:
+            if sent:
+                conn.execute(
+                    update(EmailOutbox).where(EmailOutbox.id.in_([row.id for row in sent]))
+                    .values(status="sent", sent_at=now, attempts=EmailOutbox.attempts + 1, last_error=None)
+                )
+            for row, error in failures:
+                attempts = row.attempts + 1
+                if attempts >= EMAIL_MAX_ATTEMPTS:
+                    values = {"status": "failed"}
+                else:
+                    delay = min(EMAIL_RETRY_BASE * 2 ** (attempts - 1), EMAIL_RETRY_MAX)
+                    delay *= random.uniform(0.8, 1.2)  # Jitter, so retries do not come back in lockstep
+                    values = {"status": "pending", "next_attempt_at": now + timedelta(seconds=delay)}
+                conn.execute(
+                    update(EmailOutbox).where(EmailOutbox.id == row.id)
+                    .values(attempts=attempts, last_error=str(error)[:500], **values)
+                )
+                with self._lock:
+                    self.stats["failed" if values["status"] == "failed" else "retried"] += 1
+                    self.stats["last_error"] = str(error)[:500]
+        with self._lock:
+            self.stats["sent"] += len(sent)
+            self.stats["batches"] += 1
+            for row in sent:
+                self.histograms["delivery_delay_s"].observe((now - row.created_at).total_seconds())
+
+    # --- SMTP ---
+
+    def _connection(self):
+        if self._server is None:
+            self._server = open_smtp_connection()
+            with self._lock:
+                self.stats["connections"] += 1
+        return self._server
+
+    def _close(self):
+        server, self._server = self._server, None
+        if server is not None:
+            try:
+                server.quit()
+            except Exception:
+                pass  # Already gone
+
+    def _deliver(self, recipient, subject, body):
+        message = build_message(recipient, subject, body)
+        started = time.perf_counter()
+        try:
+            self._connection().sendmail(EMAIL_SENDER, [recipient], message)
+        except _DROPPED_ERRORS:
+            # The kept-alive connection may have been dropped by the server: reconnect once
+            self._close()
+            self._connection().sendmail(EMAIL_SENDER, [recipient], message)
+        self._last_used = time.monotonic()
+        with self._lock:
+            self.histograms["send_ms"].observe((time.perf_counter() - started) * 1000)
+
+    @staticmethod
+    def _messages(rows):
+        """Group claimed rows into messages: (rows, recipient, subject, body)"""
+        groups = {}  # Insertion order keeps messages in outbox order
+        for row in rows:
+            key = (row.recipient, row.digest) if row.digest else row.id
+            groups.setdefault(key, []).append(row)
+        messages = []
+        for group in groups.values():
+            first = group[0]
+            if first.digest:
+                messages.append((group, first.recipient, *build_digest(first.digest, group)))
+            else:
+                messages.append((group, first.recipient, first.subject, first.body))
+        return messages
+
+    def send_batch(self, rows):
+        sent, failures = [], []
+        messages = self._messages(rows)
+        for i, (group, recipient, subject, body) in enumerate(messages):
+            try:
+                self._deliver(recipient, subject, body)
+                sent.extend(group)
+            except _CONNECTION_ERRORS as e:
+                # Server unreachable: retry the rest of the batch later instead of hammering it
+                self._close()
+                failures.extend((pending, e) for message in messages[i:] for pending in message[0])
+                break
+            except Exception as e:
+                failures.extend((row, e) for row in group)
+                continue
+            with self._lock:
+                self.stats["messages"] += 1
+                if group[0].digest:
+                    self.stats["digests"] += 1
+                    self.stats["digest_items"] += len(group)
+        self._record(sent, failures)
+
+    def run_once(self) -> int:
+        """Claim and send one batch; returns the number of messages claimed"""
+        rows = self._claim()
+        if rows:
+            self.send_batch(rows)
+        return len(rows)
+
+    # --- Background thread ---
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self.run_once():
+                    continue  # More messages may be due
+            except Exception as e:
+                print(f"[ERROR] Email outbox delivery failed: {e}")
+                with self._lock:
+                    self.stats["last_error"] = str(e)[:500]
+            if self._server is not None and time.monotonic() - self._last_used > EMAIL_CONNECTION_IDLE:
+                self._close()
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+        self._close()
+
+    def notify(self):
+        """Wake the sender after committing new outbox rows"""
+        self._wake.set()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        if not EMAIL_ENABLED:
+            print("[WARN] SMTP_USER/SMTP_PASSWORD not set: notification emails stay queued in the outbox")
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="email-sender", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def snapshot(self):
+        with self._lock:
+            return dict(
+                self.stats, enabled=EMAIL_ENABLED, connected=self._server is not None, batch_size=self.batch_size,
+                digest_window=EMAIL_DIGEST_WINDOW,
+                **{name: histogram.to_dict() for name, histogram in self.histograms.items()},
+            )
+
+
+# Shared sender started with the app
+email_sender = EmailSender()
@@ -0,0 +1,188 @@
+# Backend/controllers/event_broker.py
+
+import asyncio
+import os
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+
+# Push channel settings
+STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "100"))  # Events buffered per subscriber
+STREAM_HISTORY = int(os.getenv("STREAM_HISTORY", "50"))  # Events kept per channel for Last-Event-ID replay
+
+BROADCAST = "all"  # Channel every subscriber listens to (new events and meetings)
+
+
+def user_channel(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+class Broker(ABC):
+    """
+    Publish/subscribe interface of the push channel. Routes publish after
+    committing a change; routes/stream_routes.py relays a subscription to the
+    client. InProcessBroker serves a single node; a multi-node deployment can
+    implement the same methods on top of Redis or Postgres LISTEN/NOTIFY.
+    Event ids are strings sent as the SSE id and must stay unique across
+    restarts, since clients send the last one back as Last-Event-ID.
+    """
+
+    @abstractmethod
+    def publish(self, channel: str, event_type: str, data: dict):
+        """Send an event to the subscribers of `channel`"""
+
+    @abstractmethod
+    def subscribe(self, channels, last_event_id: str = None) -> "Subscription":
+        """Subscription to `channels`, starting after `last_event_id` when given"""
+
+    @abstractmethod
+    def close_all(self):
+        """End every open subscription (app shutdown)"""
+
+    @abstractmethod
+    def snapshot(self) -> dict:
+        """Counters for /api/admin/stream-stats"""
+
+
+class Subscription:
+    """Events of some channels for one client, read with `await next_event()`"""
+
+    def __init__(self, broker, channels, size: int):
+        self.broker = broker
+        self.channels = tuple(channels)
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=size)
+        self.closed = False
+
+    def _deliver(self, event):
+        """Runs on the subscriber's event loop"""
+        if self.closed:
+            return
+        if self.queue.full():
+            # Slow client: drop what it has not read and tell it to refetch instead
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"id": event["id"], "seq": event["seq"], "type": "resync", "data": {}})
+            self.broker._count("dropped")
+            return
+        self.queue.put_nowait(event)
+        self.broker._count("delivered")
+
+    async def next_event(self, timeout: float):
+        """Next event, or None after `timeout` seconds or once closed"""
+        if self.closed:
+            return None
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.broker._unsubscribe(self)
+        if not self.queue.full():
+            self.queue.put_nowait(None)  # Wake a reader waiting in next_event
+
+
+class InProcessBroker(Broker):
+    """
+    Fan events out to the subscribers of this process. Every event gets an id
+    "<boot id>-<sequence>", the boot id being random per process; the last
+    STREAM_HISTORY events of each channel are kept so a reconnecting client
+    (Last-Event-ID) gets what it missed, or a "resync" event when that has
+    already been evicted or the id comes from before a restart.
+    """
+
+    def __init__(self, queue_size: int = STREAM_QUEUE_SIZE, history: int = STREAM_HISTORY):
+        self.queue_size = queue_size
+        self.history_size = history
+        self._lock = threading.Lock()
+        self.boot_id = uuid.uuid4().hex[:12]
+        self._seq = 0
+        self._subscribers = {}  # channel -> set of Subscription
+        self._history = {}  # channel -> deque of recent events
+        self._evicted = {}  # channel -> sequence of the newest event dropped from its history
+        self.stats = {"published": 0, "delivered": 0, "dropped": 0, "subscribed": 0}
+
+    def _count(self, key: str, n: int = 1):
+        with self._lock:
+            self.stats[key] += n
+
+    def publish(self, channel: str, event_type: str, data: dict):
+        with self._lock:
+            self._seq += 1
+            event = {"id": self._event_id(self._seq), "seq": self._seq, "type": event_type, "data": data}
+            history = self._history.setdefault(channel, deque(maxlen=self.history_size))
+            if len(history) == history.maxlen:
+                self._evicted[channel] = history[0]["seq"]
+            history.append(event)
+            subscribers = list(self._subscribers.get(channel, ()))
+            self.stats["published"] += 1
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None  # Called from a worker thread
+        for subscription in subscribers:
+            if subscription.loop is loop:
+                subscription._deliver(event)
+            else:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+
+    def _event_id(self, seq: int) -> str:
+        return f"{self.boot_id}-{seq}"
+
+    def _parse_event_id(self, event_id: str):
+        """Sequence of an id issued by this process, None for any other id"""
+        boot_id, _, seq = event_id.rpartition("-")
+        return int(seq) if boot_id == self.boot_id and seq.isdigit() else None
+
+    def subscribe(self, channels, last_event_id: str = None) -> Subscription:
+        subscription = Subscription(self, channels, self.queue_size)
+        with self._lock:
+            for channel in subscription.channels:
+                self._subscribers.setdefault(channel, set()).add(subscription)
+            self.stats["subscribed"] += 1
+            if not last_event_id:
+                return subscription
+            last_seq = self._parse_event_id(last_event_id)
+            if last_seq is None or any(self._evicted.get(channel, 0) > last_seq for channel in subscription.channels):
+                # Events before a restart (or evicted ones) cannot be replayed
+                missed = [{"id": self._event_id(self._seq), "seq": self._seq, "type": "resync", "data": {}}]
+            else:
+                missed = sorted(
+                    (event for channel in subscription.channels for event in self._history.get(channel, ())
+                     if event["seq"] > last_seq),
+                    key=lambda event: event["seq"],
+                )
+        for event in missed[-self.queue_size:]:
+            subscription.queue.put_nowait(event)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._subscribers.get(channel)
+                if subscribers:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[channel]
+
+    def close_all(self):
+        """End every open stream (app shutdown)"""
+        with self._lock:
+            subscriptions = {s for subscribers in self._subscribers.values() for s in subscribers}
+        for subscription in subscriptions:
+            subscription.loop.call_soon_threadsafe(subscription.close)
+
+    def snapshot(self):
+        with self._lock:
+            subscriptions = {s for subscribers in self._subscribers.values() for s in subscribers}
+            return dict(self.stats, subscribers=len(subscriptions), channels=len(self._subscribers),
+                        boot_id=self.boot_id, last_event_id=self._event_id(self._seq))
+
+
+# Shared broker of this process
+event_broker = InProcessBroker()
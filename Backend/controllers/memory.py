@@ -0,0 +1,112 @@
+# Backend/controllers/memory.py
+
+import threading
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.chat_message import ChatMessage
+
+# Conversation memory settings
+_RECENT_TURNS = 6  # Messages kept verbatim in the prompt
+_FOLD_BATCH = 20  # Max older messages folded into the summary per query
+_TOKEN_BUDGET = 350  # Approximate token budget for the whole history block
+_SUMMARY_TOKEN_BUDGET = 120  # Part of the budget reserved for the rolling summary
+_CHARS_PER_TOKEN = 4  # Rough estimate used for budgeting without a tokenizer
+_SNIPPET_CHARS = 140  # Max chars kept per message in the summary
+_FOLLOW_UP_MAX_WORDS = 6  # Short messages are treated as follow-ups
+
+# Rolling summaries per chat session: {session_id: {'summary': [...], 'upto_id': int}}
+_SESSION_MEMORY = {}
+_MEMORY_LOCK = threading.Lock()
+_MEMORY_MAX_SESSIONS = 2000
+
+
+def _estimate_tokens(text: str) -> int:
+    return (len(text) + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+
+
+def _snippet(text: str) -> str:
+    """First sentence of a message, clipped for the summary"""
+    text = " ".join(text.split())
+    for mark in (". ", "? ", "! "):
+        pos = text.find(mark)
+        if 0 < pos < _SNIPPET_CHARS:
+            return text[:pos + 1]
+    if len(text) > _SNIPPET_CHARS:
+        return text[:_SNIPPET_CHARS].rsplit(" ", 1)[0] + "..."
+    return text
+
+
+def _fold(summary: list, sender: str, message: str):
+    """Append an older message to the summary, dropping the oldest lines over budget"""
+    label = "Guest asked" if sender == "user" else "Assistant answered"
+    summary.append(f"{label}: {_snippet(message)}")
+    while len(summary) > 1 and _estimate_tokens("\n".join(summary)) > _SUMMARY_TOKEN_BUDGET:
+        summary.pop(0)
+
+
+async def load_conversation_memory(db: AsyncSession, session_id: int):
+    """
+    Build the conversation history for a chat session.
+    Returns (history_text, last_user_message). Only messages newer than the
+    already summarized ones are loaded, in a single query on session_id.
+    """
+    with _MEMORY_LOCK:
+        state = _SESSION_MEMORY.get(session_id)
+        upto_id = state['upto_id'] if state else 0
+        summary = list(state['summary']) if state else []
+
+    result = await db.execute(
+        select(ChatMessage.id, ChatMessage.sender, ChatMessage.message)
+        .where(ChatMessage.session_id == session_id, ChatMessage.id > upto_id)
+        .order_by(desc(ChatMessage.timestamp), desc(ChatMessage.id))
+        .limit(_RECENT_TURNS + _FOLD_BATCH)
+    )
+    rows = result.all()
+    rows.reverse()  # Chronological order
+
+    # Everything before the recent window is folded into the rolling summary
+    older, recent = rows[:-_RECENT_TURNS], rows[-_RECENT_TURNS:]
+    for row in older:
+        _fold(summary, row.sender, row.message)
+        upto_id = row.id
+
+    if older or state is None:
+        with _MEMORY_LOCK:
+            if session_id not in _SESSION_MEMORY and len(_SESSION_MEMORY) >= _MEMORY_MAX_SESSIONS:
+                # Evict an arbitrary old entry; it is rebuilt from the DB if needed
+                _SESSION_MEMORY.pop(next(iter(_SESSION_MEMORY)))
+            _SESSION_MEMORY[session_id] = {'summary': summary, 'upto_id': upto_id}
+
+    # Keep the newest turns that fit in the remaining budget
+    budget = _TOKEN_BUDGET - _estimate_tokens("\n".join(summary))
+    turns = []
+    for row in reversed(recent):
+        speaker = "Guest" if row.sender == "user" else "Assistant"
+        line = f"{speaker}: {' '.join(row.message.split())}"
+        cost = _estimate_tokens(line)
+        if cost > budget:
+            if not turns:
+                # Always keep at least part of the latest turn
+                turns.append(line[:max(budget, 0) * _CHARS_PER_TOKEN].rstrip() + "...")
+            break
+        turns.append(line)
+        budget -= cost
+    turns.reverse()
+
+    parts = []
+    if summary:
+        parts.append("Earlier in this conversation:\n" + "\n".join(summary))
+    if turns:
+        parts.append("\n".join(turns))
+    history = "\n\n".join(parts)
+
+    last_user_message = next((row.message for row in reversed(recent) if row.sender == "user"), None)
+    return history, last_user_message
+
+
+def build_retrieval_query(message: str, last_user_message: str = None) -> str:
+    """Expand short follow-up questions with the previous guest question for retrieval"""
+    if last_user_message and len(message.split()) <= _FOLLOW_UP_MAX_WORDS:
+        return f"{last_user_message} {message}"
+    return message
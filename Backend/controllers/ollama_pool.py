@@ -0,0 +1,197 @@
+# Backend/controllers/ollama_pool.py
+
+import random
+import threading
+import time
+import requests
+
+from config.ollama_config import (
+    OLLAMA_HOSTS,
+    OLLAMA_CONNECT_TIMEOUT,
+    OLLAMA_READ_TIMEOUT,
+    OLLAMA_HEALTH_INTERVAL,
+    OLLAMA_HEALTH_TIMEOUT,
+    OLLAMA_MAX_FAILURES,
+)
+
+_TPS_SMOOTHING = 0.3  # Weight of the newest tokens/sec sample in the moving average
+
+
+class NoBackendAvailable(Exception):
+    """Raised when every Ollama instance is drained or unreachable"""
+
+
+class OllamaBackend:
+    def __init__(self, url: str, weight: float = 1.0):
+        self.url = url.rstrip("/")
+        self.weight = weight
+        self.in_flight = 0
+        self.tokens_per_sec = None  # Moving average from eval_count / eval_duration
+        self.healthy = True
+        self.failures = 0
+        self.last_check = None
+        self.last_error = None
+        self.requests = 0
+
+    def score(self, default_tps: float) -> float:
+        tps = self.tokens_per_sec or default_tps
+        return self.weight * tps / (1 + self.in_flight)
+
+    def to_dict(self):
+        return {
+            "url": self.url,
+            "weight": self.weight,
+            "healthy": self.healthy,
+            "in_flight": self.in_flight,
+            "tokens_per_sec": round(self.tokens_per_sec, 2) if self.tokens_per_sec else None,
+            "failures": self.failures,
+            "requests": self.requests,
+            "last_check": self.last_check,
+            "last_error": self.last_error,
+        }
+
+
+class OllamaPool:
+    """Spread generations across several Ollama instances.
+
+    Instances are picked by weight x observed tokens/sec divided by their
+    in-flight count. An instance failing OLLAMA_MAX_FAILURES times in a row
+    is drained until a health check on /api/tags succeeds again.
+    """
+
+    def __init__(self, hosts):
+        self.backends = []
+        for host in hosts:
+            url, _, weight = host.partition("|")
+            self.backends.append(OllamaBackend(url, float(weight) if weight else 1.0))
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._health_thread = None
+
+    # --- Selection ---
+
+    def _acquire(self, exclude=()):
+        with self._lock:
+            candidates = [b for b in self.backends if b.healthy and b not in exclude]
+            if not candidates:
+                raise NoBackendAvailable("No healthy Ollama instance available")
+            known = [b.tokens_per_sec for b in candidates if b.tokens_per_sec]
+            default_tps = sum(known) / len(known) if known else 1.0
+            best_score = max(b.score(default_tps) for b in candidates)
+            # Random choice among equally good instances avoids always hitting the first one
+            best = [b for b in candidates if b.score(default_tps) >= best_score * 0.999]
+            backend = random.choice(best)
+            backend.in_flight += 1
+            backend.requests += 1
+            return backend
+
+    def _release(self, backend, ok: bool, error: str = None, tokens_per_sec: float = None):
+        with self._lock:
+            backend.in_flight -= 1
+            if ok:
+                backend.failures = 0
+                if tokens_per_sec:
+                    if backend.tokens_per_sec is None:
+                        backend.tokens_per_sec = tokens_per_sec
+                    else:
+                        backend.tokens_per_sec += _TPS_SMOOTHING * (tokens_per_sec - backend.tokens_per_sec)
+            else:
+                backend.failures += 1
+                backend.last_error = error
+                if backend.failures >= OLLAMA_MAX_FAILURES and backend.healthy:
+                    backend.healthy = False
+                    print(f"[DEBUG] Draining Ollama instance {backend.url}: {error}")
+
+    # --- Requests ---
+
+    def generate(self, payload: dict):
+        """POST /api/generate on the best instance, failing over to the others.
+        Returns (response, backend_url)."""
+        tried = []
+        last_error = None
+        while len(tried) < len(self.backends):
+            try:
+                backend = self._acquire(exclude=tried)
+            except NoBackendAvailable:
+                break
+            tried.append(backend)
+            try:
+                response = requests.post(
+                    f"{backend.url}/api/generate",
+                    json=payload,
+                    timeout=(OLLAMA_CONNECT_TIMEOUT, OLLAMA_READ_TIMEOUT),
+                )
+            except requests.RequestException as e:
+                last_error = str(e)
+                self._release(backend, ok=False, error=last_error)
+                continue
+
+            if response.status_code >= 500:
+                last_error = f"HTTP {response.status_code}"
+                self._release(backend, ok=False, error=last_error)
+                continue
+
+            tokens_per_sec = None
+            if response.status_code == 200 and not payload.get("stream"):
+                try:
+                    data = response.json()
+                    if data.get("eval_count") and data.get("eval_duration"):
+                        tokens_per_sec = data["eval_count"] / (data["eval_duration"] / 1e9)
+                except ValueError:
+                    pass
+            self._release(backend, ok=True, tokens_per_sec=tokens_per_sec)
+            return response, backend.url
+
+        raise NoBackendAvailable(last_error or "No healthy Ollama instance available")
+
+    # --- Health checks ---
+
+    def check_health(self):
+        """Probe every instance once; drained instances come back when they answer"""
+        for backend in self.backends:
+            try:
+                response = requests.get(f"{backend.url}/api/tags", timeout=OLLAMA_HEALTH_TIMEOUT)
+                ok = response.status_code == 200
+                error = None if ok else f"HTTP {response.status_code}"
+            except requests.RequestException as e:
+                ok, error = False, str(e)
+            with self._lock:
+                backend.last_check = time.time()
+                if ok:
+                    if not backend.healthy:
+                        print(f"[DEBUG] Ollama instance {backend.url} is back in rotation")
+                    backend.healthy = True
+                    backend.failures = 0
+                else:
+                    backend.last_error = error
+                    if backend.healthy:
+                        print(f"[DEBUG] Draining Ollama instance {backend.url}: {error}")
+                    backend.healthy = False
+        return self.is_available()
+
+    def _health_loop(self):
+        while not self._stop.wait(OLLAMA_HEALTH_INTERVAL):
+            self.check_health()
+
+    def start_health_checks(self):
+        if self._health_thread and self._health_thread.is_alive():
+            return
+        self._stop.clear()
+        self.check_health()
+        self._health_thread = threading.Thread(target=self._health_loop, name="ollama-health", daemon=True)
+        self._health_thread.start()
+
+    def stop_health_checks(self):
+        self._stop.set()
+
+    def is_available(self) -> bool:
+        with self._lock:
+            return any(b.healthy for b in self.backends)
+
+    def status(self):
+        with self._lock:
+            return [b.to_dict() for b in self.backends]
+
+
+# Shared pool used by the chat endpoints
+ollama_pool = OllamaPool(OLLAMA_HOSTS)
@@ -0,0 +1,108 @@
+# Backend/controllers/password_hasher.py
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from fastapi import HTTPException
+
+from config.auth_config import PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING
+from controllers.telemetry import Histogram
+from utils import password
+
+_HASH_MS_BOUNDS = [10, 25, 50, 100, 200, 300, 500, 750, 1000, 2000, 5000]
+
+
+class PasswordHasher:
+    """Run bcrypt in a bounded process pool.
+
+    Hashing holds the GIL for hundreds of milliseconds per call, so it runs in
+    PASSWORD_HASH_WORKERS separate processes instead of the API threadpool. At
+    most PASSWORD_HASH_MAX_PENDING jobs wait for a worker; further requests get
+    a 503 immediately rather than queueing behind a login storm.
+    """
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_MAX_PENDING):
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self._executor = None
+        self._lock = threading.Lock()
+        self.in_flight = 0  # Running or waiting for a worker
+        self.max_in_flight = 0
+        self.rejected = 0
+        self.histograms = {
+            "hash_ms": Histogram(_HASH_MS_BOUNDS),  # Time spent in bcrypt
+            "verify_ms": Histogram(_HASH_MS_BOUNDS),
+            "queue_wait_ms": Histogram(_HASH_MS_BOUNDS),  # Time waiting for a free worker
+        }
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def start(self):
+        """Start the worker processes now instead of on the first login"""
+        executor = self._get_executor()
+        for future in [executor.submit(password.warm_up) for _ in range(self.workers)]:
+            future.result()
+
+    def stop(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, operation: str, *args):
+        with self._lock:
+            if self.in_flight >= self.workers + self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=503,
+                    detail="Too many sign-in requests, please retry shortly",
+                    headers={"Retry-After": "1"},
+                )
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result, hash_ms = await loop.run_in_executor(self._get_executor(), password.run_timed, operation, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed by the OOM killer); start a fresh pool next time
+            self.stop()
+            raise HTTPException(status_code=503, detail="Password service unavailable, please retry")
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+        total_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.histograms[f"{operation}_ms"].observe(hash_ms)
+            self.histograms["queue_wait_ms"].observe(max(total_ms - hash_ms, 0))
+        return result
+
+    async def hash(self, plain: str) -> str:
+        return await self._run("hash", plain)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return await self._run("verify", plain, hashed)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "in_flight": self.in_flight,
+                "queue_depth": max(self.in_flight - self.workers, 0),
+                "max_in_flight": self.max_in_flight,
+                "rejected": self.rejected,
+                "histograms": {name: h.to_dict() for name, h in self.histograms.items()},
+            }
+
+
+# Shared hasher used by the auth controllers
+password_hasher = PasswordHasher()
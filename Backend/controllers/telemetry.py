@@ -0,0 +1,157 @@
+# Backend/controllers/telemetry.py
+
+import bisect
+import threading
+import time
+from collections import deque
+
+_NS_PER_MS = 1e6
+
+
+class Histogram:
+    """Fixed-bucket histogram with approximate percentiles"""
+
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # Last bucket is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, q: float):
+        """Upper bound of the bucket holding the q-th percentile (max for the +Inf bucket)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 2) if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": [
+                {"le": bound, "count": c} for bound, c in zip(self.bounds + ["+Inf"], self.counts)
+            ],
+        }
+
+
+_MS_BOUNDS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000]
+_TOKEN_BOUNDS = [16, 32, 64, 128, 256, 512, 1024, 2048, 4096]
+_TPS_BOUNDS = [1, 2, 5, 10, 15, 20, 30, 50, 75, 100, 200]
+_CHAR_BOUNDS = [250, 500, 1000, 1500, 2000, 3000, 4000, 8000]
+
+
+class GenerationTelemetry:
+    """Aggregates per-generation timings reported by Ollama plus retrieval cost"""
+
+    def __init__(self, recent_size: int = 50):
+        self._lock = threading.Lock()
+        self._recent_size = recent_size
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self.histograms = {
+                "prompt_tokens": Histogram(_TOKEN_BOUNDS),
+                "eval_tokens": Histogram(_TOKEN_BOUNDS),
+                "tokens_per_sec": Histogram(_TPS_BOUNDS),
+                "time_to_first_token_ms": Histogram(_MS_BOUNDS),
+                "load_ms": Histogram(_MS_BOUNDS),
+                "prompt_eval_ms": Histogram(_MS_BOUNDS),
+                "eval_ms": Histogram(_MS_BOUNDS),
+                "generation_ms": Histogram(_MS_BOUNDS),
+                "retrieval_ms": Histogram(_MS_BOUNDS),
+                "context_chars": Histogram(_CHAR_BOUNDS),
+            }
+            self.outcomes = {}  # model / extractive / error counts
+            self.backends = {}  # generations per Ollama instance
+            self.recent = deque(maxlen=self._recent_size)
+
+    def record_outcome(self, outcome: str, retrieval_ms: float = None, context_chars: int = None):
+        """Count a request that did not produce model timings (extractive answer, error)"""
+        with self._lock:
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+            if retrieval_ms is not None:
+                self.histograms["retrieval_ms"].observe(retrieval_ms)
+            if context_chars is not None:
+                self.histograms["context_chars"].observe(context_chars)
+
+    def record_generation(self, data: dict, generation_ms: float, retrieval_ms: float = None,
+                          context_chars: int = None, backend: str = None, model: str = None):
+        """Record one /api/generate response. Durations from Ollama are in nanoseconds."""
+        prompt_tokens = data.get("prompt_eval_count") or 0
+        eval_tokens = data.get("eval_count") or 0
+        load_ms = (data.get("load_duration") or 0) / _NS_PER_MS
+        prompt_eval_ms = (data.get("prompt_eval_duration") or 0) / _NS_PER_MS
+        eval_ms = (data.get("eval_duration") or 0) / _NS_PER_MS
+        tokens_per_sec = eval_tokens / (eval_ms / 1000) if eval_ms else None
+        # Without streaming, the first token is produced once the model is loaded
+        # and the prompt evaluated
+        ttft_ms = load_ms + prompt_eval_ms
+
+        sample = {
+            "at": time.time(),
+            "backend": backend,
+            "model": model or data.get("model"),
+            "prompt_tokens": prompt_tokens,
+            "eval_tokens": eval_tokens,
+            "tokens_per_sec": round(tokens_per_sec, 2) if tokens_per_sec else None,
+            "time_to_first_token_ms": round(ttft_ms, 1),
+            "load_ms": round(load_ms, 1),
+            "generation_ms": round(generation_ms, 1),
+            "retrieval_ms": round(retrieval_ms, 1) if retrieval_ms is not None else None,
+            "context_chars": context_chars,
+        }
+
+        with self._lock:
+            h = self.histograms
+            h["prompt_tokens"].observe(prompt_tokens)
+            h["eval_tokens"].observe(eval_tokens)
+            if tokens_per_sec:
+                h["tokens_per_sec"].observe(tokens_per_sec)
+            h["time_to_first_token_ms"].observe(ttft_ms)
+            h["load_ms"].observe(load_ms)
+            h["prompt_eval_ms"].observe(prompt_eval_ms)
+            h["eval_ms"].observe(eval_ms)
+            h["generation_ms"].observe(generation_ms)
+            if retrieval_ms is not None:
+                h["retrieval_ms"].observe(retrieval_ms)
+            if context_chars is not None:
+                h["context_chars"].observe(context_chars)
+            self.outcomes["model"] = self.outcomes.get("model", 0) + 1
+            if backend:
+                self.backends[backend] = self.backends.get(backend, 0) + 1
+            self.recent.append(sample)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "since": self.started_at,
+                "outcomes": dict(self.outcomes),
+                "backends": dict(self.backends),
+                "histograms": {name: h.to_dict() for name, h in self.histograms.items()},
+                "recent": list(self.recent),
+            }
+
+
+# Shared telemetry for the chat endpoints
+generation_telemetry = GenerationTelemetry()
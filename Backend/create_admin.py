@@ -1,17 +1,9 @@
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
-from config.database import Base, SQLALCHEMY_DATABASE_URL
+from config.database import Base, engine, SessionLocal
 from models.user import User
 from models.user_activity import UserActivity
 from passlib.context import CryptContext
-import os
 
-# Ensure the database directory exists
-os.makedirs('instance', exist_ok=True)
-
-# Initialize database connection
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Database connection (URL and profile from config/database.py)
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
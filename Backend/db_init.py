@@ -3,17 +3,21 @@
 from config.database import engine, Base
 from models.user import User
 
-from models.user_activity import UserActivity
+from models.user_activity import UserActivity, UserActivityDaily
 from models.chat_message import ChatMessage
 from models.chat_session import ChatSession
-from models.employee_data import Task, Event, Meeting
+from models.employee_data import Task, Event, Meeting, RSVP
+from models.email_outbox import EmailOutbox
+from models.data_version import DataVersion
+from controllers.chat_search import install_fts
 
 def init_db():
     """Initialize database with all tables"""
     print("Creating database tables...")
     Base.metadata.create_all(bind=engine)
+    install_fts(engine)  # Full-text index of chat messages (SQLite only)
     print("Database initialized successfully!")
-    print("Tables created: users, user_activities, chat_sessions, chat_messages, tasks, events, meetings")
+    print("Tables created: users, user_activities, user_activity_daily, chat_sessions, chat_messages, tasks, events, meetings, rsvps, email_outbox, data_versions, chat_messages_fts")
 
 if __name__ == "__main__":
     init_db()
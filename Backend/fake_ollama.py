@@ -0,0 +1,219 @@
+# Backend/fake_ollama.py
+# Deterministic local stand-in for an Ollama server, for testing without a model.
+#
+#   python fake_ollama.py --port 11435 --token-rate 30 --fail-rate 0.05
+#   OLLAMA_HOSTS="http://localhost:11434,http://localhost:11435" python main.py
+#
+# Implements /api/tags and /api/generate (streaming and non-streaming) and
+# reports the same timing fields as Ollama. Replies are derived from the prompt
+# so the same prompt always gets the same answer.
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_WORDS = (
+    "our concierge team will gladly help with that request during your stay at "
+    "the palace please contact reception for details about hours bookings and "
+    "availability as schedules may vary by season"
+).split()
+
+
+def _reply_for(prompt: str, tokens: int) -> list:
+    """Deterministic list of words for a prompt"""
+    seed = int(hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8], 16)
+    rng = random.Random(seed)
+    return [rng.choice(_WORDS) for _ in range(tokens)]
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    server_version = "FakeOllama/0.2"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, body: dict):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _inject_failure(self) -> bool:
+        """Apply the configured failure mode; True when the request was failed"""
+        server = self.server
+        if server.down:
+            self._send_json(503, {"error": "server is down"})
+            return True
+        if server.should_fail(server.drop_rate):
+            # Drop the connection without answering
+            self.close_connection = True
+            self.connection.close()
+            return True
+        if server.should_fail(server.fail_rate):
+            self._send_json(500, {"error": "injected failure"})
+            return True
+        return False
+
+    def do_GET(self):
+        self.server.count("tags")
+        if self.path != "/api/tags":
+            self._send_json(404, {"error": "not found"})
+            return
+        if self.server.down:
+            self._send_json(503, {"error": "server is down"})
+            return
+        self._send_json(200, {"models": [{"name": f"{self.server.model}:latest"}]})
+
+    def do_POST(self):
+        if self.path != "/api/generate":
+            self._send_json(404, {"error": "not found"})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        self.server.count("generate")
+        if self._inject_failure():
+            self.server.count("failed")
+            return
+
+        server = self.server
+        prompt = payload.get("prompt", "")
+        options = payload.get("options") or {}
+        tokens = min(int(options.get("num_predict", server.tokens)), server.tokens)
+        words = _reply_for(prompt, tokens)
+        prompt_tokens = len(prompt.split())
+
+        started = time.perf_counter_ns()
+        load_ns = 0
+        if server.load_time and not server.loaded:
+            # First request after start pays the model load time
+            time.sleep(server.load_time)
+            load_ns = int(server.load_time * 1e9)
+            server.loaded = True
+        prompt_eval_s = server.latency + prompt_tokens / server.prompt_rate
+        time.sleep(prompt_eval_s)
+        per_token = 1.0 / server.token_rate
+
+        timings = {
+            "load_duration": load_ns,
+            "prompt_eval_count": prompt_tokens,
+            "prompt_eval_duration": int(prompt_eval_s * 1e9),
+            "eval_count": len(words),
+            "eval_duration": int(len(words) * per_token * 1e9),
+        }
+        model = payload.get("model", server.model)
+
+        if payload.get("stream", True):
+            # Ollama streams NDJSON chunks, one token per line, then a final summary
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i, word in enumerate(words):
+                time.sleep(per_token)
+                chunk = {"model": model, "response": word if i == 0 else " " + word, "done": False}
+                self._write_chunk(json.dumps(chunk) + "\n")
+            final = {"model": model, "response": "", "done": True,
+                     "total_duration": time.perf_counter_ns() - started, **timings}
+            self._write_chunk(json.dumps(final) + "\n")
+            self._write_chunk("")
+        else:
+            time.sleep(len(words) * per_token)
+            self._send_json(200, {
+                "model": model,
+                "response": " ".join(words).capitalize() + ".",
+                "done": True,
+                "total_duration": time.perf_counter_ns() - started,
+                **timings,
+            })
+
+    def _write_chunk(self, text: str):
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+class FakeOllamaServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency=0.05, token_rate=50.0, prompt_rate=2000.0, tokens=32,
+                 load_time=0.0, fail_rate=0.0, drop_rate=0.0, seed=0, model="mistral", verbose=False):
+        super().__init__(address, FakeOllamaHandler)
+        self.latency = latency
+        self.token_rate = token_rate
+        self.prompt_rate = prompt_rate
+        self.tokens = tokens
+        self.load_time = load_time
+        self.loaded = False
+        self.fail_rate = fail_rate
+        self.drop_rate = drop_rate
+        self.down = False  # Toggle to simulate an outage
+        self.model = model
+        self.verbose = verbose
+        self.name = f"fake-ollama:{self.server_address[1]}"
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"tags": 0, "generate": 0, "failed": 0}
+
+    def handle_error(self, request, client_address):
+        # Dropped connections are expected with failure injection
+        if self.verbose:
+            super().handle_error(request, client_address)
+
+    def should_fail(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self._rng.random() < rate
+
+    def count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+
+def make_server(host: str = "127.0.0.1", port: int = 11435, **options):
+    """Create a fake server; port 0 picks a free port (see server.server_address)"""
+    return FakeOllamaServer((host, port), **options)
+
+
+def start_in_thread(host: str = "127.0.0.1", port: int = 0, **options):
+    """Start a fake server in a daemon thread and return it with its base URL"""
+    server = make_server(host, port, **options)
+    threading.Thread(target=server.serve_forever, name=server.name, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake Ollama server for local testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--latency", type=float, default=0.05, help="Fixed seconds before the first token")
+    parser.add_argument("--token-rate", type=float, default=50.0, help="Generated tokens per second")
+    parser.add_argument("--prompt-rate", type=float, default=2000.0, help="Prompt tokens evaluated per second")
+    parser.add_argument("--tokens", type=int, default=32, help="Max tokens per reply")
+    parser.add_argument("--load-time", type=float, default=0.0, help="Seconds added to the first generation")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Probability of an HTTP 500")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Probability of a dropped connection")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--model", default="mistral")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    server = make_server(
+        args.host, args.port,
+        latency=args.latency, token_rate=args.token_rate, prompt_rate=args.prompt_rate,
+        tokens=args.tokens, load_time=args.load_time, fail_rate=args.fail_rate,
+        drop_rate=args.drop_rate, seed=args.seed, model=args.model, verbose=args.verbose,
+    )
+    print(f"Fake Ollama listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,136 @@
+# Backend/fake_smtp.py
+# Local stand-in for an SMTP server, for testing email delivery without Gmail.
+#
+#   python fake_smtp.py --port 2525 --fail-rate 0.1
+#   SMTP_HOST=127.0.0.1 SMTP_PORT=2525 SMTP_SECURITY=none python main.py
+#
+# Speaks enough plain SMTP for smtplib (EHLO/HELO, AUTH PLAIN/LOGIN, MAIL, RCPT,
+# DATA, RSET, NOOP, QUIT), accepts any credentials and keeps received messages in
+# memory. Can add latency, reject messages and drop connections to exercise
+# retries and reconnects.
+
+import argparse
+import random
+import socketserver
+import threading
+import time
+
+
+class FakeSMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line: str):
+        self.wfile.write((line + "\r\n").encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.stats["connections"] += 1
+        self.reply(f"220 {server.hostname} FakeSMTP ready")
+        sender, recipients, sent_on_connection = None, [], 0
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            line = raw.decode("utf-8", "replace").rstrip("\r\n")
+            command = line.split(" ", 1)[0].upper()
+            if command in ("EHLO", "HELO"):
+                if command == "EHLO":
+                    self.reply(f"250-{server.hostname}")
+                    self.reply("250-AUTH PLAIN LOGIN")
+                    self.reply("250 8BITMIME")
+                else:
+                    self.reply(f"250 {server.hostname}")
+            elif command == "AUTH":
+                parts = line.split()
+                if len(parts) == 2 and parts[1].upper() == "LOGIN":
+                    self.reply("334 VXNlcm5hbWU6")
+                    self.rfile.readline()
+                    self.reply("334 UGFzc3dvcmQ6")
+                    self.rfile.readline()
+                elif len(parts) == 2:
+                    self.reply("334 ")
+                    self.rfile.readline()
+                with server.lock:
+                    server.stats["logins"] += 1
+                self.reply("235 Authentication successful")
+            elif command == "MAIL":
+                sender, recipients = line.split(":", 1)[1].strip(" <>"), []
+                self.reply("250 OK")
+            elif command == "RCPT":
+                recipients.append(line.split(":", 1)[1].strip(" <>"))
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                while True:
+                    data = self.rfile.readline()
+                    if not data or data in (b".\r\n", b".\n"):
+                        break
+                    lines.append(data[1:] if data.startswith(b"..") else data)
+                if server.latency:
+                    time.sleep(server.latency)
+                if server.rng.random() < server.fail_rate:
+                    with server.lock:
+                        server.stats["rejected"] += 1
+                    self.reply("451 Temporary failure, try again later")
+                    continue
+                with server.lock:
+                    server.messages.append({
+                        "from": sender, "to": recipients, "data": b"".join(lines).decode("utf-8", "replace"),
+                    })
+                    server.stats["messages"] += 1
+                self.reply("250 OK queued")
+                sent_on_connection += 1
+                if server.drop_after and sent_on_connection >= server.drop_after:
+                    return  # Hang up without QUIT, like a server closing idle/overused connections
+            elif command == "RSET":
+                sender, recipients = None, []
+                self.reply("250 OK")
+            elif command == "NOOP":
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, latency=0.0, fail_rate=0.0, drop_after=0, seed=0):
+        super().__init__(address, FakeSMTPHandler)
+        self.hostname = "fake-smtp.local"
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.drop_after = drop_after  # Close the connection after this many messages (0 = never)
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.messages = []
+        self.stats = {"connections": 0, "logins": 0, "messages": 0, "rejected": 0}
+
+
+def start_in_thread(host: str = "127.0.0.1", port: int = 0, **options):
+    """Start a fake server in a daemon thread and return it with its port"""
+    server = FakeSMTPServer((host, port), **options)
+    threading.Thread(target=server.serve_forever, name="fake-smtp", daemon=True).start()
+    return server, server.server_address[1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake SMTP server for local testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2525)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per accepted message")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Probability of a 451 on DATA")
+    parser.add_argument("--drop-after", type=int, default=0, help="Hang up after N messages per connection")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = FakeSMTPServer((args.host, args.port), latency=args.latency, fail_rate=args.fail_rate,
+                            drop_after=args.drop_after, seed=args.seed)
+    print(f"Fake SMTP listening on {args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
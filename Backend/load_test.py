@@ -0,0 +1,286 @@
+# Backend/load_test.py
+# End-to-end load test of the chat pipeline against fake Ollama instances.
+#
+#   python load_test.py --users 50 --messages 10 --concurrency 25
+#   python load_test.py --backends 2 --fail-rate 0.05 --max-p95 2.0
+#
+# Starts one or more fake Ollama servers (fake_ollama.py) and the full FastAPI
+# app under uvicorn on a throwaway SQLite database, signs up many users and
+# drives POST /api/chat/message concurrently over real HTTP. Prints throughput,
+# latency percentiles, DB statement counts and cache statistics. Exits non-zero
+# when errors or the p95 latency exceed the given limits. Requests issuing more
+# SQL statements than --query-budget fail (utils/query_counter.py), so N+1
+# query regressions show up as errors.
+
+import argparse
+import json
+import os
+import random
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+QUESTIONS = [
+    "What time is check-out?",
+    "How many rooms does the hotel have?",
+    "Tell me about the restaurants and bars",
+    "How big is the ballroom for events?",
+    "Is there a pool with views?",
+    "Can I bring my dog?",
+    "What are the spa opening hours?",
+    "Do you have a kids club?",
+    "and on weekends?",
+    "Can you recommend something to do in Tangier this evening?",
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(sorted_values, q: float):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class DBStats:
+    """Counts SQL statements and their time through engine events"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.statements = 0
+        self.seconds = 0.0
+        self._local = threading.local()
+
+    def attach(self, engine):
+        from sqlalchemy import event
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            self._local.started = time.perf_counter()
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, parameters, context, executemany):
+            elapsed = time.perf_counter() - getattr(self._local, "started", time.perf_counter())
+            with self.lock:
+                self.statements += 1
+                self.seconds += elapsed
+
+
+def start_app(port: int):
+    """Import the app against the current OLLAMA_HOSTS and serve it with uvicorn in a thread"""
+    import uvicorn
+    sys.path.insert(0, BACKEND_DIR)
+    from config.database import engine, async_engine, Base
+    import db_init  # Registers every model on Base
+    Base.metadata.create_all(bind=engine)
+
+    import main
+    config = uvicorn.Config(main.app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, name="uvicorn", daemon=True)
+    thread.start()
+    deadline = time.time() + 15
+    while not server.started:
+        if time.time() > deadline:
+            raise RuntimeError("App did not start in time")
+        time.sleep(0.05)
+    return server, [engine, async_engine.sync_engine]
+
+
+def run(args):
+    from fake_ollama import start_in_thread
+
+    fakes = []
+    urls = []
+    for i in range(args.backends):
+        fake, url = start_in_thread(
+            latency=args.latency, token_rate=args.token_rate, tokens=args.tokens,
+            fail_rate=args.fail_rate, seed=args.seed + i,
+        )
+        fakes.append(fake)
+        urls.append(url)
+    os.environ["OLLAMA_HOSTS"] = ",".join(urls)
+    os.environ["SQL_QUERY_BUDGET"] = str(args.query_budget)
+
+    port = _free_port()
+    server, engines = start_app(port)
+    db_stats = DBStats()
+    for engine in engines:
+        db_stats.attach(engine)
+    base = f"http://127.0.0.1:{port}"
+
+    # --- Sign up users and open one chat session each ---
+    def setup_user(i):
+        http = requests.Session()
+        r = http.post(f"{base}/api/auth/signup", json={
+            "full_name": f"Load Test {i}",
+            "email": f"load{i}@example.com",
+            "password": "LoadTest123!",
+        })
+        r.raise_for_status()
+        http.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+        r = http.post(f"{base}/api/session/new", json={"title": f"Load {i}"})
+        r.raise_for_status()
+        return http, r.json()["id"]
+
+    setup_start = time.time()
+    with ThreadPoolExecutor(max_workers=min(args.concurrency, args.users)) as pool:
+        users = list(pool.map(setup_user, range(args.users)))
+    setup_seconds = time.time() - setup_start
+
+    # --- Drive chat messages ---
+    rng = random.Random(args.seed)
+    jobs = []
+    for i, (http, session_id) in enumerate(users):
+        for _ in range(args.messages):
+            jobs.append((i, rng.choice(QUESTIONS)))
+    rng.shuffle(jobs)
+
+    statements_before = db_stats.statements
+    latencies = []
+    errors = {}
+    max_queries = [0]
+    lock = threading.Lock()
+
+    def send(job):
+        i, question = job
+        http, session_id = users[i]
+        started = time.perf_counter()
+        try:
+            r = http.post(f"{base}/api/chat/message", json={
+                "message": question, "sender": "user", "session_id": session_id,
+            }, timeout=args.timeout)
+            ok = r.status_code == 200
+            key = None if ok else f"HTTP {r.status_code}"
+            queries = int(r.headers.get("X-SQL-Queries", 0))
+        except requests.RequestException as e:
+            ok, key, queries = False, type(e).__name__, 0
+        elapsed = time.perf_counter() - started
+        with lock:
+            max_queries[0] = max(max_queries[0], queries)
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors[key] = errors.get(key, 0) + 1
+
+    run_start = time.time()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(send, jobs))
+    run_seconds = time.time() - run_start
+
+    # --- Report ---
+    from controllers.chat import _RESPONSE_CACHE
+    from controllers.memory import _SESSION_MEMORY
+    from controllers.telemetry import generation_telemetry
+    from controllers.ollama_pool import ollama_pool
+
+    latencies.sort()
+    telemetry = generation_telemetry.snapshot()
+    report = {
+        "users": args.users,
+        "messages": len(jobs),
+        "concurrency": args.concurrency,
+        "setup_seconds": round(setup_seconds, 2),
+        "run_seconds": round(run_seconds, 2),
+        "throughput_rps": round(len(latencies) / run_seconds, 2) if run_seconds else None,
+        "errors": errors,
+        "latency_seconds": {
+            "p50": _percentile(latencies, 0.50),
+            "p95": _percentile(latencies, 0.95),
+            "p99": _percentile(latencies, 0.99),
+            "max": latencies[-1] if latencies else None,
+        },
+        "db": {
+            "statements": db_stats.statements - statements_before,
+            "statements_per_message": round((db_stats.statements - statements_before) / max(len(jobs), 1), 2),
+            "max_statements_per_request": max_queries[0],
+            "query_budget": args.query_budget,
+            "seconds": round(db_stats.seconds, 3),
+        },
+        "cache": {
+            "response_cache_entries": len(_RESPONSE_CACHE),
+            "conversation_memory_sessions": len(_SESSION_MEMORY),
+            "answers": telemetry["outcomes"],
+        },
+        "ollama": {
+            "instances": [
+                {"url": b["url"], "requests": b["requests"], "healthy": b["healthy"]}
+                for b in ollama_pool.status()
+            ],
+            "fake_stats": [fake.stats for fake in fakes],
+            "generation_ms_p95": telemetry["histograms"]["generation_ms"]["p95"],
+        },
+    }
+    for key in ("p50", "p95", "p99", "max"):
+        if report["latency_seconds"][key] is not None:
+            report["latency_seconds"][key] = round(report["latency_seconds"][key], 3)
+
+    server.should_exit = True
+    for fake in fakes:
+        fake.shutdown()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test /api/chat/message against fake Ollama")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--messages", type=int, default=5, help="Messages per user")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--backends", type=int, default=1, help="Number of fake Ollama instances")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--token-rate", type=float, default=200.0)
+    parser.add_argument("--tokens", type=int, default=32)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--query-budget", type=int, default=10, help="Max SQL statements per request")
+    parser.add_argument("--max-p95", type=float, default=None, help="Fail when p95 latency (s) is above")
+    parser.add_argument("--max-errors", type=int, default=0, help="Fail when more requests error")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON only")
+    args = parser.parse_args()
+
+    # Run against a throwaway database
+    workdir = tempfile.mkdtemp(prefix="fairmont-load-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'load_test.db')}"
+    try:
+        report = run(args)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("\n=== Chat load test ===")
+        print(f"Messages: {report['messages']} from {report['users']} users, concurrency {report['concurrency']}")
+        print(f"Throughput: {report['throughput_rps']} msg/s over {report['run_seconds']}s")
+        lat = report["latency_seconds"]
+        print(f"Latency: p50 {lat['p50']}s  p95 {lat['p95']}s  p99 {lat['p99']}s  max {lat['max']}s")
+        print(f"Errors: {report['errors'] or 'none'}")
+        db = report["db"]
+        print(f"DB: {db['statements']} statements ({db['statements_per_message']}/message, max "
+              f"{db['max_statements_per_request']} per request, budget {db['query_budget']}), {db['seconds']}s in SQL")
+        print(f"Cache: {report['cache']}")
+        print(f"Ollama: {report['ollama']}")
+
+    failed = sum(report["errors"].values()) > args.max_errors
+    p95 = report["latency_seconds"]["p95"]
+    if args.max_p95 is not None and (p95 is None or p95 > args.max_p95):
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
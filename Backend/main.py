@@ -6,9 +6,11 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8080,
         reload=True,
-        log_level="debug"
+        log_level="debug",
+        timeout_graceful_shutdown=5,  # Then open /api/stream responses are cancelled
     )
 from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
@@ -22,10 +24,18 @@ from routes.admin_routes import router as admin_router
 from routes.chat_routes import router as chat_router
 from routes.session_routes import router as session_router
 from routes.employee_routes import router as employee_router
+from routes.stream_routes import router as stream_router
 from middleware.auth_middleware import get_current_active_user
 from models.user import User
 from controllers.auth import log_user_activity
-from config.database import get_db
+from controllers.activity_log import activity_writer
+from controllers.activity_rollup import activity_rollup
+from controllers.password_hasher import password_hasher
+from controllers.email_sender import email_sender
+from controllers.event_broker import event_broker
+from config.database import get_db, engine, async_engine
+from utils.pagination import CURSOR_HEADERS
+from utils import query_counter
 
 # Ensure project root is in sys.path for retriever import
 import sys
@@ -34,8 +44,31 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 from retriever import get_context
-
-app = FastAPI()
+from contextlib import asynccontextmanager
+from config.ollama_config import OLLAMA_MODEL
+from controllers.ollama_pool import ollama_pool, NoBackendAvailable
+from controllers.telemetry import generation_telemetry
+import time
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Fork the bcrypt workers first, before the other background threads start
+    password_hasher.start()
+    # Periodic health checks keep failed Ollama instances out of rotation
+    ollama_pool.start_health_checks()
+    activity_writer.start()
+    activity_rollup.start()
+    email_sender.start()
+    yield
+    event_broker.close_all()
+    ollama_pool.stop_health_checks()
+    activity_rollup.stop()
+    email_sender.stop()
+    # Write the activity events still buffered before the process exits
+    activity_writer.stop()
+    password_hasher.stop()
+
+app = FastAPI(lifespan=lifespan)
 
 # Mount static files
 static_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
@@ -49,14 +82,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=CURSOR_HEADERS + ["ETag"],  # Pagination cursors and ETags must be readable by the web app
 )
 
+# SQL statement budget per request (SQL_QUERY_BUDGET=n, used by load tests to catch N+1 queries)
+if query_counter.SQL_QUERY_BUDGET:
+    query_counter.install(engine, async_engine.sync_engine)
+    app.middleware("http")(query_counter.query_budget_middleware)
+
 # Register routers
 app.include_router(auth_router)
 app.include_router(admin_router)
 app.include_router(chat_router)
 app.include_router(session_router)
 app.include_router(employee_router)
+app.include_router(stream_router)
 
 # Serve admin dashboard
 @app.get("/admin", response_class=HTMLResponse)
@@ -82,26 +122,40 @@ async def chat_endpoint(
 ):
     try:
         user_message = req.message
-        context = get_context(user_message)
+        retrieval_start = time.time()
+        # Retrieval and the model call block: run them off the event loop so one
+        # slow /chat request does not stall every other request and stream
+        context = await run_in_threadpool(get_context, user_message)
+        retrieval_ms = (time.time() - retrieval_start) * 1000
 
         # Log chat activity
-        log_user_activity(
-            current_user.id, 
-            "chat", 
-            db, 
-            request, 
+        await run_in_threadpool(
+            log_user_activity,
+            current_user.id,
+            "chat",
+            db,
+            request,
             f"Message: {user_message[:100]}..."
         )
 
         payload = {
-            "model": "mistral",  # Or any other model served by Ollama
+            "model": OLLAMA_MODEL,  # Or any other model served by Ollama
             "prompt": f"### Hotel Knowledge:\n{context}\n\n### Question:\n{user_message}\n\n### Answer:",
             "stream": False
         }
 
-        response = requests.post("http://localhost:11434/api/generate", json=payload)
+        generation_start = time.time()
+        response, backend_url = await run_in_threadpool(ollama_pool.generate, payload)
         response.raise_for_status()  # Raise if HTTP error
         data = response.json()
+        generation_telemetry.record_generation(
+            data,
+            (time.time() - generation_start) * 1000,
+            retrieval_ms=retrieval_ms,
+            context_chars=len(context),
+            backend=backend_url,
+            model=OLLAMA_MODEL,
+        )
 
         return {
             "success": True,
@@ -109,7 +163,7 @@ async def chat_endpoint(
             "user": current_user.full_name
         }
 
-    except requests.RequestException as req_err:
+    except (requests.RequestException, NoBackendAvailable) as req_err:
         raise HTTPException(status_code=502, detail=f"LLM request failed: {str(req_err)}")
 
     except Exception as err:
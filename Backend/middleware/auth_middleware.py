@@ -1,38 +1,118 @@
 # Backend/middleware/auth_middleware.py
 
+import os
+import threading
+import time
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 from config.jwt_config import verify_token
-from config.database import get_db
+from config.database import get_async_db
 from models.user import User
 
 security = HTTPBearer()
 
-def get_current_user(
+# Authenticated-user cache settings. Changes made through the ORM in this process
+# invalidate entries right away; AUTH_CACHE_TTL bounds staleness for changes made
+# elsewhere (other workers, create_admin.py). AUTH_CACHE_TTL=0 disables caching.
+AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL", "30"))
+AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", "10000"))
+
+_USER_COLUMNS = [column.key for column in inspect(User).column_attrs]
+
+_TOKEN_CACHE = {}  # token -> (payload, expires_at)
+_USER_CACHE = {}  # user id -> (column values, expires_at)
+_USER_VERSIONS = {}  # user id -> bumped on every change, so stale loads are not cached
+_CACHE_LOCK = threading.Lock()
+
+
+def _put(cache: dict, key, value):
+    if key not in cache and len(cache) >= AUTH_CACHE_SIZE:
+        cache.pop(next(iter(cache)))  # Drop the oldest entry
+    cache[key] = value
+
+
+def _decode(token: str):
+    """Decoded payload of an access token, cached until the TTL or the token expiry"""
+    now = time.time()
+    with _CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(token)
+        if cached and cached[1] > now:
+            return cached[0]
+    payload = verify_token(token)  # Raises 401 when invalid or expired
+    if AUTH_CACHE_TTL > 0:
+        expires_at = min(now + AUTH_CACHE_TTL, payload.get("exp", now))
+        with _CACHE_LOCK:
+            _put(_TOKEN_CACHE, token, (payload, expires_at))
+    return payload
+
+
+def _user_from_values(values: dict) -> User:
+    """A detached User per request, so requests never share an ORM instance"""
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
+def invalidate_user(user_id: int):
+    """Forget the cached record of a user (called on every ORM update/delete of a User)"""
+    with _CACHE_LOCK:
+        _USER_CACHE.pop(user_id, None)
+        _USER_VERSIONS[user_id] = _USER_VERSIONS.get(user_id, 0) + 1
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _on_user_change(mapper, connection, target):
+    invalidate_user(target.id)
+
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current authenticated user from JWT token"""
     token = credentials.credentials
-    payload = verify_token(token)
-    
+    payload = _decode(token)
+
     user_id = payload.get("sub")
     if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials"
         )
-    
-    user = db.query(User).filter(User.id == user_id).first()
+    user_id = int(user_id)
+
+    now = time.time()
+    with _CACHE_LOCK:
+        cached = _USER_CACHE.get(user_id)
+        version = _USER_VERSIONS.get(user_id, 0)
+    if cached and cached[1] > now:
+        return _user_from_values(cached[0])
+
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalars().first()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
-    
+
+    if AUTH_CACHE_TTL > 0:
+        values = {key: getattr(user, key) for key in _USER_COLUMNS}
+        with _CACHE_LOCK:
+            # Skip caching when the user changed while we were loading it
+            if _USER_VERSIONS.get(user_id, 0) == version:
+                _put(_USER_CACHE, user_id, (values, now + AUTH_CACHE_TTL))
     return user
 
-def get_current_active_user(current_user: User = Depends(get_current_user)):
-    """Get current active user (can be extended with user status checks)"""
+async def get_current_active_user(current_user: User = Depends(get_current_user)):
+    """Get current active user (deactivated accounts are rejected)"""
+    if not current_user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account is deactivated"
+        )
     return current_user
@@ -1,6 +1,6 @@
 # backend/models/chat_message.py
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from config.database import Base
@@ -9,6 +9,10 @@ from models.chat_session import ChatSession
 
 class ChatMessage(Base):
 	__tablename__ = "chat_messages"
+	__table_args__ = (
+		# Messages of a session in order (history, conversation memory)
+		Index("ix_chat_messages_session_id_timestamp", "session_id", "timestamp", "id"),
+	)
 
 	id = Column(Integer, primary_key=True, index=True)
 	user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,15 +1,25 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from config.database import Base
 
+PREVIEW_LENGTH = 120  # Characters of the last message kept in last_message_preview
+
 class ChatSession(Base):
     __tablename__ = "chat_sessions"
+    __table_args__ = (
+        # A user's sessions, newest first
+        Index("ix_chat_sessions_user_id_created_at", "user_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     title = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Summary for the session list, kept up to date in the transaction that stores a chat turn
+    last_message_at = Column(DateTime, nullable=True)
+    last_message_preview = Column(String, nullable=True)
+    message_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     user = relationship("User", backref="chat_sessions")
     messages = relationship("ChatMessage", back_populates="session", cascade="all, delete-orphan")
@@ -0,0 +1,13 @@
+# Backend/models/data_version.py
+
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from config.database import Base
+
+class DataVersion(Base):
+    """Change counter of a slice of data, bumped in the transaction that changes it (see utils/data_versions.py)"""
+    __tablename__ = "data_versions"
+
+    scope = Column(String, primary_key=True)  # e.g. "events", "tasks:42", "rsvps:42"
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,25 @@
+# Backend/models/email_outbox.py
+
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
+from datetime import datetime
+from config.database import Base
+
+class EmailOutbox(Base):
+    """Emails queued in the same transaction as the change they report, sent by controllers/email_sender.py"""
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # Sender scan: WHERE status IN (...) AND next_attempt_at <= now ORDER BY id
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    recipient = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)  # HTML; the item's fragment for digest rows
+    digest = Column(String, nullable=True)  # Digest kind (task_approval, rsvp) or None to send on its own
+    status = Column(String, nullable=False, default="pending")  # pending, sending, sent, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
@@ -1,15 +1,21 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, PrimaryKeyConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from config.database import Base
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # A user's tasks, by status
+        Index("ix_tasks_user_id_completed", "user_id", "completed"),
+        # A user's tasks in a due date range (upcoming, overdue, today)
+        Index("ix_tasks_user_id_due", "user_id", "due"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     title = Column(String, nullable=False)
-    due = Column(String, nullable=True)
+    due = Column(DateTime, nullable=True)
     description = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     completed = Column(Integer, default=0)  # 0 = not done, 1 = done
@@ -19,20 +25,37 @@ class Task(Base):
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_events_date", "date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
-    date = Column(String, nullable=True)
+    date = Column(DateTime, nullable=True)
     description = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    rsvped = Column(Integer, default=0)  # 0 = not RSVPed, 1 = RSVPed
 
 class Meeting(Base):
     __tablename__ = "meetings"
+    __table_args__ = (
+        Index("ix_meetings_time", "time"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
-    time = Column(String, nullable=True)
+    time = Column(DateTime, nullable=True)
     description = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    rsvped = Column(Integer, default=0)  # 0 = not RSVPed, 1 = RSVPed
+
+class RSVP(Base):
+    """One employee's RSVP to an event or a meeting"""
+    __tablename__ = "rsvps"
+    __table_args__ = (
+        # "Has this user answered this item": the lookup of the get_events/get_meetings anti-join
+        PrimaryKeyConstraint("user_id", "item_type", "item_id"),
+    )
+
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    item_type = Column(String, nullable=False)  # "event" or "meeting"
+    item_id = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
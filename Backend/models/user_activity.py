@@ -1,12 +1,18 @@
 # Backend/models/user_activity.py
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from config.database import Base
 
 class UserActivity(Base):
     __tablename__ = "user_activities"
+    __table_args__ = (
+        # A user's activities, newest first
+        Index("ix_user_activities_user_id_timestamp", "user_id", "timestamp"),
+        # Activity feed across all users, newest first
+        Index("ix_user_activities_timestamp", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -19,3 +25,17 @@ class UserActivity(Base):
 
     # Relationship to User (using string reference to avoid circular imports)
     user = relationship("User", back_populates="activities")
+
+
+class UserActivityDaily(Base):
+    """Activity counts per user, action and day, maintained by controllers/activity_rollup.py"""
+    __tablename__ = "user_activity_daily"
+    __table_args__ = (
+        # Dashboard ranges and retention scans by day
+        Index("ix_user_activity_daily_day", "day"),
+    )
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    action = Column(String, primary_key=True)
+    day = Column(Date, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
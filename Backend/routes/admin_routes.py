@@ -1,17 +1,29 @@
 # Backend/routes/admin_routes.py
 
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, or_, select, union_all
 from typing import List, Optional
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from config.database import get_db
+from config.database import get_async_db
 from middleware.auth_middleware import get_current_active_user
 from models.user import User
-from models.user_activity import UserActivity
+from models.user_activity import UserActivity, UserActivityDaily
+from controllers.ollama_pool import ollama_pool
+from controllers.telemetry import generation_telemetry
+from controllers.activity_log import activity_writer
+from controllers.activity_rollup import activity_rollup
+from controllers.password_hasher import password_hasher
+from controllers.auth import account_limiter, ip_limiter
+from controllers.email_sender import email_sender
+from controllers.event_broker import event_broker
+from controllers.chat_search import search_messages
+from models.email_outbox import EmailOutbox
+from utils.pagination import keyset_paginate, MAX_PAGE_SIZE
 
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
@@ -26,12 +38,14 @@ class UserListItem(BaseModel):
         from_attributes = True
 
 @router.get("/users", response_model=List[UserListItem])
-def get_users(current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+async def get_users(current_user: User = Depends(get_current_active_user), db: AsyncSession = Depends(get_async_db)):
     """Get minimal user info for admin dropdowns (admin only)"""
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
-    users = db.query(User).all()
-    return [UserListItem(user_id=u.id, full_name=u.full_name, email=u.email) for u in users]
+    result = await db.execute(
+        select(User.id.label("user_id"), User.full_name, User.email).order_by(User.id)
+    )
+    return [UserListItem(**row._mapping) for row in result.all()]
 
 # Response models
 class UserActivityResponse(BaseModel):
@@ -67,72 +81,126 @@ class UserDetailsResponse(BaseModel):
     is_active: bool
     is_admin: bool
 
+# Columns of UserActivityResponse read straight from user_activities
+_ACTIVITY_COLUMNS = (
+    UserActivity.id, UserActivity.user_id, UserActivity.action, UserActivity.endpoint,
+    UserActivity.ip_address, UserActivity.user_agent, UserActivity.timestamp, UserActivity.details,
+)
+
 @router.get("/user-activities", response_model=List[UserActivityResponse])
-def get_user_activities(
+async def get_user_activities(
+    response: Response,
     limit: int = 50,
     user_id: Optional[int] = None,
+    before: Optional[str] = None,
+    after: Optional[str] = None,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get user activities for monitoring (requires authentication)"""
-    query = db.query(UserActivity).join(User)
+    """Get user activities for monitoring, newest first; `before`/`after` cursors page older/newer"""
+    # One joined projection: the user name comes with each row, no ORM objects or lazy loads
+    query = select(*_ACTIVITY_COLUMNS, User.full_name.label("user_name")).join(User, UserActivity.user_id == User.id)
     
     if user_id:
-        query = query.filter(UserActivity.user_id == user_id)
-    
-    activities = query.order_by(desc(UserActivity.timestamp)).limit(limit).all()
-    
-    result = []
-    for activity in activities:
-        result.append(UserActivityResponse(
-            id=activity.id,
-            user_id=activity.user_id,
-            user_name=activity.user.full_name,
-            action=activity.action,
-            endpoint=activity.endpoint,
-            ip_address=activity.ip_address,
-            user_agent=activity.user_agent,
-            timestamp=activity.timestamp,
-            details=activity.details
-        ))
+        query = query.where(UserActivity.user_id == user_id)
     
-    return result
+    page = await keyset_paginate(
+        db, query, UserActivity.timestamp, UserActivity.id,
+        before=before, after=after, limit=limit, scalars=False
+    )
+    page.set_headers(response)
+    return [UserActivityResponse(**row._mapping) for row in page.items]
 
 @router.get("/user-stats", response_model=List[UserStatsResponse])
-def get_user_stats(
+async def get_user_stats(
+    response: Response,
+    limit: int = 100,
+    after: Optional[int] = None,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get user statistics for monitoring"""
-    users = db.query(User).all()
-    
+    """Get user statistics for monitoring, by user id; pass X-After-Cursor as `after` for the next page"""
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    query = select(User.id, User.full_name, User.email, User.created_at, User.last_login)
+    if after:
+        query = query.where(User.id > after)
+    users = (await db.execute(query.order_by(User.id).limit(limit + 1))).all()
+    has_more = len(users) > limit
+    users = users[:limit]
+    if not users:
+        response.headers["X-Has-More"] = "false"
+        return []
+
+    user_ids = [u.id for u in users]
+
+    # Totals: whole days from the daily rollup, plus raw rows from the last
+    # rolled-up day on (rows of that day are recounted by every rollup run)
+    last_day = select(func.max(UserActivityDaily.day)).scalar_subquery()
+    parts = union_all(
+        select(UserActivityDaily.user_id, func.sum(UserActivityDaily.count).label("n"))
+        .where(UserActivityDaily.user_id.in_(user_ids), UserActivityDaily.day < last_day)
+        .group_by(UserActivityDaily.user_id),
+        select(UserActivity.user_id, func.count().label("n"))
+        .where(
+            UserActivity.user_id.in_(user_ids),
+            or_(last_day.is_(None), UserActivity.timestamp >= last_day),
+        )
+        .group_by(UserActivity.user_id),
+    ).subquery()
+    totals = dict((await db.execute(
+        select(parts.c.user_id, func.sum(parts.c.n)).group_by(parts.c.user_id)
+    )).all())
+
+    # Last 5 actions of every user on the page in one query (served by the
+    # (user_id, timestamp) index; raw rows are bounded by the retention age)
+    ranked = (
+        select(
+            UserActivity.user_id,
+            UserActivity.action,
+            func.row_number().over(
+                partition_by=UserActivity.user_id,
+                order_by=(UserActivity.timestamp.desc(), UserActivity.id.desc()),
+            ).label("rank"),
+        )
+        .where(UserActivity.user_id.in_(user_ids))
+        .subquery()
+    )
+    rows = (await db.execute(
+        select(ranked.c.user_id, ranked.c.action)
+        .where(ranked.c.rank <= 5)
+        .order_by(ranked.c.user_id, ranked.c.rank.desc())
+    )).all()
+
+    recent = {}
+    for row in rows:
+        recent.setdefault(row.user_id, []).append(row.action)  # Oldest of the last 5 first
+
     result = []
     for user in users:
-        activities = db.query(UserActivity).filter(UserActivity.user_id == user.id).all()
-        recent_activities = [a.action for a in activities[-5:]]  # Last 5 activities
-        
         result.append(UserStatsResponse(
             user_id=user.id,
             full_name=user.full_name,
             email=user.email,
             created_at=user.created_at,
             last_login=user.last_login,
-            total_activities=len(activities),
-            recent_activities=recent_activities
+            total_activities=totals.get(user.id, 0),
+            recent_activities=recent.get(user.id, [])
         ))
-    
+
+    response.headers["X-After-Cursor"] = str(users[-1].id)
+    response.headers["X-Has-More"] = "true" if has_more else "false"
     return result
 
 @router.get("/user-details", response_model=List[UserDetailsResponse])
-def get_user_details(
+async def get_user_details(
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get detailed user information including passwords (admin only)"""
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    users = db.query(User).all()
+    users = (await db.execute(select(User))).scalars().all()
     
     result = []
     for user in users:
@@ -150,28 +218,125 @@ def get_user_details(
     return result
 
 @router.get("/my-activities", response_model=List[UserActivityResponse])
-def get_my_activities(
+async def get_my_activities(
+    response: Response,
     limit: int = 20,
+    before: Optional[str] = None,
+    after: Optional[str] = None,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get current user's own activities"""
-    activities = db.query(UserActivity).filter(
-        UserActivity.user_id == current_user.id
-    ).order_by(desc(UserActivity.timestamp)).limit(limit).all()
-    
-    result = []
-    for activity in activities:
-        result.append(UserActivityResponse(
-            id=activity.id,
-            user_id=activity.user_id,
-            user_name=current_user.full_name,
-            action=activity.action,
-            endpoint=activity.endpoint,
-            ip_address=activity.ip_address,
-            user_agent=activity.user_agent,
-            timestamp=activity.timestamp,
-            details=activity.details
-        ))
-    
-    return result
+    """Get current user's own activities, newest first; `before`/`after` cursors page older/newer"""
+    page = await keyset_paginate(
+        db, select(*_ACTIVITY_COLUMNS).where(UserActivity.user_id == current_user.id),
+        UserActivity.timestamp, UserActivity.id, before=before, after=after, limit=limit, scalars=False
+    )
+    page.set_headers(response)
+    return [UserActivityResponse(user_name=current_user.full_name, **row._mapping) for row in page.items]
+
+@router.get("/ollama-status")
+async def get_ollama_status(current_user: User = Depends(get_current_active_user)):
+    """Health and load of each Ollama instance in the pool (admin only)"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return {"available": ollama_pool.is_available(), "instances": ollama_pool.status()}
+
+@router.get("/generation-stats")
+async def get_generation_stats(current_user: User = Depends(get_current_active_user)):
+    """Histograms of prompt size, tokens/sec, time to first token, load and retrieval time (admin only)"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return generation_telemetry.snapshot()
+
+@router.post("/generation-stats/reset")
+async def reset_generation_stats(current_user: User = Depends(get_current_active_user)):
+    """Start a new telemetry window, e.g. after changing num_predict or the model (admin only)"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    generation_telemetry.reset()
+    return {"success": True, "message": "Generation statistics reset"}
+
+@router.get("/activity-log-stats")
+async def get_activity_log_stats(current_user: User = Depends(get_current_active_user)):
+    """Counters of the buffered activity writer: queued, written, dropped and failed events (admin only)"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return activity_writer.snapshot()
+
+@router.get("/activity-summary")
+async def get_activity_summary(
+    days: int = 30,
+    user_id: Optional[int] = None,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Activity counts per day and action over the last `days` days, from the daily rollup (admin only)"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    days = max(1, min(days, 366))
+    query = select(
+        UserActivityDaily.day, UserActivityDaily.action, func.sum(UserActivityDaily.count).label("count")
+    ).where(UserActivityDaily.day >= datetime.utcnow().date() - timedelta(days=days - 1))
+    if user_id:
+        query = query.where(UserActivityDaily.user_id == user_id)
+    rows = (await db.execute(
+        query.group_by(UserActivityDaily.day, UserActivityDaily.action).order_by(UserActivityDaily.day)
+    )).all()
+    return {
+        "days": [{"day": row.day, "action": row.action, "count": row.count} for row in rows],
+        "rollup": activity_rollup.snapshot(),
+    }
+
+@router.post("/activity-rollup")
+async def run_activity_rollup(current_user: User = Depends(get_current_active_user)):
+    """Roll up recent activity and prune expired raw rows now (admin only)"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return await run_in_threadpool(activity_rollup.run_once)
+
+@router.get("/auth-stats")
+async def get_auth_stats(current_user: User = Depends(get_current_active_user)):
+    """Password hashing latency and queue depth, and throttled sign-in attempts (admin only)"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return {
+        "password_hashing": password_hasher.snapshot(),
+        "throttling": {"per_account": account_limiter.snapshot(), "per_ip": ip_limiter.snapshot()},
+    }
+
+@router.get("/email-stats")
+async def get_email_stats(current_user: User = Depends(get_current_active_user), db: AsyncSession = Depends(get_async_db)):
+    """Email outbox by status and delivery counters of the sender (admin only)"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    rows = (await db.execute(
+        select(EmailOutbox.status, func.count()).group_by(EmailOutbox.status)
+    )).all()
+    return {"outbox": dict(rows), "sender": email_sender.snapshot()}
+
+@router.get("/stream-stats")
+async def get_stream_stats(current_user: User = Depends(get_current_active_user)):
+    """Subscribers and event counters of the push channel (admin only)"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return event_broker.snapshot()
+
+@router.get("/chat-search")
+async def search_chat_messages(
+    q: str,
+    response: Response,
+    user_id: Optional[int] = None,
+    session_id: Optional[int] = None,
+    limit: int = 20,
+    offset: int = 0,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Chat messages of every user (or of `user_id` / `session_id`) matching `q` (admin only)"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    results, has_more = await search_messages(
+        db, q, user_id=user_id, session_id=session_id, limit=limit, offset=offset
+    )
+    response.headers["X-Has-More"] = "true" if has_more else "false"
+    return results
@@ -2,8 +2,8 @@
 
 from fastapi import APIRouter, Depends, Request
 from pydantic import BaseModel, EmailStr
-from sqlalchemy.orm import Session
-from config.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.database import get_async_db
 from controllers import auth
 
 router = APIRouter(prefix="/api/auth", tags=["Auth"])
@@ -23,8 +23,8 @@ class ResetPasswordRequest(BaseModel):
     new_password: str
 
 @router.post("/signup")
-def signup(req: SignUpRequest, request: Request, db: Session = Depends(get_db)):
-    return auth.signup_user(
+async def signup(req: SignUpRequest, request: Request, db: AsyncSession = Depends(get_async_db)):
+    return await auth.signup_user(
         full_name=req.full_name,
         email=req.email,
         password=req.password,
@@ -33,8 +33,8 @@ def signup(req: SignUpRequest, request: Request, db: Session = Depends(get_db)):
     )
 
 @router.post("/signin")
-def signin(req: SignInRequest, request: Request, db: Session = Depends(get_db)):
-    return auth.signin_user(
+async def signin(req: SignInRequest, request: Request, db: AsyncSession = Depends(get_async_db)):
+    return await auth.signin_user(
         email=req.email,
         password=req.password,
         db=db,
@@ -42,8 +42,8 @@ def signin(req: SignInRequest, request: Request, db: Session = Depends(get_db)):
     )
 
 @router.post("/reset-password")
-def reset_password(req: ResetPasswordRequest, request: Request, db: Session = Depends(get_db)):
-    return auth.reset_password(
+async def reset_password(req: ResetPasswordRequest, request: Request, db: AsyncSession = Depends(get_async_db)):
+    return await auth.reset_password(
         email=req.email,
         new_password=req.new_password,
         db=db,
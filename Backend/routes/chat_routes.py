@@ -1,18 +1,24 @@
 # Backend/routes/chat_routes.py
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
-from config.database import get_db
+from config.database import get_async_db
 from middleware.auth_middleware import get_current_active_user
 from models.chat_message import ChatMessage
-from models.chat_session import ChatSession
+from models.chat_session import ChatSession, PREVIEW_LENGTH
 
 from models.user import User
 from controllers.chat import generate_ai_response
+from controllers.memory import load_conversation_memory, build_retrieval_query
+from controllers.event_broker import event_broker, user_channel
+from controllers.chat_search import search_messages
+from utils.pagination import keyset_paginate
 
 router = APIRouter(prefix="/api/chat", tags=["Chat"])
 
@@ -32,24 +38,53 @@ class ChatMessageResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class ChatSearchResult(BaseModel):
+    id: int
+    session_id: int
+    session_title: Optional[str] = None
+    sender: str
+    snippet: str  # HTML-escaped excerpt with matched words wrapped in <mark></mark>
+    timestamp: datetime
+    score: float  # bm25, lower is a better match
+
 # Get chat history for current user
 
-# Get all messages for a session
+# Get the messages of a session, one page at a time (see utils/pagination.py)
 @router.get("/session/{session_id}", response_model=List[ChatMessageResponse])
-def get_session_messages(session_id: int, db: Session = Depends(get_db), user: User = Depends(get_current_active_user)):
+async def get_session_messages(
+    session_id: int,
+    response: Response,
+    before: Optional[str] = None,
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_active_user)
+):
+    """
+    Messages in chronological order: all of them, or the latest `limit`;
+    `before`/`after` cursors page older/newer
+    """
     try:
         # Validate session_id
         if not session_id or session_id <= 0:
             raise HTTPException(status_code=400, detail="Invalid session ID")
             
         # Check if session exists and belongs to the current user
-        session = db.query(ChatSession).filter(ChatSession.id == session_id, ChatSession.user_id == user.id).first()
+        result = await db.execute(
+            select(ChatSession).where(ChatSession.id == session_id, ChatSession.user_id == user.id)
+        )
+        session = result.scalars().first()
         if not session:
             raise HTTPException(status_code=404, detail="Session not found or you don't have permission to access it")
             
         # Get messages with error handling
-        messages = db.query(ChatMessage).filter(ChatMessage.session_id == session_id).order_by(ChatMessage.timestamp).all()
-        return messages
+        page = await keyset_paginate(
+            db, select(ChatMessage).where(ChatMessage.session_id == session_id),
+            ChatMessage.timestamp, ChatMessage.id,
+            before=before, after=after, limit=limit, newest_first=False,
+        )
+        page.set_headers(response)
+        return page.items
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
@@ -57,11 +92,29 @@ def get_session_messages(session_id: int, db: Session = Depends(get_db), user: U
         print(f"Error retrieving session messages: {str(e)}")
         raise HTTPException(status_code=500, detail="An error occurred while retrieving messages")
 
+# Search the current user's chat history
+@router.get("/search", response_model=List[ChatSearchResult])
+async def search_chat_history(
+    q: str,
+    response: Response,
+    session_id: Optional[int] = None,
+    limit: int = 20,
+    offset: int = 0,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_active_user)
+):
+    """Messages matching every word of `q` (the last as a prefix), best match first"""
+    results, has_more = await search_messages(
+        db, q, user_id=user.id, session_id=session_id, limit=limit, offset=offset
+    )
+    response.headers["X-Has-More"] = "true" if has_more else "false"
+    return results
+
 # Add a new chat message
 
 # Clear response cache (admin only)
 @router.post("/clear-cache")
-def clear_response_cache(user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+async def clear_response_cache(user: User = Depends(get_current_active_user)):
     """Clear the cached responses (admin only)"""
     if not user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
@@ -74,9 +127,9 @@ def clear_response_cache(user: User = Depends(get_current_active_user), db: Sess
 
 # Add a new chat message and generate bot reply
 @router.post("/message")
-def add_chat_message(
+async def add_chat_message(
     req: ChatMessageRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_active_user)
 ):
     try:
@@ -88,59 +141,64 @@ def add_chat_message(
             raise HTTPException(status_code=400, detail="Invalid sender. Must be 'user' or 'bot'")
         
         # Validate session with better error handling
-        session = db.query(ChatSession).filter(ChatSession.id == req.session_id, ChatSession.user_id == user.id).first()
+        result = await db.execute(
+            select(ChatSession).where(ChatSession.id == req.session_id, ChatSession.user_id == user.id)
+        )
+        session = result.scalars().first()
         if not session:
             raise HTTPException(status_code=404, detail="Session not found or access denied")
         
         # We'll always use the AI response handler which will manage context properly
         # No need to short-circuit with direct context responses
-        
-        # Otherwise continue with regular flow for more complex questions
-        # Store user message
-        user_msg = ChatMessage(
-            user_id=user.id,
-            session_id=req.session_id,
-            sender="user",
-            message=req.message
+
+        # Load earlier turns of this session before storing the new message
+        history, last_user_message = await load_conversation_memory(db, req.session_id)
+        retrieval_query = build_retrieval_query(req.message, last_user_message)
+        received_at = datetime.utcnow()
+
+        # Give the connection back to the pool while the model runs (objects stay loaded)
+        await db.close()
+
+        # Generate bot reply using Llama model (blocking HTTP call, run off the event loop)
+        bot_reply = await run_in_threadpool(
+            generate_ai_response, req.message, history=history, retrieval_query=retrieval_query
         )
-        db.add(user_msg)
-        db.commit()
-        db.refresh(user_msg)
-
-        # Generate bot reply using Llama model
-        bot_reply = generate_ai_response(req.message)
-        bot_msg = ChatMessage(
-            user_id=user.id,
-            session_id=req.session_id,
-            sender="bot",
-            message=bot_reply
+
+        # Store both messages in one short transaction: a single multi-row INSERT whose
+        # ids come back through RETURNING (row order is not guaranteed, so match on sender),
+        # plus the session summary shown by /api/session/list
+        rows = [
+            {"user_id": user.id, "session_id": req.session_id, "sender": "user",
+             "message": req.message, "timestamp": received_at},
+            {"user_id": user.id, "session_id": req.session_id, "sender": "bot",
+             "message": bot_reply, "timestamp": datetime.utcnow()},
+        ]
+        result = await db.execute(insert(ChatMessage).values(rows).returning(ChatMessage.id, ChatMessage.sender))
+        ids = {row.sender: row.id for row in result}
+        await db.execute(
+            update(ChatSession).where(ChatSession.id == req.session_id).values(
+                message_count=ChatSession.message_count + len(rows),
+                last_message_at=rows[-1]["timestamp"],
+                last_message_preview=bot_reply[:PREVIEW_LENGTH],
+            )
         )
-        db.add(bot_msg)
-        db.commit()
-        db.refresh(bot_msg)
+        await db.commit()
+        user_msg, bot_msg = [dict(row, id=ids[row["sender"]]) for row in rows]
+        # Other devices of the user following the stream get the reply without polling
+        event_broker.publish(user_channel(user.id), "chat.message", {
+            key: bot_msg[key] for key in ("id", "session_id", "sender", "message", "timestamp")
+        })
 
         # Return both messages (user and bot)
         return {
-            "user_message": {
-                "id": user_msg.id,
-                "user_id": user_msg.user_id,
-                "sender": user_msg.sender,
-                "message": user_msg.message,
-                "timestamp": user_msg.timestamp
-            },
-            "bot_message": {
-                "id": bot_msg.id,
-                "user_id": bot_msg.user_id,
-                "sender": bot_msg.sender,
-                "message": bot_msg.message,
-                "timestamp": bot_msg.timestamp
-            }
+            "user_message": {key: user_msg[key] for key in ("id", "user_id", "sender", "message", "timestamp")},
+            "bot_message": {key: bot_msg[key] for key in ("id", "user_id", "sender", "message", "timestamp")},
         }
     except Exception as e:
         # Log the error
         print(f"Error processing message: {str(e)}")
         # Rollback the transaction if an error occurs
-        db.rollback()
+        await db.rollback()
         # Provide a more helpful error message
         raise HTTPException(
             status_code=500, 
@@ -1,4 +1,4 @@
-from utils.email_utils import send_rsvp_email
+from utils.email_utils import queue_rsvp_email
 ## PATCH endpoints moved below router and response model definitions
 from fastapi import HTTPException
 from sqlalchemy.exc import NoResultFound
@@ -6,25 +6,39 @@ from sqlalchemy.exc import NoResultFound
 # --- PATCH: Mark task as done ---
 
 # (Move these endpoints after router and response model definitions)
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Response
-from sqlalchemy.orm import Session
-from typing import List
-from pydantic import BaseModel
-from datetime import datetime
-from config.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import and_, exists, or_, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from pydantic import BaseModel, field_validator
+from datetime import datetime, timezone
+from config.database import get_async_db
 from middleware.auth_middleware import get_current_active_user
 from models.user import User
-from utils.email_utils import send_task_approval_email
-from utils.email_utils import send_task_confirmation_email
-from models.employee_data import Task, Event, Meeting
+from utils.email_utils import queue_task_approval_email
+from utils.email_utils import queue_task_confirmation_email
+from controllers.email_sender import email_sender
+from controllers.bulk_import import read_rows, bulk_insert
+from controllers.event_broker import event_broker, user_channel, BROADCAST
+from models.employee_data import Task, Event, Meeting, RSVP
+from utils.pagination import MAX_PAGE_SIZE, encode_cursor, decode_cursor
+from utils import data_versions
+from utils.data_versions import bump_versions, read_versions, make_etag, etag_matches, tasks_scope, rsvps_scope
 
 router = APIRouter(prefix="/api/employee", tags=["Employee"])
 
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Schedule columns hold naive UTC: convert timezone-aware input"""
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 # Pydantic response models
 class TaskResponse(BaseModel):
     id: int
     title: str
-    due: str = None
+    due: datetime | None = None
     description: str | None = None
     created_at: datetime
     completed: int
@@ -35,7 +49,7 @@ class TaskResponse(BaseModel):
 class EventResponse(BaseModel):
     id: int
     title: str
-    date: str = None
+    date: datetime | None = None
     description: str | None = None
     created_at: datetime
     class Config:
@@ -44,16 +58,21 @@ class EventResponse(BaseModel):
 class MeetingResponse(BaseModel):
     id: int
     title: str
-    time: str = None
+    time: datetime | None = None
     description: str | None = None
     created_at: datetime
     class Config:
         from_attributes = True
 
+def _payload(response_model, row) -> dict:
+    """JSON body of a push event (see routes/stream_routes.py), shaped like the REST response"""
+    return response_model.model_validate(row).model_dump(mode="json")
+
 # --- PATCH: Mark task as done ---
 @router.patch("/tasks/{task_id}/done", response_model=TaskResponse)
-def mark_task_done(task_id: int, background_tasks: BackgroundTasks, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
-    task = db.query(Task).filter(Task.id == task_id, Task.user_id == current_user.id).first()
+async def mark_task_done(task_id: int, current_user: User = Depends(get_current_active_user), db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(select(Task).where(Task.id == task_id, Task.user_id == current_user.id))
+    task = result.scalars().first()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     # Instead of marking as completed, set a pending_approval flag (add if not exists)
@@ -62,134 +81,401 @@ def mark_task_done(task_id: int, background_tasks: BackgroundTasks, current_user
         setattr(task, 'pending_approval', 1)
     else:
         task.pending_approval = 1
-    db.commit()
-    db.refresh(task)
-    # Send approval email to admin
-    background_tasks.add_task(send_task_approval_email, task.title, current_user.full_name or current_user.email, task.id)
+    # Approval email to admin, committed with the change and sent by the outbox sender
+    queue_task_approval_email(db, task.title, current_user.full_name or current_user.email, task.id)
+    await bump_versions(db, tasks_scope(task.user_id))
+    await db.commit()
+    email_sender.notify()
+    event_broker.publish(user_channel(task.user_id), "task.updated", _payload(TaskResponse, task))
     return task
 
 # --- Admin Approve/Decline Task ---
 
 
 @router.get("/admin/approve_task/{task_id}")
-def approve_task(task_id: int, db: Session = Depends(get_db)):
-    task = db.query(Task).filter(Task.id == task_id).first()
+async def approve_task(task_id: int, db: AsyncSession = Depends(get_async_db)):
+    task = (await db.execute(select(Task).where(Task.id == task_id))).scalars().first()
     if not task:
         return Response("", media_type="text/html")
     task.completed = 1
     if hasattr(task, 'pending_approval'):
         task.pending_approval = 0
-    db.commit()
-    send_task_confirmation_email(task.title, approved=True)
+    queue_task_confirmation_email(db, task.title, approved=True)
+    await bump_versions(db, tasks_scope(task.user_id))
+    await db.commit()
+    email_sender.notify()
+    event_broker.publish(user_channel(task.user_id), "task.approved", _payload(TaskResponse, task))
     return Response("", media_type="text/html")
 
 
 @router.get("/admin/decline_task/{task_id}")
-def decline_task(task_id: int, db: Session = Depends(get_db)):
-    task = db.query(Task).filter(Task.id == task_id).first()
+async def decline_task(task_id: int, db: AsyncSession = Depends(get_async_db)):
+    task = (await db.execute(select(Task).where(Task.id == task_id))).scalars().first()
     if not task:
         return Response("", media_type="text/html")
     if hasattr(task, 'pending_approval'):
         task.pending_approval = 0
-    db.commit()
-    send_task_confirmation_email(task.title, approved=False)
+    queue_task_confirmation_email(db, task.title, approved=False)
+    await bump_versions(db, tasks_scope(task.user_id))
+    await db.commit()
+    email_sender.notify()
+    event_broker.publish(user_channel(task.user_id), "task.declined", _payload(TaskResponse, task))
     return Response("", media_type="text/html")
 
+# --- RSVPs (per user, see models.employee_data.RSVP) ---
+
+def _rsvped(model, item_type: str, user_id: int):
+    """EXISTS clause: the user has RSVPed to the row of `model`"""
+    return exists().where(and_(
+        RSVP.user_id == user_id, RSVP.item_type == item_type, RSVP.item_id == model.id,
+    ))
+
+async def _rsvp(db: AsyncSession, model, item_type: str, item_id: int, current_user: User, response_model):
+    row = (await db.execute(
+        select(model, _rsvped(model, item_type, current_user.id).label("rsvped")).where(model.id == item_id)
+    )).first()
+    if not row:
+        raise HTTPException(status_code=404, detail=f"{model.__name__} not found")
+    item, rsvped = row
+    if rsvped:
+        return item  # Already answered: no second row or email
+    db.add(RSVP(user_id=current_user.id, item_type=item_type, item_id=item.id))
+    # RSVP email notification, committed with the RSVP and sent by the outbox sender
+    queue_rsvp_email(db, model.__name__, item.title, current_user.full_name or current_user.email)
+    try:
+        await bump_versions(db, rsvps_scope(current_user.id))
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()  # A concurrent request of the same user RSVPed first
+        return item
+    email_sender.notify()
+    # Other devices of the user drop the item from their lists
+    event_broker.publish(user_channel(current_user.id), f"{item_type}.rsvped", _payload(response_model, item))
+    return item
+
 # --- PATCH: RSVP to event ---
 @router.patch("/events/{event_id}/rsvp", response_model=EventResponse)
-def rsvp_event(event_id: int, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-    event.rsvped = 1
-    db.commit()
-    db.refresh(event)
-    # Send RSVP email notification
-    send_rsvp_email("Event", event.title, current_user.full_name or current_user.email)
-    return event
+async def rsvp_event(event_id: int, current_user: User = Depends(get_current_active_user), db: AsyncSession = Depends(get_async_db)):
+    return await _rsvp(db, Event, "event", event_id, current_user, EventResponse)
 
 # --- PATCH: RSVP to meeting ---
 @router.patch("/meetings/{meeting_id}/rsvp", response_model=MeetingResponse)
-def rsvp_meeting(meeting_id: int, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-    meeting.rsvped = 1
-    db.commit()
-    db.refresh(meeting)
-    # Send RSVP email notification
-    send_rsvp_email("Meeting", meeting.title, current_user.full_name or current_user.email)
-    return meeting
+async def rsvp_meeting(meeting_id: int, current_user: User = Depends(get_current_active_user), db: AsyncSession = Depends(get_async_db)):
+    return await _rsvp(db, Meeting, "meeting", meeting_id, current_user, MeetingResponse)
+
+# Listing filters: `start`/`end` bound the item's date (start inclusive, end
+# exclusive) and `status` picks a view; both are evaluated in SQL on the
+# indexed schedule columns. Items without a date only match unfiltered lists.
+TASK_STATUSES = ("open", "pending_approval", "completed", "overdue")
+ITEM_STATUSES = ("upcoming", "past")
+
+def _check_status(status: Optional[str], allowed):
+    if status is not None and status not in allowed:
+        raise HTTPException(status_code=400, detail=f"status must be one of: {', '.join(allowed)}")
+
+def _date_range(query, column, start: Optional[datetime], end: Optional[datetime]):
+    start, end = _naive_utc(start), _naive_utc(end)
+    if start is not None:
+        query = query.where(column >= start)
+    if end is not None:
+        query = query.where(column < end)
+    return query
+
+def _scheduled_order(column, id_column):
+    """Soonest first, undated items last"""
+    return (column.is_(None), column, id_column)
+
+def _scheduled_after(column, id_column, cursor: str):
+    """Rows after `cursor` in _scheduled_order: (column IS NULL, column, id) > the cursor's"""
+    value, row_id = decode_cursor(cursor, nullable=True)
+    if value is None:
+        return and_(column.is_(None), id_column > row_id)
+    return or_(column.is_(None), tuple_(column, id_column) > tuple_(value, row_id))
+
+def _tasks_query(user_id: int, status: Optional[str], start: Optional[datetime], end: Optional[datetime]):
+    _check_status(status, TASK_STATUSES)
+    # Select only the response columns (no ORM objects or identity map work per row)
+    query = select(
+        Task.id, Task.title, Task.due, Task.description,
+        Task.created_at, Task.completed, Task.pending_approval,
+    ).where(Task.user_id == user_id)
+    if status == "open":
+        query = query.where(Task.completed == 0, Task.pending_approval == 0)
+    elif status == "pending_approval":
+        query = query.where(Task.pending_approval == 1)
+    elif status == "completed":
+        query = query.where(Task.completed == 1)
+    elif status == "overdue":
+        query = query.where(Task.completed == 0, Task.due < datetime.utcnow())
+    query = _date_range(query, Task.due, start, end)
+    return query.order_by(*_scheduled_order(Task.due, Task.id))
+
+def _items_query(model, item_type: str, column, user_id: int, status: Optional[str],
+                 start: Optional[datetime], end: Optional[datetime]):
+    _check_status(status, ITEM_STATUSES)
+    # Only items the user has NOT RSVPed to (anti-join on the rsvps primary key)
+    query = (
+        select(model.id, model.title, column, model.description, model.created_at)
+        .where(~_rsvped(model, item_type, user_id))
+    )
+    if status == "upcoming":
+        query = query.where(column >= datetime.utcnow())
+    elif status == "past":
+        query = query.where(column < datetime.utcnow())
+    query = _date_range(query, column, start, end)
+    return query.order_by(*_scheduled_order(column, model.id))
+
+def _limit(limit: int) -> int:
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+async def _section(db: AsyncSession, query, column, id_column, limit: Optional[int], after: Optional[str],
+                   response_model):
+    """
+    (items, cursor of the next page) for `limit` rows of `query` (ordered by
+    _scheduled_order) following the `after` cursor, or all of them. The cursor
+    is None once the last row has been read.
+    """
+    if after:
+        query = query.where(_scheduled_after(column, id_column, after))
+    if limit is None:
+        return [response_model(**row._mapping) for row in (await db.execute(query)).all()], None
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    items = [response_model(**row._mapping) for row in rows[:limit]]
+    if len(rows) <= limit:
+        return items, None
+    return items, encode_cursor(getattr(items[-1], column.key), items[-1].id)
+
+async def _list(db: AsyncSession, query, column, id_column, limit: Optional[int], after: Optional[str],
+                response: Response, response_model):
+    """
+    Every matching row, or `limit` of them: X-Has-More tells whether more match
+    and X-After-Cursor, passed back as `after`, reads the next page
+    """
+    items, cursor = await _section(
+        db, query, column, id_column, None if limit is None else _limit(limit), after, response_model)
+    if limit is not None:
+        response.headers["X-Has-More"] = "true" if cursor else "false"
+        if cursor:
+            response.headers["X-After-Cursor"] = cursor
+    return items
 
 @router.get("/tasks", response_model=List[TaskResponse])
-def get_tasks(current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
-    tasks = db.query(Task).filter(Task.user_id == current_user.id).all()
-    # Ensure completed and pending_approval are included in the response
-    return [
-        TaskResponse(
-            id=t.id,
-            title=t.title,
-            due=t.due,
-            description=t.description,
-            created_at=t.created_at,
-            completed=t.completed,
-            pending_approval=t.pending_approval
-        ) for t in tasks
-    ]
+async def get_tasks(
+    response: Response,
+    status: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """The user's tasks by due date; `status` is one of TASK_STATUSES, `start`/`end` bound `due`"""
+    query = _tasks_query(current_user.id, status, start, end)
+    return await _list(db, query, Task.due, Task.id, limit, after, response, TaskResponse)
 
 @router.get("/events", response_model=List[EventResponse])
-def get_events(current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
-    # Only return events the user has NOT RSVPed to
-    return db.query(Event).filter(Event.rsvped == 0).all()
+async def get_events(
+    response: Response,
+    status: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Events by date; `status` is upcoming or past, `start`/`end` bound `date`"""
+    query = _items_query(Event, "event", Event.date, current_user.id, status, start, end)
+    return await _list(db, query, Event.date, Event.id, limit, after, response, EventResponse)
 
 @router.get("/meetings", response_model=List[MeetingResponse])
-def get_meetings(current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
-    # Only return meetings the user has NOT RSVPed to
-    return db.query(Meeting).filter(Meeting.rsvped == 0).all()
+async def get_meetings(
+    response: Response,
+    status: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Meetings by time; `status` is upcoming or past, `start`/`end` bound `time`"""
+    query = _items_query(Meeting, "meeting", Meeting.time, current_user.id, status, start, end)
+    return await _list(db, query, Meeting.time, Meeting.id, limit, after, response, MeetingResponse)
+
+# --- Dashboard: tasks, events and meetings in one conditional GET ---
+
+class DashboardResponse(BaseModel):
+    tasks: List[TaskResponse]
+    events: List[EventResponse]
+    meetings: List[MeetingResponse]
+    next_meeting: Optional[MeetingResponse] = None  # Soonest unanswered meeting that has not started
+    has_more: dict  # Section -> more rows than `limit` match
+    cursors: dict  # Section -> `after` cursor of the section's list endpoint for the next page, or None
+
+async def _next_meeting(db: AsyncSession, user_id: int) -> Optional[MeetingResponse]:
+    row = (await db.execute(
+        _items_query(Meeting, "meeting", Meeting.time, user_id, "upcoming", None, None).limit(1)
+    )).first()
+    return MeetingResponse(**row._mapping) if row else None
+
+@router.get("/dashboard", response_model=DashboardResponse)
+async def get_dashboard(
+    request: Request,
+    response: Response,
+    task_status: Optional[str] = None,
+    item_status: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    The user's tasks plus the events and meetings they have not answered, with
+    the filters of the list endpoints (`task_status` for tasks, `item_status`
+    for events and meetings, `start`/`end` for all three), every matching row
+    unless `limit` caps the sections, and the next meeting to attend. A capped
+    section goes on at /tasks, /events or /meetings with the same filters and
+    its `cursors` entry as `after`. The ETag
+    comes from the data_versions counters and the next meeting, so a matching
+    If-None-Match is answered with 304 after two indexed lookups.
+    """
+    _check_status(task_status, TASK_STATUSES)
+    _check_status(item_status, ITEM_STATUSES)
+    limit = None if limit is None else _limit(limit)
+    versions = await read_versions(
+        db, [tasks_scope(current_user.id), rsvps_scope(current_user.id), data_versions.EVENTS, data_versions.MEETINGS]
+    )
+    # The next meeting changes without a write once it starts, so it is part of the ETag
+    next_meeting = await _next_meeting(db, current_user.id)
+    # Views relative to now (overdue, upcoming, past) change without a write: bucket them per minute
+    clock = datetime.utcnow().strftime("%Y%m%d%H%M") if task_status == "overdue" or item_status else ""
+    etag = make_etag(versions, current_user.id, task_status, item_status, start, end, limit, clock,
+                     next_meeting.id if next_meeting else None)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    tasks, tasks_cursor = await _section(
+        db, _tasks_query(current_user.id, task_status, start, end), Task.due, Task.id, limit, None, TaskResponse)
+    events, events_cursor = await _section(
+        db, _items_query(Event, "event", Event.date, current_user.id, item_status, start, end),
+        Event.date, Event.id, limit, None, EventResponse)
+    meetings, meetings_cursor = await _section(
+        db, _items_query(Meeting, "meeting", Meeting.time, current_user.id, item_status, start, end),
+        Meeting.time, Meeting.id, limit, None, MeetingResponse)
+    cursors = {"tasks": tasks_cursor, "events": events_cursor, "meetings": meetings_cursor}
+    response.headers.update(headers)
+    return DashboardResponse(
+        tasks=tasks, events=events, meetings=meetings, next_meeting=next_meeting,
+        has_more={section: cursor is not None for section, cursor in cursors.items()}, cursors=cursors,
+    )
 
 # Admin endpoints for adding data (to be used by admin dashboard)
 class TaskCreate(BaseModel):
     user_id: int
     title: str
-    due: str = None
+    due: datetime | None = None
     description: str = None
 
+    _normalize_due = field_validator("due")(_naive_utc)
+
 @router.post("/tasks", response_model=TaskResponse)
-def create_task(task: TaskCreate, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+async def create_task(task: TaskCreate, current_user: User = Depends(get_current_active_user), db: AsyncSession = Depends(get_async_db)):
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
     db_task = Task(**task.dict())
     db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    await bump_versions(db, tasks_scope(db_task.user_id))
+    await db.commit()
+    await db.refresh(db_task)
+    event_broker.publish(user_channel(db_task.user_id), "task.created", _payload(TaskResponse, db_task))
     return db_task
 
 class EventCreate(BaseModel):
     title: str
-    date: str = None
+    date: datetime | None = None
     description: str = None
 
+    _normalize_date = field_validator("date")(_naive_utc)
+
 @router.post("/events", response_model=EventResponse)
-def create_event(event: EventCreate, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+async def create_event(event: EventCreate, current_user: User = Depends(get_current_active_user), db: AsyncSession = Depends(get_async_db)):
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
     db_event = Event(**event.dict())
     db.add(db_event)
-    db.commit()
-    db.refresh(db_event)
+    await bump_versions(db, data_versions.EVENTS)
+    await db.commit()
+    await db.refresh(db_event)
+    event_broker.publish(BROADCAST, "event.created", _payload(EventResponse, db_event))
     return db_event
 
 class MeetingCreate(BaseModel):
     title: str
-    time: str = None
+    time: datetime | None = None
     description: str = None
 
+    _normalize_time = field_validator("time")(_naive_utc)
+
 @router.post("/meetings", response_model=MeetingResponse)
-def create_meeting(meeting: MeetingCreate, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+async def create_meeting(meeting: MeetingCreate, current_user: User = Depends(get_current_active_user), db: AsyncSession = Depends(get_async_db)):
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin access required")
     db_meeting = Meeting(**meeting.dict())
     db.add(db_meeting)
-    db.commit()
-    db.refresh(db_meeting)
+    await bump_versions(db, data_versions.MEETINGS)
+    await db.commit()
+    await db.refresh(db_meeting)
+    event_broker.publish(BROADCAST, "meeting.created", _payload(MeetingResponse, db_meeting))
     return db_meeting
+
+# --- Bulk import (admin) ---
+# Each endpoint takes a JSON array, NDJSON or CSV (header row with the fields of
+# the matching create model) and inserts the valid rows in chunked transactions;
+# see controllers/bulk_import.py for the report format.
+
+def _require_admin(current_user: User):
+    if not current_user.is_admin:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+async def _unknown_users(db: AsyncSession, values):
+    user_ids = {value["user_id"] for value in values}
+    known = set((await db.execute(select(User.id).where(User.id.in_(user_ids)))).scalars())
+    return {i: f"user_id {value['user_id']} does not exist" for i, value in enumerate(values)
+            if value["user_id"] not in known}
+
+def _publish_imported_tasks(values):
+    counts = {}
+    for value in values:
+        counts[value["user_id"]] = counts.get(value["user_id"], 0) + 1
+    for user_id, count in counts.items():
+        event_broker.publish(user_channel(user_id), "tasks.imported", {"count": count})
+
+@router.post("/tasks/bulk")
+async def bulk_create_tasks(request: Request, current_user: User = Depends(get_current_active_user), db: AsyncSession = Depends(get_async_db)):
+    _require_admin(current_user)
+    return await bulk_insert(
+        db, Task, TaskCreate, read_rows(request),
+        scopes=lambda values: [tasks_scope(user_id) for user_id in {value["user_id"] for value in values}],
+        on_insert=_publish_imported_tasks,
+        check=_unknown_users,
+    )
+
+@router.post("/events/bulk")
+async def bulk_create_events(request: Request, current_user: User = Depends(get_current_active_user), db: AsyncSession = Depends(get_async_db)):
+    _require_admin(current_user)
+    return await bulk_insert(
+        db, Event, EventCreate, read_rows(request), scopes=lambda values: [data_versions.EVENTS],
+        on_insert=lambda values: event_broker.publish(BROADCAST, "events.imported", {"count": len(values)}),
+    )
+
+@router.post("/meetings/bulk")
+async def bulk_create_meetings(request: Request, current_user: User = Depends(get_current_active_user), db: AsyncSession = Depends(get_async_db)):
+    _require_admin(current_user)
+    return await bulk_insert(
+        db, Meeting, MeetingCreate, read_rows(request), scopes=lambda values: [data_versions.MEETINGS],
+        on_insert=lambda values: event_broker.publish(BROADCAST, "meetings.imported", {"count": len(values)}),
+    )
@@ -1,13 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
-from config.database import get_db
+from config.database import get_async_db
 from middleware.auth_middleware import get_current_active_user
 from models.chat_session import ChatSession
 from models.user import User
+from utils.pagination import keyset_paginate
 
 router = APIRouter(prefix="/api/session", tags=["ChatSession"])
 
@@ -20,11 +22,14 @@ class ChatSessionResponse(BaseModel):
     user_id: int
     title: str
     created_at: datetime
+    last_message_at: Optional[datetime] = None
+    last_message_preview: Optional[str] = None
+    message_count: int = 0
     class Config:
         from_attributes = True
 
 @router.post("/new", response_model=ChatSessionResponse)
-def create_session(req: ChatSessionCreateRequest, db: Session = Depends(get_db), user: User = Depends(get_current_active_user)):
+async def create_session(req: ChatSessionCreateRequest, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_active_user)):
     # If no title, generate a nominal short title from the first message
     import re
     from datetime import datetime
@@ -42,10 +47,29 @@ def create_session(req: ChatSessionCreateRequest, db: Session = Depends(get_db),
     title = req.title or summarize_message(req.first_message)
     session = ChatSession(user_id=user.id, title=title)
     db.add(session)
-    db.commit()
-    db.refresh(session)
+    await db.commit()
+    await db.refresh(session)
     return session
 
 @router.get("/list", response_model=List[ChatSessionResponse])
-def list_sessions(db: Session = Depends(get_db), user: User = Depends(get_current_active_user)):
-    return db.query(ChatSession).filter(ChatSession.user_id == user.id).order_by(ChatSession.created_at.desc()).all()
+async def list_sessions(
+    response: Response,
+    before: Optional[str] = None,
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_active_user)
+):
+    """
+    Newest sessions first, each with its last message preview, last activity
+    time and message count (denormalized on chat_sessions, so no per-session
+    query). Every session unless `limit` is given; `before`/`after` cursors
+    page older/newer (see utils/pagination.py)
+    """
+    page = await keyset_paginate(
+        db, select(ChatSession).where(ChatSession.user_id == user.id),
+        ChatSession.created_at, ChatSession.id,
+        before=before, after=after, limit=limit,
+    )
+    page.set_headers(response)
+    return page.items
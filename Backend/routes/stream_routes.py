@@ -0,0 +1,67 @@
+# Backend/routes/stream_routes.py
+# Server-Sent Events push channel. A client opens one stream and receives the
+# events published for its user (task updates, its own RSVPs, bot replies) and
+# for everyone (new events and meetings) instead of polling the lists:
+#
+#   id: 3f9a1c0e7b2d-42
+#   event: task.approved
+#   data: {"id": 7, "title": "Fold towels", ...}
+#
+# Reconnecting with the Last-Event-ID header replays what was missed; a
+# "resync" event means too much was missed (or the server restarted) and the
+# lists should be refetched.
+#
+# Uvicorn waits for open responses before running the lifespan shutdown (which
+# ends every stream), so run it with a graceful shutdown timeout, e.g.
+# --timeout-graceful-shutdown 5, or open streams delay the stop indefinitely.
+
+import json
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.database import get_async_db
+from controllers.event_broker import event_broker, user_channel, BROADCAST
+from middleware.auth_middleware import get_current_active_user
+from models.user import User
+
+STREAM_HEARTBEAT = float(os.getenv("STREAM_HEARTBEAT", "15"))  # Seconds between keep-alive comments
+
+router = APIRouter(prefix="/api", tags=["Stream"])
+
+
+def _format(event: dict) -> str:
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'], default=str)}\n\n"
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    last_event_id: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Push events of the current user as text/event-stream"""
+    # The stream can stay open for hours: do not hold a database connection for it
+    await db.close()
+    subscription = event_broker.subscribe([user_channel(current_user.id), BROADCAST], last_event_id=last_event_id)
+
+    async def events():
+        try:
+            yield f"retry: 3000\n: connected as user {current_user.id}\n\n"
+            while not subscription.closed:
+                event = await subscription.next_event(STREAM_HEARTBEAT)
+                if await request.is_disconnected():
+                    break
+                yield _format(event) if event else ": keep-alive\n\n"
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
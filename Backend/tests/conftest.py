@@ -0,0 +1,79 @@
+# Backend/tests/conftest.py
+# Shared setup for the test suite: every test runs against a throwaway SQLite
+# database, never instance/fairmont.db.
+#
+#   cd Backend && python -m pytest
+
+import asyncio
+import os
+import tempfile
+
+# Set before anything imports config.database, which reads DATABASE_URL once
+TEST_DB_DIR = tempfile.mkdtemp(prefix="fairmont-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DB_DIR}/test.db"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["AUTH_CACHE_TTL"] = "0"
+# Low limits keep the throttling tests short (every attempt hashes a password)
+os.environ["AUTH_ACCOUNT_MAX_ATTEMPTS"] = "3"
+os.environ["AUTH_IP_MAX_ATTEMPTS"] = "10"
+
+import pytest
+from sqlalchemy import text
+
+import db_init
+from config.database import AsyncSessionLocal, Base, async_engine, engine
+from controllers.chat_search import FTS_TABLE
+
+db_init.init_db()
+
+
+@pytest.fixture
+def clean_db():
+    """Empty every table (and the chat search index) before the test"""
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+        conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('delete-all')"))
+    yield
+
+
+@pytest.fixture
+def run_db(clean_db):
+    """
+    run_db(fn) awaits fn(db) with an async session in a fresh event loop and
+    returns its result. The pool is disposed afterwards, since aiosqlite
+    connections cannot be shared between event loops.
+    """
+    def run(fn):
+        async def main():
+            try:
+                async with AsyncSessionLocal() as db:
+                    return await fn(db)
+            finally:
+                await async_engine.dispose()
+        return asyncio.run(main())
+    return run
+
+
+@pytest.fixture
+def client(clean_db):
+    """TestClient of the app (without its lifespan: no email sender or rollup task)"""
+    import main
+    from controllers.auth import account_limiter, ip_limiter
+    from fastapi.testclient import TestClient
+
+    for limiter in (account_limiter, ip_limiter):
+        limiter._attempts.clear()
+    yield TestClient(main.app)
+    for limiter in (account_limiter, ip_limiter):
+        limiter._attempts.clear()
+
+
+def sign_up(client, email="a@b.com", password="x12345678", admin=False):
+    """Create an account and return its Authorization header"""
+    response = client.post("/api/auth/signup", json={"full_name": "A B", "email": email, "password": password})
+    assert response.status_code == 200, response.text
+    if admin:
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE users SET is_admin = 1 WHERE email = :email"), {"email": email})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,32 @@
+# Backend/tests/test_admin_routes.py
+
+from sqlalchemy import insert
+
+from config.database import engine
+from models.user import User
+
+from conftest import sign_up
+
+
+def add_users(count):
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"full_name": f"Guest {i}", "email": f"guest{i}@b.com", "hashed_password": "x", "is_active": True}
+            for i in range(count)
+        ])
+
+
+def test_user_stats_pages_cover_every_user(client):
+    headers = sign_up(client, admin=True)
+    add_users(250)
+    # What admin_dashboard.html fetchAllUserStats() does
+    users, params = [], {}
+    while True:
+        response = client.get("/api/admin/user-stats", params=params, headers=headers)
+        assert response.status_code == 200
+        users += response.json()
+        if response.headers["X-Has-More"] != "true":
+            break
+        params = {"after": response.headers["X-After-Cursor"]}
+    assert len(users) == 251
+    assert len({user["user_id"] for user in users}) == 251
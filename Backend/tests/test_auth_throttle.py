@@ -0,0 +1,67 @@
+# Backend/tests/test_auth_throttle.py
+
+from config.auth_config import AUTH_ACCOUNT_MAX_ATTEMPTS, AUTH_IP_MAX_ATTEMPTS
+from utils.rate_limit import AttemptLimiter
+
+from conftest import sign_up
+
+
+def test_attempt_limiter_counts_recorded_failures():
+    limiter = AttemptLimiter(max_attempts=2, window=60)
+    assert limiter.check("k") == 0
+    limiter.record("k")
+    assert limiter.check("k") == 0
+    limiter.record("k")
+    assert 0 < limiter.check("k") <= 60
+    assert limiter.check("other") == 0
+    assert limiter.snapshot()["rejected"] == 1
+    limiter.reset("k")
+    assert limiter.check("k") == 0
+
+
+def test_attempt_limiter_window_slides():
+    limiter = AttemptLimiter(max_attempts=1, window=0)
+    limiter.record("k")
+    assert limiter.check("k") == 0
+
+
+def signin(client, email="a@b.com", password="x12345678"):
+    return client.post("/api/auth/signin", json={"email": email, "password": password}).status_code
+
+
+def test_successful_signins_and_signups_are_not_throttled(client):
+    sign_up(client)
+    assert {signin(client) for _ in range(AUTH_IP_MAX_ATTEMPTS + 5)} == {200}
+    for i in range(AUTH_IP_MAX_ATTEMPTS + 5):
+        sign_up(client, email=f"staff{i}@b.com")
+
+
+def test_failed_signins_lock_the_account(client):
+    sign_up(client)
+    assert [signin(client, password="wrong") for _ in range(AUTH_ACCOUNT_MAX_ATTEMPTS)] == [401] * AUTH_ACCOUNT_MAX_ATTEMPTS
+    response = client.post("/api/auth/signin", json={"email": "a@b.com", "password": "x12345678"})
+    assert response.status_code == 429 and int(response.headers["Retry-After"]) > 0
+
+
+def test_successful_signin_clears_account_failures(client):
+    sign_up(client)
+    for _ in range(AUTH_ACCOUNT_MAX_ATTEMPTS - 1):
+        assert signin(client, password="wrong") == 401
+    assert signin(client) == 200
+    for _ in range(AUTH_ACCOUNT_MAX_ATTEMPTS - 1):
+        assert signin(client, password="wrong") == 401
+    assert signin(client) == 200
+
+
+def test_failures_count_per_ip(client):
+    emails = [f"user{i}@b.com" for i in range(AUTH_IP_MAX_ATTEMPTS)]
+    assert {signin(client, email=email, password="wrong") for email in emails} == {401}
+    assert signin(client, email="someone@b.com", password="wrong") == 429
+
+
+def test_password_resets_do_not_lock_the_account(client):
+    sign_up(client)
+    for _ in range(AUTH_ACCOUNT_MAX_ATTEMPTS * 2):
+        response = client.post("/api/auth/reset-password", json={"email": "a@b.com", "new_password": "x12345678"})
+        assert response.status_code == 200
+    assert signin(client) == 200
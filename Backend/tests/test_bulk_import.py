@@ -0,0 +1,170 @@
+# Backend/tests/test_bulk_import.py
+
+import asyncio
+import json
+from datetime import datetime
+from typing import Optional
+
+import pytest
+from fastapi import HTTPException, Request
+from pydantic import BaseModel
+from sqlalchemy import select
+
+from controllers import bulk_import
+from controllers.bulk_import import bulk_insert, read_rows
+from models.data_version import DataVersion
+from models.employee_data import Event
+from routes.employee_routes import EventCreate
+
+
+def make_request(body: bytes, content_type: str, chunk_size: int = 5) -> Request:
+    """Request whose body arrives in small chunks, splitting lines and characters"""
+    chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)] or [b""]
+
+    async def receive():
+        chunk = chunks.pop(0)
+        return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+
+    scope = {"type": "http", "method": "POST", "path": "/", "query_string": b"",
+             "headers": [(b"content-type", content_type.encode())]}
+    return Request(scope, receive)
+
+
+def rows_of(body, content_type):
+    async def collect():
+        return [row async for row in read_rows(make_request(body, content_type))]
+    return asyncio.run(collect())
+
+
+def test_json_array():
+    body = json.dumps([{"title": "Gala"}, {"title": "Brunch"}]).encode()
+    assert rows_of(body, "application/json; charset=utf-8") == [
+        (1, {"title": "Gala"}, None), (2, {"title": "Brunch"}, None),
+    ]
+
+
+@pytest.mark.parametrize("body, detail", [
+    (b'{"title": "Gala"}', "Expected a JSON array of rows"),
+    (b'[{"title": ', "Invalid JSON"),
+])
+def test_json_errors(body, detail):
+    with pytest.raises(HTTPException) as e:
+        rows_of(body, "application/json")
+    assert e.value.status_code == 400
+    assert e.value.detail.startswith(detail)
+
+
+def test_ndjson():
+    body = '{"title": "Café"}\n\n{"title": \n{"title": "Spa"}'.encode()
+    rows = rows_of(body, "application/x-ndjson")
+    assert rows[0] == (1, {"title": "Café"}, None)
+    assert rows[1][0] == 2 and rows[1][1] is None and rows[1][2].startswith("Invalid JSON")
+    assert rows[2] == (3, {"title": "Spa"}, None)
+
+
+def test_csv():
+    body = (
+        "\ufefftitle, date ,description\r\n"
+        "Gala,2026-05-01,\"Ballroom, \"\"black tie\"\"\"\r\n"
+        "\r\n"
+        "Brunch,,\"Terrace\nweather permitting\"\r\n"
+        "Gala,2026-05-01,x,extra\r\n"
+        "Tennis\r\n"
+    ).encode()
+    assert rows_of(body, "text/csv") == [
+        (1, {"title": "Gala", "date": "2026-05-01", "description": 'Ballroom, "black tie"'}, None),
+        (2, {"title": "Brunch", "description": "Terrace\nweather permitting"}, None),
+        (3, None, "Expected 3 fields, got 4"),
+        (4, {"title": "Tennis"}, None),
+    ]
+
+
+def test_csv_unterminated_quote():
+    rows = rows_of(b'title,description\nGala,"Ballroom\nBrunch,Terrace\n', "text/csv")
+    assert rows == [(1, None, "Unterminated quoted field")]
+
+
+def test_unsupported_content_type():
+    with pytest.raises(HTTPException) as e:
+        rows_of(b"title\nGala\n", "text/plain")
+    assert e.value.status_code == 415
+
+
+async def as_rows(items):
+    for number, item in enumerate(items, start=1):
+        yield number, item, None
+
+
+def import_events(run_db, items, **kwargs):
+    chunks = []
+
+    def scopes(values):
+        chunks.append(len(values))
+        return ["events"]
+
+    async def run(db):
+        report = await bulk_insert(
+            db, Event, kwargs.pop("schema", EventCreate), as_rows(items), scopes=scopes, **kwargs,
+        )
+        titles = (await db.execute(select(Event.title).order_by(Event.id))).scalars().all()
+        version = await db.scalar(select(DataVersion.version).where(DataVersion.scope == "events"))
+        return report, titles, version
+
+    report, titles, version = run_db(run)
+    return report, titles, version, chunks
+
+
+def test_bulk_insert_in_chunks(run_db):
+    items = [{"title": f"E{i}", "date": "2026-05-01T10:00:00+02:00"} for i in range(5)]
+    inserted = []
+    report, titles, version, chunks = import_events(
+        run_db, items, chunk_size=2, on_insert=lambda values: inserted.append(len(values)))
+    assert (report["received"], report["inserted"], report["failed"]) == (5, 5, 0)
+    assert report["errors"] == [] and report["rows_per_sec"] > 0
+    assert titles == [f"E{i}" for i in range(5)]
+    assert chunks == inserted == [2, 2, 1]
+    assert version == 3  # One data_versions bump per committed chunk
+
+
+def test_bulk_insert_reports_invalid_rows(run_db):
+    items = [{"title": "Gala"}, ["not", "an", "object"], {"date": "2026-05-01"}, {"title": "Spa", "date": "soon"}]
+    report, titles, _, _ = import_events(run_db, items)
+    assert (report["received"], report["inserted"], report["failed"]) == (4, 1, 3)
+    assert titles == ["Gala"]
+    errors = {error["row"]: error["error"] for error in report["errors"]}
+    assert errors[2] == "Expected an object"
+    assert errors[3].startswith("title: Field required")
+    assert errors[4].startswith("date: ")
+
+
+def test_bulk_insert_check_rejects_rows(run_db):
+    async def check(db, values):
+        return {index: "Duplicate title" for index, value in enumerate(values) if value["title"] == "Gala"}
+
+    items = [{"title": "Gala"}, {"title": "Spa"}, {"title": "Gala"}, {"title": "Brunch"}]
+    report, titles, _, _ = import_events(run_db, items, check=check, chunk_size=3)
+    assert report["inserted"] == 2 and titles == ["Spa", "Brunch"]
+    assert report["errors"] == [{"row": 1, "error": "Duplicate title"}, {"row": 3, "error": "Duplicate title"}]
+
+
+class LooseEvent(BaseModel):
+    title: Optional[str] = None
+    date: Optional[datetime] = None
+
+
+def test_bulk_insert_failed_chunk_is_rolled_back(run_db):
+    # events.title is NOT NULL: the second chunk fails as a whole, the others are kept
+    items = [{"title": "A"}, {"title": "B"}, {"title": "C"}, {}, {"title": "E"}]
+    report, titles, version, _ = import_events(run_db, items, schema=LooseEvent, chunk_size=2)
+    assert (report["inserted"], report["failed"]) == (3, 2)
+    assert titles == ["A", "B", "E"]
+    assert [error["row"] for error in report["errors"]] == [3, 4]
+    assert all(error["error"].startswith("Insert failed: ") for error in report["errors"])
+    assert version == 2
+
+
+def test_bulk_insert_truncates_errors(run_db, monkeypatch):
+    monkeypatch.setattr(bulk_import, "BULK_MAX_ERRORS", 2)
+    report, _, _, _ = import_events(run_db, [{} for _ in range(4)])
+    assert report["failed"] == 4
+    assert len(report["errors"]) == 2 and report["errors_truncated"]
@@ -0,0 +1,46 @@
+# Backend/tests/test_chat_endpoint.py
+
+import asyncio
+
+import main
+
+from conftest import sign_up
+
+
+def on_event_loop():
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+class FakeResponse:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"response": "The pool opens at 7.", "eval_count": 5, "eval_duration": 10**8}
+
+
+def test_chat_blocking_calls_run_off_the_event_loop(client, monkeypatch):
+    calls = {}
+
+    def get_context(message):
+        calls["get_context"] = on_event_loop()
+        return "The pool opens at 7."
+
+    def generate(payload):
+        calls["generate"] = on_event_loop()
+        return FakeResponse(), "http://ollama"
+
+    def log_user_activity(*args):
+        calls["log_user_activity"] = on_event_loop()
+
+    monkeypatch.setattr(main, "get_context", get_context)
+    monkeypatch.setattr(main.ollama_pool, "generate", generate)
+    monkeypatch.setattr(main, "log_user_activity", log_user_activity)
+    response = client.post("/chat", json={"message": "When does the pool open?"}, headers=sign_up(client))
+    assert response.status_code == 200
+    assert response.json()["response"] == "The pool opens at 7."
+    assert calls == {"get_context": False, "generate": False, "log_user_activity": False}
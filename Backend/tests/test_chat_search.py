@@ -0,0 +1,155 @@
+# Backend/tests/test_chat_search.py
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete, text, update
+
+from config.database import engine
+from controllers.chat_search import (
+    FTS_TABLE, MAX_SEARCH_RESULTS, highlight, install_fts, match_query, search_messages,
+)
+from models.chat_message import ChatMessage
+from models.chat_session import ChatSession
+from models.user import User
+
+START = datetime(2026, 1, 1, 12, 0)
+
+
+@pytest.mark.parametrize("q, expected", [
+    ("pool", '"pool"*'),
+    ("pool towel", '"pool" "towel"*'),
+    ('pool" OR spa NOT (gym', '"pool" "OR" "spa" "NOT" "gym"*'),
+    ("  café-bar?  ", '"café" "bar"*'),
+])
+def test_match_query(q, expected):
+    assert match_query(q) == expected
+
+
+@pytest.mark.parametrize("q", ["", "   ", "?!* ()"])
+def test_match_query_without_words(q):
+    with pytest.raises(HTTPException) as e:
+        match_query(q)
+    assert e.value.status_code == 400
+
+
+MESSAGES = [
+    # (id, user, session, message)
+    (1, 1, 1, "Is the pool heated in winter?"),
+    (2, 1, 1, "Pool pool pool"),
+    (3, 1, 2, "Can I book the spa for Friday?"),
+    (4, 2, 3, "What time does the pool open?"),
+    (5, 2, 3, "Extra towels please"),
+]
+
+
+@pytest.fixture
+def search(run_db):
+    """Seeds MESSAGES; search(q, **kwargs) returns ([(id, snippet)], has_more)"""
+    async def seed(db):
+        db.add_all([User(id=1, email="a@b.com", hashed_password="x"),
+                    User(id=2, email="c@d.com", hashed_password="x")])
+        db.add_all([ChatSession(id=1, user_id=1, title="Pool"), ChatSession(id=2, user_id=1, title="Spa"),
+                    ChatSession(id=3, user_id=2, title="Stay")])
+        db.add_all([
+            ChatMessage(id=i, user_id=user_id, session_id=session_id, sender="user", message=message,
+                        timestamp=START + timedelta(minutes=i))
+            for i, user_id, session_id, message in MESSAGES
+        ])
+        await db.commit()
+
+    run_db(seed)
+
+    def read(q, **kwargs):
+        async def query(db):
+            return await search_messages(db, q, **kwargs)
+        results, has_more = run_db(query)
+        return [(result["id"], result["snippet"]) for result in results], has_more
+
+    read.run_db = run_db
+    return read
+
+
+def ids(results):
+    return [row_id for row_id, _ in results[0]]
+
+
+def test_search_ranks_and_highlights(search):
+    results, has_more = search("pool")
+    assert [row_id for row_id, _ in results] == [2, 4, 1] and not has_more
+    assert results[0][1] == "<mark>Pool</mark> <mark>pool</mark> <mark>pool</mark>"
+    assert "<mark>pool</mark>" in results[2][1]
+
+
+def test_highlight_escapes_message_text():
+    assert highlight("\ue000pool\ue001 & <b>spa</b>") == "<mark>pool</mark> &amp; &lt;b&gt;spa&lt;/b&gt;"
+
+
+def test_snippet_escapes_html_in_messages(search):
+    async def seed(db):
+        db.add(ChatMessage(id=6, user_id=2, session_id=3, sender="user", timestamp=START,
+                           message='<script>alert("pool")</script> <img src=x onerror=alert(1)> pool'))
+        await db.commit()
+
+    search.run_db(seed)
+    results, _ = search("alert", user_id=2)
+    snippet = results[0][1]
+    assert "<script>" not in snippet and "<img" not in snippet
+    assert snippet == ("&lt;script&gt;<mark>alert</mark>(&quot;pool&quot;)&lt;/script&gt; "
+                       "&lt;img src=x onerror=<mark>alert</mark>(1)&gt; pool")
+
+
+def test_search_result_fields(search):
+    async def query(db):
+        return await search_messages(db, "spa friday")
+    results, _ = search.run_db(query)
+    assert len(results) == 1
+    result = results[0]
+    assert (result["id"], result["session_id"], result["session_title"], result["user_id"]) == (3, 2, "Spa", 1)
+    assert result["sender"] == "user" and result["timestamp"] == START + timedelta(minutes=3)
+    assert isinstance(result["score"], float)
+
+
+def test_search_words_stems_and_prefixes(search):
+    assert ids(search("pool heated")) == [1]
+    assert ids(search("towel")) == [5]  # Porter stemming
+    assert ids(search("tow")) == [5]  # Last word is a prefix
+    assert ids(search("heat pool")) == [1]  # "heated" is indexed as "heat"
+    assert ids(search("hea pool")) == []  # Only the last word is a prefix
+    assert ids(search("helicopter")) == []
+
+
+def test_search_scopes(search):
+    assert ids(search("pool", user_id=1)) == [2, 1]
+    assert ids(search("pool", user_id=2)) == [4]
+    assert ids(search("pool", session_id=2)) == []
+    assert ids(search("spa", user_id=1, session_id=2)) == [3]
+
+
+def test_search_pages(search):
+    assert search("pool", limit=2) == (search("pool")[0][:2], True)
+    assert ids(search("pool", limit=2, offset=2)) == [1]
+    assert search("pool", limit=2, offset=2)[1] is False
+    assert ids(search("pool", limit=0)) == [2]  # Clamped to 1
+    assert len(search("pool", limit=MAX_SEARCH_RESULTS + 1)[0]) == 3
+
+
+def test_index_follows_updates_and_deletes(search):
+    async def change(db):
+        await db.execute(update(ChatMessage).where(ChatMessage.id == 1).values(message="Is the sauna open?"))
+        await db.execute(delete(ChatMessage).where(ChatMessage.id == 4))
+        await db.commit()
+
+    search.run_db(change)
+    assert ids(search("pool")) == [2]
+    assert ids(search("sauna")) == [1]
+
+
+def test_install_fts_indexes_existing_messages(search):
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE {FTS_TABLE}"))
+    install_fts(engine)
+    assert ids(search("pool")) == [2, 4, 1]
+    install_fts(engine)  # Already installed: nothing is indexed twice
+    assert ids(search("pool")) == [2, 4, 1]
@@ -0,0 +1,128 @@
+# Backend/tests/test_employee_routes.py
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from config.database import engine
+from utils.pagination import MAX_PAGE_SIZE
+
+from conftest import sign_up
+
+
+def user_id(email="a@b.com"):
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT id FROM users WHERE email = :email"), {"email": email}).scalar_one()
+
+
+def test_meeting_time_from_the_admin_form(client):
+    headers = sign_up(client, admin=True)
+    # admin_dashboard.html sends new Date(<datetime-local value>).toISOString()
+    response = client.post("/api/employee/meetings", json={"title": "Standup", "time": "2031-05-05T07:33:00.000Z"},
+                           headers=headers)
+    assert response.status_code == 200
+    assert response.json()["time"] == "2031-05-05T07:33:00"
+    response = client.post("/api/employee/meetings", json={"title": "Standup", "time": "09:33"}, headers=headers)
+    assert response.status_code == 422
+
+
+def test_lists_return_every_row_unless_limited(client):
+    headers = sign_up(client, admin=True)
+    rows = [{"user_id": user_id(), "title": f"T{i}"} for i in range(MAX_PAGE_SIZE + 20)]
+    assert client.post("/api/employee/tasks/bulk", json=rows, headers=headers).json()["inserted"] == len(rows)
+
+    response = client.get("/api/employee/tasks", headers=headers)
+    assert len(response.json()) == len(rows) and "X-Has-More" not in response.headers
+    response = client.get("/api/employee/tasks", params={"limit": 10}, headers=headers)
+    assert len(response.json()) == 10 and response.headers["X-Has-More"] == "true"
+    response = client.get("/api/employee/tasks", params={"limit": MAX_PAGE_SIZE * 2}, headers=headers)
+    assert len(response.json()) == MAX_PAGE_SIZE and response.headers["X-Has-More"] == "true"
+    response = client.get("/api/employee/meetings", params={"limit": 10}, headers=headers)
+    assert response.json() == [] and response.headers["X-Has-More"] == "false"
+
+
+def test_dashboard_next_meeting_is_upcoming(client):
+    headers = sign_up(client, admin=True)
+    now = datetime.utcnow()
+    meetings = {}
+    for title, minutes in [("Earlier", -60), ("Soon", 30), ("Later", 600), ("Undated", None)]:
+        time = (now + timedelta(minutes=minutes)).isoformat() if minutes is not None else None
+        meetings[title] = client.post("/api/employee/meetings", json={"title": title, "time": time},
+                                      headers=headers).json()["id"]
+
+    response = client.get("/api/employee/dashboard", headers=headers)
+    body = response.json()
+    assert [m["title"] for m in body["meetings"]] == ["Earlier", "Soon", "Later", "Undated"]
+    assert body["next_meeting"]["title"] == "Soon"
+    assert body["has_more"] == {"tasks": False, "events": False, "meetings": False}
+    etag = response.headers["ETag"]
+    assert client.get("/api/employee/dashboard", headers={**headers, "If-None-Match": etag}).status_code == 304
+
+    client.patch(f"/api/employee/meetings/{meetings['Soon']}/rsvp", headers=headers)
+    response = client.get("/api/employee/dashboard", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["next_meeting"]["title"] == "Later"
+
+
+def test_dashboard_sections_are_complete_unless_limited(client):
+    headers = sign_up(client, admin=True)
+    rows = [{"user_id": user_id(), "title": f"T{i}"} for i in range(60)]
+    client.post("/api/employee/tasks/bulk", json=rows, headers=headers)
+    body = client.get("/api/employee/dashboard", headers=headers).json()
+    assert len(body["tasks"]) == 60 and not body["has_more"]["tasks"]
+    assert body["next_meeting"] is None
+    body = client.get("/api/employee/dashboard", params={"limit": 50}, headers=headers).json()
+    assert len(body["tasks"]) == 50 and body["has_more"]["tasks"]
+
+
+def walk(client, path, headers, **params):
+    """Every row of a list endpoint read page by page through X-After-Cursor"""
+    rows, pages = [], 0
+    while True:
+        response = client.get(path, params=params, headers=headers)
+        assert response.status_code == 200
+        rows += response.json()
+        pages += 1
+        if response.headers["X-Has-More"] == "false":
+            assert "X-After-Cursor" not in response.headers
+            return rows, pages
+        params["after"] = response.headers["X-After-Cursor"]
+
+
+def test_list_pages_cover_every_row_in_order(client):
+    headers = sign_up(client, admin=True)
+    start = datetime(2031, 1, 1)
+    # Shared due dates and undated tasks, so ids break ties on both sides of the NULLs
+    dues = [start + timedelta(days=i % 4) if i % 3 else None for i in range(23)]
+    rows = [{"user_id": user_id(), "title": f"T{i}", "due": due.isoformat() if due else None}
+            for i, due in enumerate(dues)]
+    client.post("/api/employee/tasks/bulk", json=rows, headers=headers)
+    client.post("/api/employee/meetings/bulk", json=[{"title": f"M{i}"} for i in range(7)], headers=headers)
+
+    everything = client.get("/api/employee/tasks", headers=headers).json()
+    for limit in (1, 4, 5, 22, 23):
+        tasks, pages = walk(client, "/api/employee/tasks", headers, limit=limit)
+        assert tasks == everything and pages == -(-23 // limit)
+    open_early = client.get("/api/employee/tasks", params={"status": "open", "end": start + timedelta(days=1)},
+                         headers=headers).json()
+    assert walk(client, "/api/employee/tasks", headers, status="open", end=start + timedelta(days=1), limit=2)[0] \
+        == open_early
+    meetings, pages = walk(client, "/api/employee/meetings", headers, limit=3)
+    assert [m["title"] for m in meetings] == [f"M{i}" for i in range(7)] and pages == 3
+    response = client.get("/api/employee/events", params={"limit": 3, "after": "not a cursor!"}, headers=headers)
+    assert response.status_code == 400
+
+
+def test_dashboard_cursors_continue_at_the_list_endpoints(client):
+    headers = sign_up(client, admin=True)
+    rows = [{"user_id": user_id(), "title": f"T{i}", "due": (datetime(2031, 1, 1) + timedelta(days=i % 2)).isoformat()}
+            for i in range(12)]
+    client.post("/api/employee/tasks/bulk", json=rows, headers=headers)
+    client.post("/api/employee/events/bulk", json=[{"title": f"E{i}"} for i in range(3)], headers=headers)
+
+    body = client.get("/api/employee/dashboard", params={"limit": 5}, headers=headers).json()
+    assert body["has_more"] == {"tasks": True, "events": False, "meetings": False}
+    assert body["cursors"]["events"] is None and body["cursors"]["meetings"] is None
+    rest, _ = walk(client, "/api/employee/tasks", headers, limit=5, after=body["cursors"]["tasks"])
+    assert body["tasks"] + rest == client.get("/api/employee/tasks", headers=headers).json()
+    assert len(body["tasks"] + rest) == 12
@@ -0,0 +1,105 @@
+# Backend/tests/test_event_broker.py
+
+import asyncio
+
+import pytest
+
+from controllers.event_broker import BROADCAST, Broker, InProcessBroker, user_channel
+
+
+def test_broker_is_abstract():
+    with pytest.raises(TypeError):
+        Broker()
+
+    class Incomplete(Broker):
+        def publish(self, channel, event_type, data):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def drain(subscription):
+    events = []
+    while not subscription.queue.empty():
+        event = subscription.queue.get_nowait()
+        if event is not None:
+            events.append((event["type"], event["data"]))
+    return events
+
+
+def test_publish_reaches_subscribed_channels():
+    async def main():
+        broker = InProcessBroker()
+        subscription = broker.subscribe([BROADCAST, user_channel(1)])
+        broker.publish(user_channel(1), "task.created", {"id": 1})
+        broker.publish(user_channel(2), "task.created", {"id": 2})
+        broker.publish(BROADCAST, "event.created", {"id": 3})
+        return drain(subscription)
+
+    assert asyncio.run(main()) == [("task.created", {"id": 1}), ("event.created", {"id": 3})]
+
+
+def test_event_ids_differ_between_restarts():
+    first, second = InProcessBroker(), InProcessBroker()
+    first.publish(BROADCAST, "event.created", {})
+    second.publish(BROADCAST, "event.created", {})
+    assert first.boot_id != second.boot_id
+    assert first.snapshot()["last_event_id"] != second.snapshot()["last_event_id"]
+
+
+def test_last_event_id_replays_missed_events():
+    async def main():
+        broker = InProcessBroker()
+        broker.publish(BROADCAST, "event.created", {"id": 1})
+        last_event_id = broker.snapshot()["last_event_id"]
+        broker.publish(BROADCAST, "event.created", {"id": 2})
+        broker.publish(user_channel(1), "task.created", {"id": 3})
+        broker.publish(user_channel(2), "task.created", {"id": 4})
+        return drain(broker.subscribe([BROADCAST, user_channel(1)], last_event_id))
+
+    assert asyncio.run(main()) == [("event.created", {"id": 2}), ("task.created", {"id": 3})]
+
+
+@pytest.mark.parametrize("last_event_id", ["other0boot12-1", "42", "garbage", "-"])
+def test_unknown_last_event_id_gets_resync(last_event_id):
+    async def main():
+        broker = InProcessBroker()
+        broker.publish(BROADCAST, "event.created", {"id": 1})
+        return drain(broker.subscribe([BROADCAST], last_event_id))
+
+    assert asyncio.run(main()) == [("resync", {})]
+
+
+def test_evicted_events_get_resync():
+    async def main():
+        broker = InProcessBroker(history=2)
+        broker.publish(BROADCAST, "event.created", {"id": 1})
+        last_event_id = broker.snapshot()["last_event_id"]
+        for i in range(2, 5):
+            broker.publish(BROADCAST, "event.created", {"id": i})
+        return drain(broker.subscribe([BROADCAST], last_event_id))
+
+    assert asyncio.run(main()) == [("resync", {})]
+
+
+def test_slow_subscriber_gets_resync():
+    async def main():
+        broker = InProcessBroker(queue_size=2)
+        subscription = broker.subscribe([BROADCAST])
+        for i in range(3):
+            broker.publish(BROADCAST, "event.created", {"id": i})
+        return drain(subscription), broker.snapshot()["dropped"]
+
+    assert asyncio.run(main()) == ([("resync", {})], 1)
+
+
+def test_close_all_ends_subscriptions():
+    async def main():
+        broker = InProcessBroker()
+        subscription = broker.subscribe([BROADCAST])
+        broker.close_all()
+        event = await subscription.next_event(timeout=1)
+        return event, subscription.closed, broker.snapshot()["subscribers"]
+
+    assert asyncio.run(main()) == (None, True, 0)
@@ -0,0 +1,230 @@
+# Backend/tests/test_migrations.py
+# Alembic migrations run against throwaway SQLite files, one per test.
+
+import importlib.util
+import os
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+
+from config.database import Base
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VERSIONS_DIR = os.path.join(BACKEND_DIR, "alembic", "versions")
+
+
+def load_migration(name):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(VERSIONS_DIR, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+schedule = load_migration("20261019_datetime_schedule_columns")
+
+
+def alembic(db_path, *args):
+    """Run the alembic CLI on db_path (env.py reads DATABASE_URL)"""
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}")
+    env.pop("ASYNC_DATABASE_URL", None)
+    subprocess.run([sys.executable, "-m", "alembic", *args], cwd=BACKEND_DIR, env=env,
+                   check=True, capture_output=True)
+
+
+def as_datetime(value):
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "migrations.db")
+
+
+# --- 20261019_datetime_schedule_columns: parsing ---
+
+@pytest.mark.parametrize("text, expected", [
+    ("2025-09-01", datetime(2025, 9, 1)),
+    ("2025-09-01 14:30", datetime(2025, 9, 1, 14, 30)),
+    ("2025-09-01T14:30:00Z", datetime(2025, 9, 1, 14, 30)),
+    ("2025-09-01T16:30:00+02:00", datetime(2025, 9, 1, 14, 30)),
+    ("01/09/2025", datetime(2025, 9, 1)),
+    ("September 1, 2025", datetime(2025, 9, 1)),
+    ("  2025/09/01 08:00  ", datetime(2025, 9, 1, 8, 0)),
+])
+def test_parse_dates(text, expected):
+    assert schedule.parse(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("09:33", datetime(2025, 8, 26, 9, 33)),
+    ("09:33:15", datetime(2025, 8, 26, 9, 33, 15)),
+    ("9:05 pm", datetime(2025, 8, 26, 21, 5)),
+    ("3 PM", datetime(2025, 8, 26, 15, 0)),
+])
+def test_parse_time_of_day_uses_created_at_date(text, expected):
+    # SQLite hands DateTime values back as text
+    assert schedule.parse(text, "2025-08-26 18:02:11.123456") == expected
+    assert schedule.parse(text, datetime(2025, 8, 26, 18, 2)) == expected
+
+
+@pytest.mark.parametrize("text, created_at", [
+    ("09:33", None),
+    ("next week", "2025-08-26 18:02:11"),
+    ("", "2025-08-26 18:02:11"),
+    ("   ", None),
+])
+def test_parse_unreadable(text, created_at):
+    assert schedule.parse(text, created_at) is None
+
+
+def test_format_value():
+    created_at = "2025-08-26 18:02:11.123456"
+    assert schedule.format_value("time", "2025-08-26 09:33:00.000000", created_at) == "09:33"
+    assert schedule.format_value("time", datetime(2025, 8, 27, 9, 33), created_at) == "2025-08-27 09:33"
+    assert schedule.format_value("due", datetime(2025, 9, 1), created_at) == "2025-09-01"
+    assert schedule.format_value("date", datetime(2025, 9, 1, 14, 30), created_at) == "2025-09-01 14:30"
+    assert schedule.format_value("due", None, created_at) is None
+
+
+def test_unparsed_line():
+    assert schedule._unparsed_line("Due", "Call the supplier\nDue: next week") == ("next week", "Call the supplier")
+    assert schedule._unparsed_line("Due", "Due: next week") == ("next week", None)
+    assert schedule._unparsed_line("Due", "Call the supplier") == (None, "Call the supplier")
+    assert schedule._unparsed_line("Time", "Due: next week") == (None, "Due: next week")
+    assert schedule._unparsed_line("Due", None) == (None, None)
+
+
+# --- 20261019_datetime_schedule_columns: upgrade and downgrade ---
+
+def seed_text_schedule(db_path):
+    """Rows as the admin forms stored them before the schedule columns became DateTime"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO users (id, email, hashed_password, is_active, is_admin) VALUES (1, 'a@b.com', 'x', 1, 0)")
+    conn.executemany(
+        "INSERT INTO tasks (id, user_id, title, due, description, created_at, completed) VALUES (?, 1, ?, ?, ?, ?, 0)",
+        [
+            (1, "Dated", "2025-09-01", None, "2025-08-26 10:00:00"),
+            (2, "Vague", "next week", "Call the supplier", "2025-08-26 10:00:00"),
+            (3, "Open", None, None, "2025-08-26 10:00:00"),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO events (id, title, date, description, created_at) VALUES (?, ?, ?, ?, ?)",
+        [(1, "Gala", "26/09/2025", "Ballroom", "2025-08-26 10:00:00")],
+    )
+    conn.executemany(
+        "INSERT INTO meetings (id, title, time, description, created_at) VALUES (?, ?, ?, ?, ?)",
+        [
+            (1, "Standup", "09:33", None, "2025-08-26 08:15:42.000001"),
+            (2, "Review", "2025-08-30T14:00:00Z", None, "2025-08-26 08:15:42"),
+            (3, "Someday", "soon", None, "2025-08-26 08:15:42"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def column_type(conn, table, column):
+    return {row[1]: row[2] for row in conn.execute(f"PRAGMA table_info({table})")}[column]
+
+
+def test_schedule_columns_upgrade_and_downgrade(db_path):
+    alembic(db_path, "upgrade", "20261019_add_rsvps")
+    seed_text_schedule(db_path)
+
+    alembic(db_path, "upgrade", "20261019_datetime_schedule_columns")
+    conn = sqlite3.connect(db_path)
+    assert column_type(conn, "tasks", "due") == "DATETIME"
+    assert column_type(conn, "meetings", "time") == "DATETIME"
+    tasks = {row[0]: row[1:] for row in conn.execute("SELECT id, due, description FROM tasks")}
+    assert as_datetime(tasks[1][0]) == datetime(2025, 9, 1)
+    assert tasks[2] == (None, "Call the supplier\nDue: next week")
+    assert tasks[3] == (None, None)
+    event = conn.execute("SELECT date, description FROM events").fetchone()
+    assert (as_datetime(event[0]), event[1]) == (datetime(2025, 9, 26), "Ballroom")
+    meetings = {row[0]: row[1:] for row in conn.execute("SELECT id, time, description FROM meetings")}
+    assert as_datetime(meetings[1][0]) == datetime(2025, 8, 26, 9, 33)
+    assert as_datetime(meetings[2][0]) == datetime(2025, 8, 30, 14, 0)
+    assert meetings[3] == (None, "Time: soon")
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"ix_tasks_user_id_due", "ix_events_date", "ix_meetings_time"} <= indexes
+    conn.close()
+
+    alembic(db_path, "downgrade", "20261019_add_rsvps")
+    conn = sqlite3.connect(db_path)
+    assert column_type(conn, "tasks", "due") == "VARCHAR"
+    assert dict(conn.execute("SELECT id, due FROM tasks")) == {1: "2025-09-01", 2: "next week", 3: None}
+    assert dict(conn.execute("SELECT id, description FROM tasks")) == {1: None, 2: "Call the supplier", 3: None}
+    assert conn.execute("SELECT date, description FROM events").fetchone() == ("2025-09-26", "Ballroom")
+    assert dict(conn.execute("SELECT id, time FROM meetings")) == {1: "09:33", 2: "2025-08-30 14:00", 3: "soon"}
+    assert dict(conn.execute("SELECT id, description FROM meetings")) == {1: None, 2: None, 3: None}
+    conn.close()
+
+
+def test_schedule_columns_skip_tables_created_by_db_init(db_path):
+    # db_init.py creates the columns as DateTime already; the upgrade must leave them alone
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    alembic(db_path, "stamp", "20261019_add_rsvps")
+    alembic(db_path, "upgrade", "20261019_datetime_schedule_columns")
+    conn = sqlite3.connect(db_path)
+    assert column_type(conn, "meetings", "time") == "DATETIME"
+    conn.close()
+
+
+# --- 20261019_add_chat_messages_fts ---
+
+def test_chat_messages_fts_upgrade_indexes_existing_messages(db_path):
+    alembic(db_path, "upgrade", "20261019_add_chat_session_summary")
+    # chat_messages comes from db_init.py, not from a migration
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO users (id, email, hashed_password, is_active, is_admin) VALUES (1, 'a@b.com', 'x', 1, 0)")
+    conn.execute("INSERT INTO chat_sessions (id, user_id, title) VALUES (1, 1, 'Stay')")
+    conn.executemany(
+        "INSERT INTO chat_messages (id, user_id, session_id, sender, message) VALUES (?, 1, 1, 'user', ?)",
+        [(1, "Is the pool heated?"), (2, "Can I get extra towels?")],
+    )
+    conn.commit()
+    conn.close()
+
+    alembic(db_path, "upgrade", "head")
+    conn = sqlite3.connect(db_path)
+
+    def search(query):
+        return [row[0] for row in conn.execute(
+            "SELECT rowid FROM chat_messages_fts WHERE chat_messages_fts MATCH ? ORDER BY rowid", (query,))]
+
+    assert search("pool") == [1]
+    assert search("towel") == [2]  # Porter stemming
+    # Triggers keep the index in step with later writes
+    conn.execute("INSERT INTO chat_messages (id, user_id, session_id, sender, message) VALUES (3, 1, 1, 'bot', 'The pool opens at 7')")
+    conn.execute("UPDATE chat_messages SET message = 'Where is the spa?' WHERE id = 1")
+    conn.execute("DELETE FROM chat_messages WHERE id = 2")
+    conn.commit()
+    assert search("pool") == [3]
+    assert search("spa") == [1]
+    assert search("towels") == []
+    conn.close()
+
+    alembic(db_path, "downgrade", "20261019_add_chat_session_summary")
+    conn = sqlite3.connect(db_path)
+    leftovers = conn.execute(
+        "SELECT name FROM sqlite_master WHERE name LIKE 'chat_messages_fts%'").fetchall()
+    assert leftovers == []
+    conn.close()
+
+
+def test_chat_messages_fts_upgrade_without_chat_tables(db_path):
+    alembic(db_path, "upgrade", "head")
+    conn = sqlite3.connect(db_path)
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert "chat_messages_fts" not in tables
+    conn.close()
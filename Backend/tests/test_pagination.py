@@ -0,0 +1,125 @@
+# Backend/tests/test_pagination.py
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy import select
+
+from models.chat_message import ChatMessage
+from models.chat_session import ChatSession
+from models.user import User
+from utils.pagination import MAX_PAGE_SIZE, Page, decode_cursor, encode_cursor, keyset_paginate
+
+START = datetime(2026, 1, 1, 12, 0)
+
+
+def test_cursor_round_trip():
+    timestamp = datetime(2026, 1, 1, 12, 30, 15, 123456)
+    cursor = encode_cursor(timestamp, 42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (timestamp, 42)
+
+
+def test_nullable_cursor_round_trip():
+    assert decode_cursor(encode_cursor(None, 7), nullable=True) == (None, 7)
+    timestamp = datetime(2026, 1, 1, 12, 30)
+    assert decode_cursor(encode_cursor(timestamp, 7), nullable=True) == (timestamp, 7)
+    with pytest.raises(HTTPException):
+        decode_cursor(encode_cursor(None, 7))
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor!", "", "bm90aGluZw", "MjAyNi0wMS0wMXxhYmM"])
+def test_invalid_cursor(cursor):
+    with pytest.raises(HTTPException) as e:
+        decode_cursor(cursor)
+    assert e.value.status_code == 400
+
+
+def test_page_headers():
+    response = Response()
+    Page([1], before_cursor="b", after_cursor="a", has_more=True).set_headers(response)
+    assert (response.headers["X-Before-Cursor"], response.headers["X-After-Cursor"]) == ("b", "a")
+    assert response.headers["X-Has-More"] == "true"
+    response = Response()
+    Page([]).set_headers(response)
+    assert "X-Before-Cursor" not in response.headers
+    assert response.headers["X-Has-More"] == "false"
+
+
+@pytest.fixture
+def paginate(run_db):
+    """
+    Seven messages, ids 1-7 in time order; 3 and 4 share a timestamp so the
+    id breaks the tie. paginate(**kwargs) returns (ids, page).
+    """
+    async def seed(db):
+        db.add(User(id=1, email="a@b.com", hashed_password="x"))
+        db.add(ChatSession(id=1, user_id=1, title="Stay"))
+        minutes = [0, 1, 2, 2, 3, 4, 5]
+        db.add_all([
+            ChatMessage(id=i + 1, user_id=1, session_id=1, sender="user", message=f"m{i + 1}",
+                        timestamp=START + timedelta(minutes=minute))
+            for i, minute in enumerate(minutes)
+        ])
+        await db.commit()
+
+    run_db(seed)
+
+    def read(**kwargs):
+        async def page(db):
+            return await keyset_paginate(db, select(ChatMessage), ChatMessage.timestamp, ChatMessage.id, **kwargs)
+        result = run_db(page)
+        return [message.id for message in result.items], result
+
+    return read
+
+
+def test_newest_first_pages_backwards(paginate):
+    ids, page = paginate(limit=3)
+    assert ids == [7, 6, 5] and page.has_more
+    ids, page = paginate(limit=3, before=page.before_cursor)
+    assert ids == [4, 3, 2] and page.has_more
+    ids, page = paginate(limit=3, before=page.before_cursor)
+    assert ids == [1] and not page.has_more
+
+
+def test_after_walks_forward_without_gaps(paginate):
+    _, page = paginate(limit=2, before=encode_cursor(START + timedelta(minutes=2), 4))
+    assert [m.id for m in page.items] == [3, 2]
+    ids, page = paginate(limit=2, after=page.after_cursor)
+    assert ids == [5, 4] and page.has_more
+    ids, page = paginate(limit=2, after=page.after_cursor)
+    assert ids == [7, 6] and not page.has_more
+
+
+def test_chronological_order(paginate):
+    ids, page = paginate(limit=3, newest_first=False)
+    assert ids == [5, 6, 7]
+    assert decode_cursor(page.before_cursor)[1] == 5
+    assert decode_cursor(page.after_cursor)[1] == 7
+    ids, _ = paginate(limit=3, newest_first=False, before=page.before_cursor)
+    assert ids == [2, 3, 4]
+
+
+def test_empty_page_keeps_cursors(paginate):
+    _, newest = paginate(limit=1)
+    ids, page = paginate(after=newest.after_cursor)
+    assert ids == [] and not page.has_more
+    assert page.after_cursor == newest.after_cursor
+
+
+def test_limit_is_clamped(paginate):
+    ids, page = paginate(limit=0)
+    assert ids == [7] and page.has_more
+    ids, _ = paginate(limit=MAX_PAGE_SIZE + 1)
+    assert len(ids) == 7
+
+
+def test_no_limit_reads_every_row(paginate):
+    ids, page = paginate(limit=None)
+    assert ids == [7, 6, 5, 4, 3, 2, 1] and not page.has_more
+    ids, page = paginate(limit=None, before=encode_cursor(START + timedelta(minutes=2), 4))
+    assert ids == [3, 2, 1] and not page.has_more
+    ids, _ = paginate(limit=None, newest_first=False)
+    assert ids == [1, 2, 3, 4, 5, 6, 7]
@@ -0,0 +1,59 @@
+# Backend/tests/test_query_budget.py
+# Statements per request stay flat as rows grow: an N+1 pattern (a lazy load or
+# a query per row) fails here instead of in a load test.
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, select
+
+from config.database import async_engine, engine
+from models.employee_data import Task
+from models.user import User
+from models.user_activity import UserActivity
+from utils import query_counter
+from utils.query_counter import count_queries
+
+from conftest import sign_up
+
+USERS = 60
+ACTIVITIES_PER_USER = 5
+TASKS = 200
+
+
+@pytest.fixture
+def admin(client):
+    query_counter.install(engine, async_engine.sync_engine)
+    headers = sign_up(client, admin=True)
+    start = datetime(2031, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"full_name": f"Guest {i}", "email": f"guest{i}@b.com", "hashed_password": "x", "is_active": True}
+            for i in range(USERS)
+        ])
+        user_ids = conn.execute(select(User.id)).scalars().all()
+        conn.execute(insert(UserActivity), [
+            {"user_id": user_id, "action": "chat", "endpoint": "/chat", "timestamp": start + timedelta(minutes=i)}
+            for user_id in user_ids for i in range(ACTIVITIES_PER_USER)
+        ])
+        admin_id = conn.execute(select(User.id).where(User.email == "a@b.com")).scalar_one()
+        conn.execute(insert(Task), [
+            {"user_id": admin_id, "title": f"T{i}", "due": start + timedelta(days=i) if i % 2 else None}
+            for i in range(TASKS)
+        ])
+    return headers
+
+
+# The current user lookup plus one query, however many rows come back
+@pytest.mark.parametrize("path, params, rows, budget", [
+    ("/api/admin/user-activities", {"limit": 200}, 200, 2),
+    ("/api/admin/user-activities", {"limit": 200, "user_id": 2}, ACTIVITIES_PER_USER, 2),
+    ("/api/admin/users", {}, USERS + 1, 2),
+    ("/api/employee/tasks", {}, TASKS, 2),
+    ("/api/employee/tasks", {"limit": 50}, 50, 2),
+])
+def test_statements_per_request_stay_within_budget(client, admin, path, params, rows, budget):
+    with count_queries() as counter:
+        response = client.get(path, params=params, headers=admin)
+    assert response.status_code == 200 and len(response.json()) == rows
+    assert counter.count <= budget, counter.statements
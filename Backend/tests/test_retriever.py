@@ -0,0 +1,62 @@
+# Backend/tests/test_retriever.py
+# Extractive answers of retriever.py (project root), scored against knowledge.txt.
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from retriever import _asked_attributes, extract_answer  # noqa: E402
+from controllers.chat import _EXTRACTIVE_THRESHOLD  # noqa: E402
+
+AIRPORT = ("The nearest airport is Tangier Ibn Battouta Airport, approximately 20 km from the hotel. "
+           "Airport transfers can be arranged through our concierge.")
+
+
+def test_how_much_without_a_price_goes_to_the_model():
+    answer, confidence = extract_answer("how much is the airport transfer", AIRPORT)
+    assert confidence < _EXTRACTIVE_THRESHOLD
+
+
+def test_how_much_prefers_the_sentence_with_a_price():
+    context = AIRPORT + " Airport transfers cost 40 EUR per car."
+    answer, confidence = extract_answer("how much is the airport transfer", context)
+    assert answer == "Airport transfers cost 40 EUR per car."
+    assert confidence >= _EXTRACTIVE_THRESHOLD
+
+
+@pytest.mark.parametrize("question, context", [
+    ("when does the rooftop terrace open", "The rooftop terrace offers views of the Mediterranean."),
+    ("where is the business center", "The business center offers printing and meeting rooms."),
+    ("who handles lost luggage claims", "Lost luggage claims are handled promptly."),
+    ("how many tennis courts", "Tennis courts can be booked for guests."),
+    ("which restaurant serves seafood brunch", "Seafood brunch is served every Sunday at 11:00 AM."),
+])
+def test_sentences_missing_the_asked_attribute_score_lower(question, context):
+    _, confidence = extract_answer(question, context)
+    assert confidence < _EXTRACTIVE_THRESHOLD
+
+
+@pytest.mark.parametrize("question, context, expected", [
+    ("what time is breakfast served",
+     "Breakfast is served daily from 6:30 AM to 10:30 AM in our main restaurant.",
+     "Breakfast is served daily from 6:30 AM to 10:30 AM in our main restaurant."),
+    ("where is the business center",
+     "The business center is located on the ground floor next to the lobby.",
+     "The business center is located on the ground floor next to the lobby."),
+    ("which restaurant serves seafood brunch",
+     "Crudo, our seafood restaurant, serves brunch every Sunday.",
+     "Crudo, our seafood restaurant, serves brunch every Sunday."),
+])
+def test_sentences_with_the_asked_attribute_are_answered(question, context, expected):
+    answer, confidence = extract_answer(question, context)
+    assert answer == expected and confidence >= _EXTRACTIVE_THRESHOLD
+
+
+def test_asked_attributes():
+    assert _asked_attributes("is there a pool") == []
+    assert len(_asked_attributes("how much is the airport transfer")) == 1
+    assert len(_asked_attributes("when and where is the gala")) == 2
+    assert [p.pattern for p in _asked_attributes("which restaurants are open")] == [r"\brestaurant"]
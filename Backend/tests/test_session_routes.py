@@ -0,0 +1,53 @@
+# Backend/tests/test_session_routes.py
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from config.database import engine
+from models.chat_message import ChatMessage
+from utils.pagination import DEFAULT_PAGE_SIZE
+
+from conftest import sign_up
+
+
+def test_session_list_is_complete_unless_limited(client):
+    headers = sign_up(client)
+    count = DEFAULT_PAGE_SIZE + 10
+    ids = [client.post("/api/session/new", json={"title": f"S{i}"}, headers=headers).json()["id"]
+           for i in range(count)]
+
+    response = client.get("/api/session/list", headers=headers)
+    assert [s["id"] for s in response.json()] == ids[::-1]
+    assert response.headers["X-Has-More"] == "false"
+
+    # The app can still page: newest first, then older ones with the cursor
+    response = client.get("/api/session/list", params={"limit": 25}, headers=headers)
+    seen = [s["id"] for s in response.json()]
+    while response.headers["X-Has-More"] == "true":
+        response = client.get("/api/session/list", headers=headers,
+                              params={"limit": 25, "before": response.headers["X-Before-Cursor"]})
+        seen += [s["id"] for s in response.json()]
+    assert seen == ids[::-1]
+
+
+def test_session_messages_are_complete_unless_limited(client):
+    headers = sign_up(client)
+    session = client.post("/api/session/new", json={"title": "Stay"}, headers=headers).json()
+    start = datetime(2026, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(ChatMessage), [
+            {"user_id": session["user_id"], "session_id": session["id"], "sender": "user",
+             "message": f"m{i}", "timestamp": start + timedelta(seconds=i)}
+            for i in range(150)
+        ])
+
+    url = f"/api/chat/session/{session['id']}"
+    response = client.get(url, headers=headers)
+    assert [m["message"] for m in response.json()] == [f"m{i}" for i in range(150)]
+    response = client.get(url, params={"limit": 100}, headers=headers)
+    assert [m["message"] for m in response.json()] == [f"m{i}" for i in range(50, 150)]
+    assert response.headers["X-Has-More"] == "true"
+    response = client.get(url, params={"limit": 100, "before": response.headers["X-Before-Cursor"]}, headers=headers)
+    assert [m["message"] for m in response.json()] == [f"m{i}" for i in range(50)]
+    assert response.headers["X-Has-More"] == "false"
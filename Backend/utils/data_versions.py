@@ -0,0 +1,71 @@
+# Backend/utils/data_versions.py
+# Version counters for conditional GETs.
+#
+# Every write to dashboard data bumps the counter of its scope in the same
+# transaction, so a response can be tagged with the versions it was read at
+# and a client holding that tag is answered with 304 after a single primary
+# key lookup, without querying or serializing the data itself.
+#
+#   EVENTS / MEETINGS   any event / meeting created or changed
+#   tasks:<user id>     the user's tasks
+#   rsvps:<user id>     the user's RSVPs
+
+import hashlib
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from config.database import IS_SQLITE
+from models.data_version import DataVersion
+
+EVENTS = "events"
+MEETINGS = "meetings"
+
+
+def tasks_scope(user_id: int) -> str:
+    return f"tasks:{user_id}"
+
+
+def rsvps_scope(user_id: int) -> str:
+    return f"rsvps:{user_id}"
+
+
+async def bump_versions(db, *scopes: str):
+    """Increment the counters of `scopes` in the caller's transaction (committed with the change)"""
+    insert = sqlite.insert if IS_SQLITE else postgresql.insert
+    now = datetime.utcnow()
+    stmt = insert(DataVersion).values([
+        {"scope": scope, "version": 1, "updated_at": now} for scope in dict.fromkeys(scopes)
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["scope"],
+        set_={"version": DataVersion.version + 1, "updated_at": now},
+    )
+    await db.execute(stmt)
+
+
+async def read_versions(db, scopes) -> dict:
+    """Current counter of each scope (0 when it was never bumped)"""
+    rows = (await db.execute(
+        select(DataVersion.scope, DataVersion.version).where(DataVersion.scope.in_(scopes))
+    )).all()
+    versions = dict.fromkeys(scopes, 0)
+    versions.update(rows)
+    return versions
+
+
+def make_etag(versions: dict, *parts) -> str:
+    """Weak ETag of the versions a response was built from plus anything else it depends on"""
+    key = "|".join([f"{scope}={version}" for scope, version in sorted(versions.items())] + [str(p) for p in parts])
+    return f'W/"{hashlib.sha1(key.encode()).hexdigest()[:20]}"'
+
+
+def etag_matches(if_none_match, etag: str) -> bool:
+    """True when an If-None-Match header lists `etag` (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == tag for candidate in if_none_match.split(","))
@@ -1,73 +1,123 @@
-def send_rsvp_email(item_type, item_title, employee_name):
-    sender_email = "ismail.bakraoui0@gmail.com"  # Use your Gmail
-    sender_password = "vybg xxax zikc ffzp"  # Use your Gmail App Password
-    receiver_email = "ismail.bakraoui@emsi-edu.ma"  # Or whoever should get the notification
-    subject = f"RSVP Notification: {item_type} - {item_title}"
-    body = f"""
-    Hello Admin,<br><br>
-    Employee <b>{employee_name}</b> has RSVP'd to the {item_type.lower()} <b>{item_title}</b>.<br><br>
-    Regards,<br>Fairmont System
-    """
-    msg = MIMEMultipart()
-    msg['From'] = sender_email
-    msg['To'] = receiver_email
-    msg['Subject'] = subject
-    msg.attach(MIMEText(body, 'html'))
-    try:
-        with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-            server.login(sender_email, sender_password)
-            server.sendmail(sender_email, receiver_email, msg.as_string())
-    except Exception as e:
-        print(f"Failed to send RSVP email: {e}")
 import smtplib
+from datetime import datetime, timedelta
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
-def send_task_approval_email(task_title, employee_name, task_id):
-    sender_email = "ismail.bakraoui0@gmail.com"  # Replace with your Gmail address
-    sender_password = "vybg xxax zikc ffzp"  # Replace with your Gmail App Password
-    receiver_email = "ismail.bakraoui@emsi-edu.ma"
+from config.email_config import (
+    SMTP_HOST,
+    SMTP_PORT,
+    SMTP_SECURITY,
+    SMTP_USER,
+    SMTP_PASSWORD,
+    SMTP_TIMEOUT,
+    EMAIL_SENDER,
+    EMAIL_ADMIN_RECIPIENT,
+    APP_BASE_URL,
+    EMAIL_DIGEST_WINDOW,
+)
+from models.email_outbox import EmailOutbox
+
+# Notifications are not sent from the request: queue_* add a row to the email
+# outbox in the caller's session, so the email is committed together with the
+# change it reports. controllers/email_sender.py delivers the outbox.
+#
+# Digest mode (EMAIL_DIGEST_WINDOW > 0): task approvals and RSVPs are queued as
+# items holding only their HTML fragment and are held for the window. When the
+# first item of a recipient becomes due, the sender takes every pending item of
+# the same kind for that recipient and sends them as one message (build_digest).
+
+DIGEST_TASK_APPROVAL = "task_approval"
+DIGEST_RSVP = "rsvp"
+
+def _queue(db, subject, body, recipient=EMAIL_ADMIN_RECIPIENT):
+    db.add(EmailOutbox(recipient=recipient, subject=subject, body=body))
+
+def _queue_digest_item(db, kind, subject, item, recipient=EMAIL_ADMIN_RECIPIENT):
+    db.add(EmailOutbox(
+        recipient=recipient, subject=subject, body=item, digest=kind,
+        next_attempt_at=datetime.utcnow() + timedelta(seconds=EMAIL_DIGEST_WINDOW),
+    ))
+
+def _task_links(task_id):
+    approve_url = f"{APP_BASE_URL}/api/employee/admin/approve_task/{task_id}"
+    decline_url = f"{APP_BASE_URL}/api/employee/admin/decline_task/{task_id}"
+    return f"<a href='{approve_url}'>Approve</a> or <a href='{decline_url}'>Decline</a>"
+
+def queue_task_approval_email(db, task_title, employee_name, task_id):
     subject = f"Task Completion Approval Needed: {task_title}"
-    approve_url = f"http://localhost:8080/api/employee/admin/approve_task/{task_id}"
-    decline_url = f"http://localhost:8080/api/employee/admin/decline_task/{task_id}"
+    if EMAIL_DIGEST_WINDOW > 0:
+        item = f"<b>{employee_name}</b> marked <b>{task_title}</b> as done: {_task_links(task_id)}"
+        _queue_digest_item(db, DIGEST_TASK_APPROVAL, subject, item)
+        return
 
     body = f"""
     Hello Admin,<br><br>
     Employee <b>{employee_name}</b> has marked the task <b>{task_title}</b> as done.<br>
-    Please <a href='{approve_url}'>Approve</a> or <a href='{decline_url}'>Decline</a> this completion.<br><br>
+    Please {_task_links(task_id)} this completion.<br><br>
     Regards,<br>Fairmont System
     """
-    msg = MIMEMultipart()
-    msg['From'] = sender_email
-    msg['To'] = receiver_email
-    msg['Subject'] = subject
-    msg.attach(MIMEText(body, 'html'))
-
-    try:
-        with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-            server.login(sender_email, sender_password)
-            server.sendmail(sender_email, receiver_email, msg.as_string())
-    except Exception as e:
-        print(f"Failed to send email: {e}")
+    _queue(db, subject, body)
 
-def send_task_confirmation_email(task_title, approved=True):
-    sender_email = "ismail.bakraoui0@gmail.com"  # Use your Gmail
-    sender_password = "vybg xxax zikc ffzp"  # Use your Gmail App Password
-    receiver_email = "ismail.bakraoui@emsi-edu.ma"  # Or whoever should get the confirmation
+def queue_task_confirmation_email(db, task_title, approved=True):
     subject = f"Task {'Approved' if approved else 'Declined'}: {task_title}"
     body = f"""
     Hello Admin,<br><br>
     You have {'approved' if approved else 'declined'} the task <b>{task_title}</b>.<br><br>
     Regards,<br>Fairmont System
     """
+    _queue(db, subject, body)
+
+def queue_rsvp_email(db, item_type, item_title, employee_name):
+    subject = f"RSVP Notification: {item_type} - {item_title}"
+    if EMAIL_DIGEST_WINDOW > 0:
+        item = f"<b>{employee_name}</b> RSVP'd to the {item_type.lower()} <b>{item_title}</b>"
+        _queue_digest_item(db, DIGEST_RSVP, subject, item)
+        return
+
+    body = f"""
+    Hello Admin,<br><br>
+    Employee <b>{employee_name}</b> has RSVP'd to the {item_type.lower()} <b>{item_title}</b>.<br><br>
+    Regards,<br>Fairmont System
+    """
+    _queue(db, subject, body)
+
+def build_digest(kind, rows):
+    """Subject and body of one message for the pending digest items (outbox rows) of a kind"""
+    if len(rows) == 1:
+        subject = rows[0].subject
+    elif kind == DIGEST_TASK_APPROVAL:
+        subject = f"Task Completion Approvals Needed: {len(rows)} tasks"
+    else:
+        subject = f"RSVP Notifications: {len(rows)} new RSVPs"
+    intro = (
+        "The following tasks have been marked as done and need your approval:"
+        if kind == DIGEST_TASK_APPROVAL else "Employees have sent the following RSVPs:"
+    )
+    entries = "".join(f"<li>{row.body}</li>" for row in rows)
+    body = f"""
+    Hello Admin,<br><br>
+    {intro}<br>
+    <ul>{entries}</ul>
+    Regards,<br>Fairmont System
+    """
+    return subject, body
+
+def open_smtp_connection():
+    """Connect and log in to the configured SMTP server"""
+    if SMTP_SECURITY == "ssl":
+        server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT)
+    else:
+        server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT)
+        if SMTP_SECURITY == "starttls":
+            server.starttls()
+    if SMTP_USER and SMTP_PASSWORD:
+        server.login(SMTP_USER, SMTP_PASSWORD)
+    return server
+
+def build_message(recipient, subject, body):
     msg = MIMEMultipart()
-    msg['From'] = sender_email
-    msg['To'] = receiver_email
+    msg['From'] = EMAIL_SENDER
+    msg['To'] = recipient
     msg['Subject'] = subject
     msg.attach(MIMEText(body, 'html'))
-    try:
-        with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-            server.login(sender_email, sender_password)
-            server.sendmail(sender_email, receiver_email, msg.as_string())
-    except Exception as e:
-        print(f"Failed to send confirmation email: {e}")
+    return msg.as_string()
@@ -0,0 +1,98 @@
+# Backend/utils/pagination.py
+# Keyset (cursor) pagination on (timestamp, id).
+#
+# Pages are read with "WHERE (timestamp, id) < cursor ORDER BY timestamp DESC, id DESC
+# LIMIT n" so every page costs one index range scan, however deep the client pages.
+# Cursors are returned in response headers so list bodies stay plain JSON arrays:
+#   X-Before-Cursor  pass as ?before= to load older rows
+#   X-After-Cursor   pass as ?after= to load rows newer than this page (incremental sync)
+#   X-Has-More       "true" when more rows exist in the direction that was read
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException, Response
+from sqlalchemy import tuple_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+CURSOR_HEADERS = ["X-Before-Cursor", "X-After-Cursor", "X-Has-More"]
+
+
+def encode_cursor(timestamp: Optional[datetime], row_id: int) -> str:
+    """Cursor of a row; a None timestamp (undated rows of nullable columns) is encoded as empty"""
+    raw = f"{timestamp.isoformat() if timestamp is not None else ''}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, nullable: bool = False):
+    """Returns (timestamp, id) of a cursor, 400 when it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = base64.urlsafe_b64decode(padded).decode().rsplit("|", 1)
+        if nullable and timestamp == "":
+            return None, int(row_id)
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+class Page:
+    """One page of rows plus the cursors around it"""
+
+    def __init__(self, items, before_cursor=None, after_cursor=None, has_more=False):
+        self.items = items
+        self.before_cursor = before_cursor
+        self.after_cursor = after_cursor
+        self.has_more = has_more
+
+    def set_headers(self, response: Response):
+        if self.before_cursor:
+            response.headers["X-Before-Cursor"] = self.before_cursor
+        if self.after_cursor:
+            response.headers["X-After-Cursor"] = self.after_cursor
+        response.headers["X-Has-More"] = "true" if self.has_more else "false"
+
+
+async def keyset_paginate(db, query, timestamp_column, id_column, before: str = None,
+                          after: str = None, limit: Optional[int] = DEFAULT_PAGE_SIZE,
+                          newest_first: bool = True, scalars: bool = True) -> Page:
+    """
+    Run `query` one page at a time on (timestamp_column, id_column).
+    Without cursors the newest `limit` rows are returned. `before` pages towards
+    older rows, `after` returns rows newer than the cursor (oldest of them first,
+    so repeated calls walk forward without gaps). Items are ordered newest first
+    unless newest_first is False (chronological, as chat history is displayed).
+    A `limit` of None reads every row in that direction (has_more is False).
+    """
+    if limit is not None:
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+    key = tuple_(timestamp_column, id_column)
+    if before:
+        query = query.where(key < tuple_(*decode_cursor(before)))
+    if after:
+        query = query.where(key > tuple_(*decode_cursor(after)))
+        query = query.order_by(timestamp_column.asc(), id_column.asc())
+    else:
+        query = query.order_by(timestamp_column.desc(), id_column.desc())
+
+    result = await db.execute(query if limit is None else query.limit(limit + 1))
+    rows = result.scalars().all() if scalars else result.all()
+    has_more = limit is not None and len(rows) > limit
+    rows = list(rows[:limit])
+
+    # rows are read oldest first when walking forward, newest first otherwise
+    ascending = bool(after)
+    if ascending != (not newest_first):
+        rows.reverse()
+
+    def cursor_of(row):
+        return encode_cursor(getattr(row, timestamp_column.key), getattr(row, id_column.key))
+
+    if not rows:
+        return Page([], before_cursor=before, after_cursor=after, has_more=False)
+    oldest, newest = (rows[-1], rows[0]) if newest_first else (rows[0], rows[-1])
+    return Page(rows, before_cursor=cursor_of(oldest), after_cursor=cursor_of(newest), has_more=has_more)
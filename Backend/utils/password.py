@@ -1,5 +1,8 @@
+import time
 from passlib.context import CryptContext
 
+# Kept free of app imports: these functions also run in the password hashing
+# worker processes (controllers/password_hasher.py)
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def hash_password(password: str) -> str:
@@ -7,3 +10,13 @@ def hash_password(password: str) -> str:
 
 def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
+
+def run_timed(operation: str, *args):
+    """Run hash_password/verify_password, returning (result, milliseconds spent hashing)"""
+    started = time.perf_counter()
+    result = {"hash": hash_password, "verify": verify_password}[operation](*args)
+    return result, (time.perf_counter() - started) * 1000
+
+def warm_up() -> bool:
+    """No-op job used to start the worker processes ahead of the first login"""
+    return True
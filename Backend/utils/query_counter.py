@@ -0,0 +1,75 @@
+# Backend/utils/query_counter.py
+# Per-request SQL statement counting, to keep N+1 query patterns from coming back.
+#
+# With SQL_QUERY_BUDGET=<n> set (load tests, CI), every response carries an
+# X-SQL-Queries header and a request that issues more than n statements fails
+# with a 500 listing what it ran. Scripts can use count_queries() directly:
+#
+#   with count_queries() as counter:
+#       client.get("/api/admin/user-stats", headers=headers)
+#   assert counter.count <= 3, counter.statements
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+
+# Max statements per request; 0 (the default) disables the middleware
+SQL_QUERY_BUDGET = int(os.getenv("SQL_QUERY_BUDGET", "0"))
+
+_MAX_RECORDED = 50  # Statements kept for the error report
+
+# The counter of the current request; async sessions run their SQL in greenlets
+# that share the caller's context, and run_in_threadpool copies it, so every
+# statement issued on behalf of a request lands here
+_current_counter = ContextVar("sql_query_counter", default=None)
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+        self.statements = []
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.count += 1
+        if len(counter.statements) < _MAX_RECORDED:
+            counter.statements.append(" ".join(statement.split()))
+
+
+def install(*engines):
+    """Count statements executed on these (sync) engines"""
+    for engine in engines:
+        if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+            event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@contextmanager
+def count_queries():
+    """Count the statements issued inside the block (engines must be install()ed)"""
+    counter = QueryCounter()
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+async def query_budget_middleware(request: Request, call_next):
+    """Fail requests that issue more than SQL_QUERY_BUDGET statements"""
+    with count_queries() as counter:
+        response = await call_next(request)
+    if counter.count > SQL_QUERY_BUDGET:
+        print(f"[WARN] {request.method} {request.url.path} issued {counter.count} SQL statements "
+              f"(budget {SQL_QUERY_BUDGET})")
+        return JSONResponse(status_code=500, content={
+            "detail": f"SQL query budget exceeded: {counter.count} > {SQL_QUERY_BUDGET}",
+            "statements": counter.statements,
+        }, headers={"X-SQL-Queries": str(counter.count)})
+    response.headers["X-SQL-Queries"] = str(counter.count)
+    return response
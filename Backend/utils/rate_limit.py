@@ -0,0 +1,55 @@
+# Backend/utils/rate_limit.py
+
+import threading
+import time
+from collections import deque
+
+
+class AttemptLimiter:
+    """Allow at most `max_attempts` failed attempts per `window` seconds for each key (sliding window)"""
+
+    def __init__(self, max_attempts: int, window: float, max_keys: int = 100000):
+        self.max_attempts = max_attempts
+        self.window = window
+        self.max_keys = max_keys
+        self.rejected = 0
+        self._attempts = {}  # key -> deque of attempt times
+        self._lock = threading.Lock()
+
+    def _recent(self, key, now, create: bool = False):
+        """Attempt times of `key` within the window (caller holds the lock)"""
+        attempts = self._attempts.get(key)
+        if attempts is None:
+            if not create:
+                return None
+            if len(self._attempts) >= self.max_keys:
+                self._attempts.pop(next(iter(self._attempts)))  # Drop the oldest key
+            attempts = self._attempts[key] = deque()
+        while attempts and attempts[0] <= now - self.window:
+            attempts.popleft()
+        return attempts
+
+    def check(self, key) -> float:
+        """0 when `key` may try again, else the seconds until it may"""
+        now = time.monotonic()
+        with self._lock:
+            attempts = self._recent(key, now)
+            if attempts is None or len(attempts) < self.max_attempts:
+                return 0
+            self.rejected += 1
+            return attempts[0] + self.window - now
+
+    def record(self, key):
+        """Count a failed attempt of `key`"""
+        now = time.monotonic()
+        with self._lock:
+            self._recent(key, now, create=True).append(now)
+
+    def reset(self, key):
+        with self._lock:
+            self._attempts.pop(key, None)
+
+    def snapshot(self):
+        with self._lock:
+            return {"max_attempts": self.max_attempts, "window": self.window,
+                    "tracked_keys": len(self._attempts), "rejected": self.rejected}
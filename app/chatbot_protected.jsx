@@ -292,7 +292,13 @@ export default function ChatbotProtected() {
                     }}
                   >
                     <Text style={styles.historySessionTitle}>{session.title || 'Untitled Chat'}</Text>
-                    <Text style={styles.historySessionDate}>{session.created_at ? new Date(session.created_at).toLocaleString() : ''}</Text>
+                    {session.last_message_preview ? (
+                      <Text style={styles.historySessionPreview} numberOfLines={1}>{session.last_message_preview}</Text>
+                    ) : null}
+                    <Text style={styles.historySessionDate}>
+                      {(session.last_message_at || session.created_at) ? new Date(session.last_message_at || session.created_at).toLocaleString() : ''}
+                      {session.message_count ? ` · ${session.message_count} messages` : ''}
+                    </Text>
                   </TouchableOpacity>
                 ))}
               </ScrollView>
@@ -438,6 +444,11 @@ const styles = StyleSheet.create({
     color: '#222',
     fontWeight: '600',
   },
+  historySessionPreview: {
+    fontSize: 13,
+    color: '#555',
+    marginTop: 2,
+  },
   historySessionDate: {
     fontSize: 12,
     color: '#888',
@@ -7,11 +7,22 @@ import { SafeAreaView, ScrollView, Text, View, StyleSheet, TouchableOpacity, Ima
 import { router } from 'expo-router';
 import AsyncStorage from '@react-native-async-storage/async-storage';
 
+// The API sends naive UTC datetimes: times are shown in the device's time zone,
+// dates (due dates, event days, stored as midnight UTC) as entered
+const formatDateTime = (value, withTime = true) => {
+  if (!value) return 'Not set';
+  const date = new Date(/[zZ]|[+-]\d\d:\d\d$/.test(value) ? value : `${value}Z`);
+  if (isNaN(date.getTime())) return value;
+  return withTime
+    ? date.toLocaleString([], { dateStyle: 'medium', timeStyle: 'short' })
+    : date.toLocaleDateString([], { timeZone: 'UTC' });
+};
 
 export default function EmployeeDashboard() {
   const [tasks, setTasks] = useState([]);
   const [events, setEvents] = useState([]);
   const [meetings, setMeetings] = useState([]);
+  const [nextMeeting, setNextMeeting] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [user, setUser] = useState({ name: '', email: '' });
@@ -22,15 +33,12 @@ export default function EmployeeDashboard() {
     setLoading(true);
     setError(null);
     try {
-      const [tasksData, eventsData, meetingsData] = await Promise.all([
-        EmployeeService.getTasks(),
-        EmployeeService.getEvents(),
-        EmployeeService.getMeetings()
-      ]);
-      setTasks(tasksData);
-      setEvents(eventsData);
-      setMeetings(meetingsData);
-      console.log('Fetched tasks:', tasksData);
+      const dashboard = await EmployeeService.getDashboard();
+      setTasks(dashboard.tasks);
+      setEvents(dashboard.events);
+      setMeetings(dashboard.meetings);
+      setNextMeeting(dashboard.next_meeting);
+      console.log('Fetched tasks:', dashboard.tasks);
     } catch (err) {
       setError('Failed to load dashboard data.');
     } finally {
@@ -61,9 +69,6 @@ export default function EmployeeDashboard() {
     return 'Good evening';
   };
 
-  // Next meeting highlight
-  const nextMeeting = meetings && meetings.length > 0 ? meetings[0] : null;
-
   // Filtered tasks for display (not completed & approved)
   const filteredTasks = tasks.filter(task => !(task.completed === 1 && task.pending_approval === 0));
   const totalTasks = filteredTasks.length;
@@ -109,7 +114,7 @@ export default function EmployeeDashboard() {
           <View style={styles.nextMeetingCard}>
             <Text style={styles.nextMeetingTitle}>Next Meeting</Text>
             <Text style={styles.nextMeetingName}>{nextMeeting.title}</Text>
-            <Text style={styles.nextMeetingTime}>Time: {nextMeeting.time}</Text>
+            <Text style={styles.nextMeetingTime}>Time: {formatDateTime(nextMeeting.time)}</Text>
           </View>
         )}
         {loading && <Text style={styles.loadingText}>Loading...</Text>}
@@ -136,7 +141,7 @@ export default function EmployeeDashboard() {
                     <View style={styles.taskIcon}><Text style={{ color: '#fff', fontWeight: 'bold' }}>✓</Text></View>
                     <View style={{ marginLeft: 10 }}>
                       <Text style={styles.cardTitle}>{task.title}</Text>
-                      <Text style={styles.cardSubtitle}>Due: {task.due}</Text>
+                      <Text style={styles.cardSubtitle}>Due: {formatDateTime(task.due, false)}</Text>
                     </View>
                   </View>
                   {(task.completed === 1 && task.pending_approval === 1) ? (
@@ -180,7 +185,7 @@ export default function EmployeeDashboard() {
                     <View style={styles.eventIcon}><Text style={{ color: '#fff', fontWeight: 'bold' }}>★</Text></View>
                     <View style={{ marginLeft: 10 }}>
                       <Text style={styles.cardTitle}>{event.title}</Text>
-                      <Text style={styles.cardSubtitle}>Date: {event.date}</Text>
+                      <Text style={styles.cardSubtitle}>Date: {formatDateTime(event.date, false)}</Text>
                     </View>
                   </View>
                   <TouchableOpacity
@@ -215,7 +220,7 @@ export default function EmployeeDashboard() {
                     <View style={styles.meetingIcon}><Text style={{ color: '#fff', fontWeight: 'bold' }}>⏰</Text></View>
                     <View style={{ marginLeft: 10 }}>
                       <Text style={styles.cardTitle}>{meeting.title}</Text>
-                      <Text style={styles.cardSubtitle}>Time: {meeting.time}</Text>
+                      <Text style={styles.cardSubtitle}>Time: {formatDateTime(meeting.time)}</Text>
                     </View>
                   </View>
                   <TouchableOpacity
@@ -227,6 +232,7 @@ export default function EmployeeDashboard() {
                         await EmployeeService.rsvpMeeting(meeting.id);
                         // Remove the meeting from the list immediately after RSVP
                         setMeetings(ms => ms.filter(m => m.id !== meeting.id));
+                        setNextMeeting(next => (next && next.id === meeting.id ? null : next));
                       } catch (e) {
                         setError('Failed to RSVP to meeting');
                       } finally {
@@ -2,6 +2,7 @@ import os
 import sys
 import time
 import re
+import math
 
 
 # Basic stopword list
@@ -462,6 +463,174 @@ def get_context(user_input: str) -> str:
     
     return result
 
+# Cache for extractive answering: document frequencies over knowledge sentences
+_IDF_CACHE = None
+_IDF_SOURCE = None
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+_TERM_PATTERN = re.compile(r"[a-z0-9]+")
+# Question filler words that carry no answer content
+_QUESTION_WORDS = {
+    "many", "much", "which", "where", "who", "why", "there", "have", "has",
+    "with", "my", "your", "we", "our", "for", "in", "at", "any", "big",
+    "this", "that", "get", "or", "from", "will", "would", "could", "should"
+}
+# What a question asks for, and what an answering sentence must contain: words
+# like "much" or "where" never occur in the answer, so they are left out of the
+# term coverage above and checked here instead
+_INTENTS = [
+    # Prices: "how much is the airport transfer", "what does parking cost"
+    (re.compile(r"\bhow much\b|\b(cost|costs|price|prices|fee|fees|rate|rates|charge|charges)\b"),
+     re.compile(r"\d|€|\$|\b(eur|euros?|mad|dirhams?|free|complimentary|included|no charge)\b")),
+    # Quantities
+    (re.compile(r"\bhow many\b"),
+     re.compile(r"\d|\b(one|two|three|four|five|six|seven|eight|nine|ten|twelve|dozen|hundred)\b")),
+    # Distances and durations
+    (re.compile(r"\bhow (far|long)\b"),
+     re.compile(r"\d|\b(minutes?|hours?|km|kilometers?|kilometres?|miles?|walk|walking|drive)\b")),
+    # Times and opening hours
+    (re.compile(r"\b(what time|when)\b|\bhours\b"),
+     re.compile(r"\d|\b(noon|midnight|daily|24/7|around the clock)\b")),
+    # Places
+    (re.compile(r"\bwhere\b"),
+     re.compile(r"\b(located|location|floor|level|lobby|wing|building|entrance|near|next to|opposite|beside|"
+                r"area|rooftop|ground|km|kilometers?)\b")),
+    # People to ask
+    (re.compile(r"\bwho\b"),
+     re.compile(r"\b(contact|concierge|desk|reception|staff|team|manager|call|dial|extension)\b")),
+]
+# "which restaurant ...": the sentence must name the kind of thing asked about
+_WHICH = re.compile(r"\bwhich\s+([a-z]+)")
+# Score kept by a sentence for each thing asked about that it does not contain
+_MISSING_ATTRIBUTE_PENALTY = 0.5
+# Retriever messages that are not knowledge and must never be extracted
+_FALLBACK_PREFIXES = (
+    "I couldn't find specific information",
+    "Knowledge base is unavailable",
+    "Welcome to Fairmont Tazi Palace Tangier. Please ask",
+)
+
+def _terms(text: str) -> list:
+    """Lowercase content terms with a light plural strip"""
+    terms = []
+    for word in _TERM_PATTERN.findall(text.lower()):
+        if word in STOPWORDS or word in _QUESTION_WORDS:
+            continue
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+def _split_sentences(text: str) -> list:
+    sentences = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line or line.startswith('###') or line.endswith(':'):
+            continue
+        line = re.sub(r'^(\d+\.|\*|-)\s*', '', line)
+        for sentence in _SENTENCE_SPLIT.split(line):
+            if len(sentence) >= 15:
+                sentences.append(sentence.strip())
+    return sentences
+
+def _get_idf() -> dict:
+    """Inverse document frequency of terms across knowledge sentences (cached)"""
+    global _IDF_CACHE, _IDF_SOURCE
+    knowledge = load_knowledge()
+    if _IDF_CACHE is None or _IDF_SOURCE is not knowledge:
+        sentences = _split_sentences(knowledge)
+        doc_freq = {}
+        for sentence in sentences:
+            for term in set(_terms(sentence)):
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+        total = max(len(sentences), 1)
+        _IDF_CACHE = {term: math.log(1 + total / df) for term, df in doc_freq.items()}
+        _IDF_CACHE[None] = math.log(1 + total)  # Weight of terms never seen
+        _IDF_SOURCE = knowledge
+    return _IDF_CACHE
+
+def _proximity(positions: dict) -> float:
+    """1.0 when matched terms are adjacent, lower as they spread over the sentence"""
+    if len(positions) < 2:
+        return 1.0
+    # Smallest window of token positions containing every matched term
+    events = sorted((pos, term) for term, plist in positions.items() for pos in plist)
+    needed = len(positions)
+    counts = {}
+    best = None
+    left = 0
+    for right, (pos, term) in enumerate(events):
+        counts[term] = counts.get(term, 0) + 1
+        while len(counts) == needed:
+            span = pos - events[left][0] + 1
+            best = span if best is None else min(best, span)
+            left_term = events[left][1]
+            counts[left_term] -= 1
+            if counts[left_term] == 0:
+                del counts[left_term]
+            left += 1
+    return min(1.0, needed / best)
+
+def _asked_attributes(user_input: str) -> list:
+    """Patterns an answer to `user_input` must match (price, time, place...)"""
+    question = user_input.lower()
+    attributes = [answer for asked, answer in _INTENTS if asked.search(question)]
+    for noun in _WHICH.findall(question):
+        terms = _terms(noun)
+        if terms:
+            attributes.append(re.compile(r"\b" + re.escape(terms[0])))
+    return attributes
+
+# Score sentences of the retrieved context against the query and return the best ones
+def extract_answer(user_input: str, context: str = None, max_sentences: int = 2):
+    """
+    Extractive answer from knowledge sentences, without calling the model.
+    Returns (answer, confidence) where confidence is in [0, 1]; answer is None
+    when nothing in the context covers the question. Sentences lacking what
+    the question asks for (a price for "how much", a time for "when"...) score
+    lower, so such questions go to the model instead.
+    """
+    start_time = time.time()
+    query_terms = set(_terms(user_input))
+    if len(query_terms) < 2:
+        # A single content word matches too many sentences to be trusted
+        return None, 0.0
+    if context is None:
+        context = get_context(user_input)
+    if not context or context.startswith(_FALLBACK_PREFIXES):
+        return None, 0.0
+
+    idf = _get_idf()
+    query_weight = sum(idf.get(t, idf[None]) for t in query_terms)
+    attributes = _asked_attributes(user_input)
+
+    scored = []
+    for sentence in _split_sentences(context):
+        positions = {}
+        for i, term in enumerate(_terms(sentence)):
+            if term in query_terms:
+                positions.setdefault(term, []).append(i)
+        if not positions:
+            continue
+        coverage = sum(idf.get(t, idf[None]) for t in positions) / query_weight
+        score = coverage * (0.7 + 0.3 * _proximity(positions))
+        # Mentioning the airport transfer does not answer "how much is it"
+        missing = sum(1 for attribute in attributes if not attribute.search(sentence.lower()))
+        score *= _MISSING_ATTRIBUTE_PENALTY ** missing
+        scored.append((score, sentence))
+
+    if not scored:
+        return None, 0.0
+    scored.sort(key=lambda item: item[0], reverse=True)
+    best_score, best_sentence = scored[0]
+    answer = [best_sentence]
+    # Add a runner-up that is nearly as relevant (e.g. the second half of an answer)
+    for score, sentence in scored[1:max_sentences]:
+        if score >= best_score * 0.85 and sentence not in answer:
+            answer.append(sentence)
+
+    print(f"[DEBUG] Extractive answer in {time.time() - start_time:.4f}s (confidence: {best_score:.2f})")
+    return " ".join(answer), round(best_score, 3)
+
 # CLI test
 if __name__ == "__main__":
     if len(sys.argv) > 1:
@@ -472,5 +641,8 @@ if __name__ == "__main__":
         print(f"Processing time: {end-start:.3f} seconds")
         print("\nRetrieved context:")
         print(context)
+        answer, confidence = extract_answer(user_message, context)
+        print(f"\nExtractive answer (confidence {confidence:.2f}):")
+        print(answer)
     else:
         print("No message provided.")
\ No newline at end of file
@@ -1,7 +1,21 @@
 import AsyncStorage from '@react-native-async-storage/async-storage';
 import { getApiUrl } from '../config';
 
+// Last dashboard response, revalidated with If-None-Match (the server answers 304 when unchanged)
+let dashboardCache = { etag: null, data: null };
+
 export const EmployeeService = {
+  async getDashboard() {
+    const token = await AsyncStorage.getItem('auth_token');
+    const headers = { 'Authorization': `Bearer ${token}` };
+    if (dashboardCache.etag) headers['If-None-Match'] = dashboardCache.etag;
+    const res = await fetch(getApiUrl('/api/employee/dashboard'), { headers });
+    if (res.status === 304 && dashboardCache.data) return dashboardCache.data;
+    if (!res.ok) throw new Error('Failed to fetch dashboard');
+    const data = await res.json();
+    dashboardCache = { etag: res.headers.get('ETag'), data };
+    return data;
+  },
   async getTasks() {
     const token = await AsyncStorage.getItem('auth_token');
     const res = await fetch(getApiUrl('/api/employee/tasks'), {
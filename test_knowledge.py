@@ -9,6 +9,11 @@ if project_root not in sys.path:
 
 from retriever import load_knowledge, get_context
 
+backend_dir = os.path.join(project_root, 'Backend')
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+from config.ollama_config import OLLAMA_HOSTS, OLLAMA_MODEL
+
 # Test if knowledge.txt is found
 knowledge = load_knowledge()
 print(f"\nKnowledge base loaded? {'Yes' if knowledge else 'No'}")
@@ -21,37 +26,39 @@ response = get_context(test_query)
 print(f"\nTest query: '{test_query}'")
 print(f"Response: {response[:200]}...")
 
-# Test Ollama connection
-print("\nTesting Ollama connection...")
-try:
-    # Check if Ollama is available
-    response = requests.get("http://localhost:11434/api/tags", timeout=2)
-    print(f"Ollama API status code: {response.status_code}")
-    if response.status_code == 200:
-        print("✅ Ollama is running and accessible")
-        models = response.json()
-        print(f"Available models: {models}")
-        
-        # Test a simple generation
-        print("\nTesting Ollama generation...")
-        payload = {
-            "model": "mistral",
-            "prompt": "What time is the spa open?",
-            "stream": False,
-            "options": {"temperature": 0.5}
-        }
-        gen_response = requests.post("http://localhost:11434/api/generate", json=payload, timeout=10)
-        print(f"Generate API status code: {gen_response.status_code}")
-        if gen_response.status_code == 200:
-            result = gen_response.json()
-            print("✅ Generation successful")
-            print(f"Response: {result.get('response', '')[:200]}...")
+# Test Ollama connection (every instance configured in OLLAMA_HOSTS)
+for host in OLLAMA_HOSTS:
+    base_url = host.partition("|")[0].rstrip("/")
+    print(f"\nTesting Ollama connection at {base_url}...")
+    try:
+        # Check if Ollama is available
+        response = requests.get(f"{base_url}/api/tags", timeout=2)
+        print(f"Ollama API status code: {response.status_code}")
+        if response.status_code == 200:
+            print("✅ Ollama is running and accessible")
+            models = response.json()
+            print(f"Available models: {models}")
+
+            # Test a simple generation
+            print("\nTesting Ollama generation...")
+            payload = {
+                "model": OLLAMA_MODEL,
+                "prompt": "What time is the spa open?",
+                "stream": False,
+                "options": {"temperature": 0.5}
+            }
+            gen_response = requests.post(f"{base_url}/api/generate", json=payload, timeout=10)
+            print(f"Generate API status code: {gen_response.status_code}")
+            if gen_response.status_code == 200:
+                result = gen_response.json()
+                print("✅ Generation successful")
+                print(f"Response: {result.get('response', '')[:200]}...")
+            else:
+                print(f"❌ Generation failed: {gen_response.text[:200]}")
         else:
-            print(f"❌ Generation failed: {gen_response.text[:200]}")
-    else:
-        print(f"❌ Ollama API responded with status code {response.status_code}")
-except Exception as e:
-    print(f"❌ Error connecting to Ollama: {str(e)}")
+            print(f"❌ Ollama API responded with status code {response.status_code}")
+    except Exception as e:
+        print(f"❌ Error connecting to Ollama: {str(e)}")
 
 # Check file paths
 print("\nChecking file paths:")